@@ -71,6 +71,17 @@ def _now_iso():
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(1024 * 1024)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
 def _safe_segment(value, fallback="item"):
     cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", str(value or "").strip())
     cleaned = cleaned.strip("._")
@@ -999,10 +1010,10 @@ class OutlookEmailIntakeManager:
                 if existing_checksum and existing_checksum == target_checksum:
                     return existing_pdf
                 try:
-                    existing_bytes = existing_pdf.read_bytes()
+                    existing_checksum = _sha256_file(existing_pdf) if existing_pdf.stat().st_size else ""
                 except Exception:
-                    existing_bytes = b""
-                if existing_bytes and hashlib.sha256(existing_bytes).hexdigest() == target_checksum:
+                    existing_checksum = ""
+                if existing_checksum and existing_checksum == target_checksum:
                     return existing_pdf
 
         return None
@@ -1241,7 +1252,7 @@ class OutlookEmailIntakeManager:
                     "rank_reason": rank_result["reason"],
                     "rank_evidence": rank_result.get("evidence", []),
                     "connected_account": connected_account,
-                    "pdf_checksum": hashlib.sha256(working_pdf_path.read_bytes()).hexdigest(),
+                    "pdf_checksum": _sha256_file(working_pdf_path),
                     "quality_state": quality_state,
                 }
 
@@ -136,6 +136,7 @@ def create_agent_app():
         return Scraper(
             normalized,
             otp_window_seconds=int(parser.get("Advanced", "otp_window_seconds", fallback="120")),
+            download_concurrency=int(parser.get("Advanced", "download_concurrency", fallback="2")),
             login_url=parser.get("Advanced", "seajob_login_url", fallback="http://seajob.net/seajob_login.php"),
             dashboard_url=parser.get("Advanced", "seajob_dashboard_url", fallback="http://seajob.net/company/dashboard.php"),
         )
@@ -36,10 +36,18 @@ class AppSettings:
     server_url: str
 
 
-def load_app_settings():
+def load_app_settings(config_obj=None):
+    """Build AppSettings from the config file, or from an already-parsed parser.
+
+    Callers that have just written ``config_obj`` to disk pass it in to skip
+    re-parsing the same file.
+    """
     config_path = os.getenv("NJORDHR_CONFIG_PATH", "config.ini")
-    parser = configparser.ConfigParser()
-    parser.read(config_path)
+    if config_obj is not None:
+        parser = config_obj
+    else:
+        parser = configparser.ConfigParser()
+        parser.read(config_path)
 
     if "Credentials" not in parser or "Settings" not in parser:
         raise RuntimeError(
@@ -1,37 +1,44 @@
 from flask import Flask, request, jsonify, send_from_directory, Response, send_file, redirect, has_request_context, session
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import atexit
 import configparser
-import csv
+import functools
 import hashlib
+import heapq
+import hmac
+import http.cookiejar
 import io
+import itertools
 import math
 import os
+import queue
 import re
 import sys
 import string
 import uuid
 import json
-import zipfile
 import logging
 import threading
 import secrets
-from datetime import UTC, date, datetime
-from queue import Queue, Empty
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote
+from urllib3.util.retry import Retry
 import sqlite3
 import time
 from pathlib import Path
 from werkzeug.security import generate_password_hash, check_password_hash
 
-# Dependency Check & Imports
+# Optional Dependencies
 try:
-    import PyPDF2
+    import orjson
 except ImportError:
-    print("\n--- FATAL ERROR --- \nPlease run: pip install PyPDF2\n")
-    sys.exit(1)
+    orjson = None
 
-from scraper_engine import Scraper
 from logger_config import setup_logger
 from resume_extractor import ResumeExtractor
 from app_settings import load_app_settings, FeatureFlags
@@ -40,7 +47,6 @@ from repositories.repo_factory import build_candidate_event_repo
 from repositories.search_scope_repo import SQLiteSearchScopeRepository
 from repositories.supabase_candidate_event_repo import resolve_supabase_api_key
 from runtime_env import config_value, normalize_env_value, normalized_url
-from ai_analyzer import Analyzer, engine_family_option_catalog, rank_option_catalog
 from candidate_facts.aliases.coc_issue_authority import load_coc_issue_authority_aliases, normalize_alias_key
 from candidate_facts.aliases.coc_country import load_coc_country_aliases
 from candidate_facts.present_rank_index import PresentRankIndex
@@ -54,8 +60,59 @@ from query_understanding.compound_prompt_normalizer_runtime import (
 from query_understanding.hard_filter_catalog import canonical_engine_family_values, canonical_ship_family_values
 from query_understanding.supabase_telemetry_store import SupabaseTelemetryStore
 
+# Datetimes/dataclasses keep going through the caller's default hook; numpy scalars
+# from pandas rows are encoded natively instead of failing in the stdlib encoder.
+# Int/bool/None keys are stringified the way json.dumps does, without a fallback.
+_ORJSON_OPTIONS = 0 if orjson is None else (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+)
+
+
 # --- App Initialization ---
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson when installed."""
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs.get("indent") is not None:
+            return super().dumps(obj, **kwargs)
+        option = _ORJSON_OPTIONS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode("utf-8")
+        except TypeError:
+            # Oversized ints, unsupported key types, etc. keep the stdlib behaviour.
+            return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if orjson is None or (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        option = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            # jsonify bodies go out as orjson's bytes, skipping the str decode/re-encode.
+            body = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # The stdlib parser also accepts NaN/Infinity literals; let it decide.
+            return super().loads(s, **kwargs)
+
+
 app = Flask(__name__)
+app.json = OrjsonJSONProvider(app)
 CORS(app) 
 app.secret_key = os.getenv("NJORDHR_FLASK_SECRET", "").strip() or secrets.token_hex(32)
 
@@ -68,30 +125,115 @@ feature_flags = app_settings.feature_flags
 
 # --- Global State ---
 scraper_session = None
+scraper_session_lock = threading.Lock()
 seajobs_last_activity_at = None
 ui_client_heartbeats = {}
+# (heartbeat time, client id) min-heap; entries superseded by a newer heartbeat are skipped lazily.
+ui_client_heartbeat_heap = []
+# Wakes the idle-shutdown monitor when the first client appears or a client disconnects.
+ui_client_event = threading.Event()
 ui_client_lock = threading.Lock()
 ui_client_seen_once = False
 auto_shutdown_started = False
 auto_shutdown_in_progress = False
 cloud_auth_state_cache = {"ts": 0, "mode": "local", "reason": "not_checked"}
+cloud_auth_state_lock = threading.Lock()
+# Cloud users rows, reused for _CLOUD_USERS_TTL_SECONDS and dropped on local user writes.
+cloud_users_cache = {"ts": 0, "endpoint": "", "rows": None}
+cloud_users_lock = threading.Lock()
 candidate_facts_repo = None
 present_rank_index = PresentRankIndex()
 present_rank_index_rebuild_lock = threading.Lock()
 supabase_telemetry_store = None
 
+# Selenium drives one Chrome instance; scraper jobs run off the request thread, one at a time.
+_SCRAPER_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="seajobs-scraper")
+_scraper_slot = threading.BoundedSemaphore(1)
+
+# Export ZIPs are written serially, but the PDF reads feeding them are prefetched in parallel.
+_EXPORT_READ_WORKERS = 8
+_EXPORT_READ_EXECUTOR = ThreadPoolExecutor(max_workers=_EXPORT_READ_WORKERS, thread_name_prefix="export-read")
+# Larger PDFs skip the prefetch and are streamed into the archive in 1 MiB pieces.
+_EXPORT_PREFETCH_MAX_BYTES = 16 * 1024 * 1024
+_EXPORT_COPY_CHUNK_BYTES = 1024 * 1024
+# Export download names only need to be distinct per process: seeded from the start time.
+_EXPORT_SEQ = itertools.count(int(time.time()))
+# /verify_resumes parses the next resumes here while the request thread uploads and logs.
+_VERIFY_EXTRACT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="verify-extract")
+
+
+def _build_pooled_http_session():
+    """Keep-alive HTTP session shared across requests; never stores cookies.
+
+    Idempotent requests are retried briefly on connection errors and 502/503/504;
+    POSTs are never retried.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504), raise_on_status=False),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    atexit.register(session.close)
+    return session
+
+
+# Agent proxy and Supabase REST calls are latency-bound round trips to a single host
+# each; pooled sessions avoid a TCP/TLS handshake per call.
+_AGENT_HTTP = _build_pooled_http_session()
+_SUPABASE_HTTP = _build_pooled_http_session()
+
 # --- Initialize Extractors ---
 resume_extractor = ResumeExtractor()
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
 
+# ai_analyzer pulls in PyMuPDF, Pillow and the Pinecone client, and scraper_engine pulls in
+# Selenium; both are imported on first use so workers that never analyze or scrape skip them.
+Analyzer = None
+
+
+def _ai_analyzer_module():
+    import ai_analyzer
+    return ai_analyzer
+
+
+def _analyzer_class():
+    global Analyzer
+    if Analyzer is None:
+        Analyzer = _ai_analyzer_module().Analyzer
+    return Analyzer
+
+
+def rank_option_catalog():
+    return _ai_analyzer_module().rank_option_catalog()
+
+
+def engine_family_option_catalog():
+    return _ai_analyzer_module().engine_family_option_catalog()
+
+
+_analyzer_wrapper = None
+
+
 def _build_analyzer():
+    global _analyzer_wrapper
+    analyzer_cls = _analyzer_class()
+    # Analyzer holds one AIResumeAnalyzer per process and reads its config only when that
+    # instance is created; while it is live the wrapper (and no config copy) is reused.
+    wrapper = _analyzer_wrapper
+    if isinstance(wrapper, analyzer_cls) and getattr(analyzer_cls, "_instance", None) is not None:
+        return wrapper
     analyzer_config = configparser.ConfigParser()
     analyzer_config.read_dict({section: dict(config[section]) for section in config.sections()})
     if not analyzer_config.has_section("Settings"):
         analyzer_config.add_section("Settings")
     analyzer_config.set("Settings", "Default_Download_Folder", _active_download_root())
-    return Analyzer(analyzer_config, feature_flags=feature_flags)
+    _analyzer_wrapper = analyzer_cls(analyzer_config, feature_flags=feature_flags)
+    return _analyzer_wrapper
 
 
 def _resolve_advanced_runtime_path(raw_path, fallback_name):
@@ -136,11 +278,14 @@ csv_manager = build_candidate_event_repo(
 search_scope_repo = _build_search_scope_repo()
 
 
+_TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
 def _env_bool(name, default=False):
     raw = os.getenv(name)
     if raw is None:
         return default
-    return str(raw).strip().lower() in {"1", "true", "yes", "on"}
+    return str(raw).strip().lower() in _TRUTHY_VALUES
 
 
 def _payload_bool(payload, key, default=False):
@@ -151,7 +296,7 @@ def _payload_bool(payload, key, default=False):
         return value
     if value is None:
         return default
-    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+    return str(value).strip().lower() in _TRUTHY_VALUES
 
 
 def _ai_search_request_fingerprint(
@@ -260,7 +405,7 @@ def _sse_error_response(message, *, error_code, detail=None):
         payload["detail"] = detail
 
     def generate():
-        yield f"data: {json.dumps(payload)}\n\n"
+        yield _sse_frame(payload)
 
     return Response(generate(), mimetype='text/event-stream')
 
@@ -415,10 +560,14 @@ def _positive_int_or_none(raw):
     return parsed if parsed > 0 else None
 
 
+_SHIP_FAMILY_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+
+
 def _normalize_ship_family_value(raw_value):
     normalized = str(raw_value or "").strip().lower()
-    normalized = re.sub(r"[^a-z0-9]+", " ", normalized)
-    return re.sub(r"\s+", " ", normalized).strip()
+    normalized = _SHIP_FAMILY_NON_ALNUM_RE.sub(" ", normalized)
+    return _WHITESPACE_RUN_RE.sub(" ", normalized).strip()
 
 
 def _normalize_experience_filter_item(value, *, value_key, allowed_values=None, normalize_value=None):
@@ -557,11 +706,14 @@ class AvailabilityFilterInvalid(ValueError):
 _AGE_BOUND_INVALID = object()
 
 
+_DIGITS_RE = re.compile(r"\d+")
+
+
 def _age_bound_or_none(raw, *, strict=False):
     if isinstance(raw, bool) or raw in (None, ""):
         return None
     text = str(raw).strip()
-    if not re.fullmatch(r"\d+", text):
+    if not _DIGITS_RE.fullmatch(text):
         if strict:
             raise AgeFilterInvalid(
                 "non_integer",
@@ -607,6 +759,9 @@ def _normalize_age_filter(value, *, strict=False):
     }
 
 
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
 def _availability_filter_date_or_none(raw, *, field, strict=False):
     if raw in (None, ""):
         return None
@@ -618,7 +773,7 @@ def _availability_filter_date_or_none(raw, *, field, strict=False):
             )
         return None
     text = raw.strip()
-    if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
+    if not _ISO_DATE_RE.fullmatch(text):
         if strict:
             raise AvailabilityFilterInvalid(
                 "invalid_date",
@@ -958,6 +1113,40 @@ def _json_default(value):
     return str(value)
 
 
+def _json_dumps(value, default=None):
+    """Encode an SSE/JSONL payload, preferring orjson and falling back to stdlib json."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=default, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    # Match orjson's compact output so frames do not grow on the fallback path.
+    return json.dumps(value, default=default, separators=(",", ":"))
+
+
+_SSE_KEEPALIVE = ": keepalive\n\n"
+# Idle streams only wake to send a keepalive; producers signal new data directly.
+_SSE_KEEPALIVE_INTERVAL_SECONDS = 15.0
+_AGENT_STREAM_CHUNK_BYTES = 16 * 1024
+_RESUME_UPLOAD_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def _sse_frame(payload, default=None):
+    """One server-sent event carrying payload as JSON."""
+    return f"data: {_json_dumps(payload, default=default)}\n\n"
+
+
+def _json_loads(text):
+    """Decode an SSE/JSONL payload, preferring orjson and falling back to stdlib json."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals are only accepted by the stdlib parser.
+            pass
+    return json.loads(text)
+
+
 def _cloud_api_runtime_summary():
     settings = load_cloud_api_settings()
     return cloud_api_settings_payload(settings)
@@ -1330,21 +1519,32 @@ def _candidate_facts_review_capture_callback(candidate_facts, capture_context):
         return {"success": False, "message": str(exc)}
 
 
-def _refresh_runtime_managers():
-    global app_settings, config, creds, settings, feature_flags, csv_manager, search_scope_repo, VERIFIED_RESUMES_DIR, candidate_facts_repo, present_rank_index, _COC_COUNTRY_ALIASES, _COC_ISSUE_AUTHORITY_ALIASES
-    app_settings = load_app_settings()
+def _refresh_runtime_managers(config_obj=None):
+    global app_settings, config, creds, settings, feature_flags, csv_manager, search_scope_repo, VERIFIED_RESUMES_DIR, candidate_facts_repo, present_rank_index, _COC_COUNTRY_ALIASES, _COC_ISSUE_AUTHORITY_ALIASES, _analyzer_wrapper
+    app_settings = load_app_settings(config_obj=config_obj)
     config = app_settings.config
     creds = app_settings.credentials
     settings = app_settings.settings
     feature_flags = app_settings.feature_flags
     _load_runtime_secrets_from_cloud()
+    _invalidate_cloud_users_cache()
     VERIFIED_RESUMES_DIR = _resolve_verified_resumes_dir()
     os.makedirs(VERIFIED_RESUMES_DIR, exist_ok=True)
+    try:
+        old_event_repo = csv_manager
+    except NameError:
+        old_event_repo = None
     csv_manager = build_candidate_event_repo(
         flags=feature_flags,
         base_folder=VERIFIED_RESUMES_DIR,
         server_url=app_settings.server_url
     )
+    if old_event_repo is not None:
+        # Flush the replaced repository's buffered writes and stop its write-behind thread.
+        try:
+            old_event_repo.close()
+        except Exception:
+            pass
     try:
         old_scope_repo = search_scope_repo
     except NameError:
@@ -1362,12 +1562,15 @@ def _refresh_runtime_managers():
         present_rank_index = PresentRankIndex()
     _COC_COUNTRY_ALIASES = None
     _COC_ISSUE_AUTHORITY_ALIASES = None
-    try:
-        Analyzer._COC_COUNTRY_ALIASES = None
-        Analyzer._COC_ISSUE_AUTHORITY_ALIASES = None
-        Analyzer._instance = None
-    except Exception:
-        pass
+    _analyzer_wrapper = None
+    loaded_analyzer = Analyzer or getattr(sys.modules.get("ai_analyzer"), "Analyzer", None)
+    if loaded_analyzer is not None:
+        try:
+            loaded_analyzer._COC_COUNTRY_ALIASES = None
+            loaded_analyzer._COC_ISSUE_AUTHORITY_ALIASES = None
+            loaded_analyzer._instance = None
+        except Exception:
+            pass
 
 
 def _advanced_value(name, fallback=""):
@@ -1377,7 +1580,7 @@ def _advanced_value(name, fallback=""):
 def _advanced_bool(name, fallback=False):
     raw = normalize_env_value(config.get("Advanced", name, fallback=""))
     if raw:
-        return raw.lower() in {"1", "true", "yes", "on"}
+        return raw.lower() in _TRUTHY_VALUES
     return bool(fallback)
 
 
@@ -1453,7 +1656,7 @@ def _supabase_runtime_config_get(supabase_url=None, supabase_key=None):
     if not endpoint:
         return None
     try:
-        resp = requests.get(
+        resp = _SUPABASE_HTTP.get(
             endpoint,
             params={"select": "key,value", "limit": 2000},
             headers=headers,
@@ -1461,7 +1664,7 @@ def _supabase_runtime_config_get(supabase_url=None, supabase_key=None):
         )
         if resp.status_code >= 400:
             return None
-        rows = resp.json() if resp.text else []
+        rows = _json_loads(resp.content) if resp.content else []
         out = {}
         for row in rows or []:
             key = str(row.get("key", "")).strip()
@@ -1476,27 +1679,20 @@ def _supabase_runtime_config_set(pairs, supabase_url=None, supabase_key=None):
     endpoint, headers = _supabase_runtime_config_endpoint(supabase_url=supabase_url, supabase_key=supabase_key)
     if not endpoint:
         raise RuntimeError("Supabase runtime config unavailable")
-    body = []
     now_iso = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-    for key, value in (pairs or {}).items():
-        if key is None:
-            continue
-        key_s = str(key).strip()
-        if not key_s:
-            continue
-        value_s = normalize_env_value(value)
-        body.append({
-            "key": key_s,
-            "value": value_s,
-            "updated_at": now_iso,
-        })
+    body = [
+        {"key": key_s, "value": normalize_env_value(value), "updated_at": now_iso}
+        for key, value in (pairs or {}).items()
+        if key is not None and (key_s := str(key).strip())
+    ]
     if not body:
         return
-    resp = requests.post(
+    # Encoded once here (orjson when available); headers already carry the JSON content type.
+    resp = _SUPABASE_HTTP.post(
         endpoint,
         params={"on_conflict": "key"},
         headers={**headers, "Prefer": "resolution=merge-duplicates,return=minimal"},
-        json=body,
+        data=_json_dumps(body).encode("utf-8"),
         timeout=12,
     )
     if resp.status_code >= 400:
@@ -1537,6 +1733,7 @@ def _int_setting(section, key, fallback):
         return int(fallback)
 
 
+@functools.lru_cache(maxsize=64)
 def _resolve_runtime_path(raw_path, fallback_name):
     candidate = str(raw_path or "").strip()
     if not candidate:
@@ -1641,24 +1838,31 @@ def _rank_manifest_data(rank_folder):
         return {}
 
 
+def _folder_has_rank_content(folder_path):
+    """True once a manifest or PDF turns up; stops reading the folder at the first hit."""
+    with os.scandir(folder_path) as children:
+        for child in children:
+            name = child.name
+            if name == "manifest.json" or name.lower().endswith(".pdf"):
+                return True
+    return False
+
+
 def _list_visible_rank_folders(base_folder):
     try:
         names = []
-        for entry in os.listdir(base_folder):
-            if not entry or entry.startswith("."):
-                continue
-            full_path = os.path.join(base_folder, entry)
-            if not os.path.isdir(full_path):
-                continue
-            try:
-                child_names = os.listdir(full_path)
-            except Exception:
-                continue
-            has_manifest = "manifest.json" in child_names
-            has_pdf = any(str(name).lower().endswith(".pdf") for name in child_names)
-            if not has_manifest and not has_pdf:
-                continue
-            names.append(entry)
+        with os.scandir(base_folder) as entries:
+            for entry in entries:
+                if not entry.name or entry.name.startswith("."):
+                    continue
+                if not entry.is_dir():
+                    continue
+                try:
+                    if not _folder_has_rank_content(entry.path):
+                        continue
+                except Exception:
+                    continue
+                names.append(entry.name)
         return sorted(names)
     except Exception:
         return []
@@ -1703,11 +1907,11 @@ def _download_root_catalog_record(base_folder=None):
     }
 
 
-def _rank_folder_catalog_record(base_folder, folder):
+def _rank_folder_catalog_record(base_folder, folder, root_record=None):
     folder = str(folder or "").strip()
     if not folder or not _is_safe_name(folder):
         return None
-    root_record = _download_root_catalog_record(base_folder)
+    root_record = root_record or _download_root_catalog_record(base_folder)
     if not root_record:
         return None
     try:
@@ -1737,9 +1941,12 @@ def _rank_folder_catalog(base_folder=None):
     root_path = str(base_folder or _active_download_root() or "").strip()
     if not root_path or not os.path.isdir(root_path):
         return []
+    root_record = _download_root_catalog_record(root_path)
+    if not root_record:
+        return []
     records = []
     for folder in _list_assignable_rank_folders(root_path):
-        record = _rank_folder_catalog_record(root_path, folder)
+        record = _rank_folder_catalog_record(root_path, folder, root_record)
         if record:
             records.append(record)
     return records
@@ -1799,16 +2006,36 @@ def _resolve_rank_folder_reference(*, rank_folder_id="", rank_folder="", base_fo
     }
 
 
+@functools.lru_cache(maxsize=16)
+def _split_option_lines(raw_value):
+    return tuple(line.strip() for line in raw_value.split('\n') if line.strip())
+
+
 def _configured_rank_options():
-    ranks_str = config.get('Ranks', 'rank_options', fallback='').strip()
-    return [rank.strip() for rank in ranks_str.split('\n') if rank.strip()]
+    return list(_split_option_lines(config.get('Ranks', 'rank_options', fallback='').strip()))
+
+
+def _configured_ship_type_options():
+    return list(_split_option_lines(config.get('ShipTypes', 'ship_type_options', fallback='').strip()))
+
+
+def _attach_configured_search_options(login_result):
+    """Add the configured rank and ship type dropdown options to an OTP login result."""
+    login_result["ranks"] = _configured_rank_options()
+    login_result["ship_types"] = _configured_ship_type_options()
+
+
+@functools.lru_cache(maxsize=16)
+def _absolute_download_folder(raw_folder):
+    # Keyed by the raw setting, so a changed folder is simply a new entry.
+    return os.path.abspath(os.path.expanduser(raw_folder))
 
 
 def _configured_download_root():
     configured = str(settings.get('Default_Download_Folder', '')).strip()
     if not configured:
         return ""
-    return os.path.abspath(os.path.expanduser(configured))
+    return _absolute_download_folder(configured)
 
 
 def _active_download_root():
@@ -1820,7 +2047,7 @@ def _active_download_root():
                 agent_settings = payload.get("settings") if isinstance(payload, dict) else {}
                 candidate = str((agent_settings or {}).get("download_folder", "")).strip()
                 if candidate:
-                    resolved = os.path.abspath(os.path.expanduser(candidate))
+                    resolved = _absolute_download_folder(candidate)
                     if os.path.isdir(resolved):
                         return resolved
         except Exception:
@@ -1845,14 +2072,34 @@ def _ui_heartbeat_ttl_seconds():
     return max(15, _ui_idle_shutdown_seconds())
 
 
+def _prune_ui_heartbeat_heap_locked(now, ttl):
+    """Drop expired and superseded heap entries; caller holds ui_client_lock."""
+    # Only heartbeats older than the TTL are popped; the live ones are never visited.
+    while ui_client_heartbeat_heap and (now - ui_client_heartbeat_heap[0][0]) > ttl:
+        ts, cid = heapq.heappop(ui_client_heartbeat_heap)
+        if ui_client_heartbeats.get(cid) == ts:
+            del ui_client_heartbeats[cid]
+    # Repeat heartbeats and dropped clients leave superseded entries behind; rebuild
+    # from the live map once they outnumber the entries still in use.
+    if len(ui_client_heartbeat_heap) > 2 * len(ui_client_heartbeats):
+        ui_client_heartbeat_heap[:] = [(ts, cid) for cid, ts in ui_client_heartbeats.items()]
+        heapq.heapify(ui_client_heartbeat_heap)
+
+
 def _record_ui_heartbeat(client_id):
     global ui_client_seen_once
     cid = str(client_id or "").strip()
     if not cid:
         return
+    now = time.time()
     with ui_client_lock:
-        ui_client_heartbeats[cid] = time.time()
+        ui_client_heartbeats[cid] = now
+        heapq.heappush(ui_client_heartbeat_heap, (now, cid))
+        _prune_ui_heartbeat_heap_locked(now, _ui_heartbeat_ttl_seconds())
+        first_client = not ui_client_seen_once
         ui_client_seen_once = True
+    if first_client:
+        ui_client_event.set()
 
 
 def _drop_ui_client(client_id):
@@ -1861,18 +2108,29 @@ def _drop_ui_client(client_id):
         return
     with ui_client_lock:
         ui_client_heartbeats.pop(cid, None)
+        _prune_ui_heartbeat_heap_locked(time.time(), _ui_heartbeat_ttl_seconds())
+    ui_client_event.set()
 
 
 def _active_ui_client_count():
     now = time.time()
     ttl = _ui_heartbeat_ttl_seconds()
     with ui_client_lock:
-        stale = [cid for cid, ts in ui_client_heartbeats.items() if (now - ts) > ttl]
-        for cid in stale:
-            ui_client_heartbeats.pop(cid, None)
+        _prune_ui_heartbeat_heap_locked(now, ttl)
         return len(ui_client_heartbeats)
 
 
+def _ui_idle_monitor_wait_seconds():
+    """Seconds until the oldest tracked heartbeat goes stale (None when none are tracked)."""
+    ttl = _ui_heartbeat_ttl_seconds()
+    with ui_client_lock:
+        if not ui_client_heartbeat_heap:
+            return None
+        oldest = ui_client_heartbeat_heap[0][0]
+    # Expiry is strictly "older than ttl", so wake just past the boundary.
+    return max(0.0, oldest + ttl - time.time()) + 1.0
+
+
 def _start_ui_idle_shutdown_monitor():
     global auto_shutdown_started, auto_shutdown_in_progress
     if auto_shutdown_started or not _ui_idle_autoshutdown_enabled():
@@ -1885,12 +2143,17 @@ def _start_ui_idle_shutdown_monitor():
         # Wait for UI to initialize/open.
         time.sleep(15)
         while True:
-            time.sleep(5)
+            # Cleared before checking, so a connect/disconnect after the check still wakes the wait.
+            ui_client_event.clear()
             if auto_shutdown_in_progress:
                 return
             if not ui_client_seen_once:
+                ui_client_event.wait()
                 continue
             if _active_ui_client_count() > 0:
+                # New heartbeats only extend client lifetimes, so nothing can go idle before
+                # the oldest heartbeat expires unless a client disconnects explicitly.
+                ui_client_event.wait(_ui_idle_monitor_wait_seconds())
                 continue
             auto_shutdown_in_progress = True
             print(f"[AUTOSHUTDOWN] No active UI clients for {idle_seconds}s. Stopping services.")
@@ -1900,6 +2163,7 @@ def _start_ui_idle_shutdown_monitor():
                     _agent_request("POST", "/shutdown", timeout=10)
                 except Exception:
                     pass
+            _flush_usage_log()
             os._exit(0)
 
     t = threading.Thread(target=_worker, daemon=True, name="njordhr-ui-idle-shutdown")
@@ -1926,15 +2190,21 @@ def _current_seajobs_idle_seconds():
     return max(0, int(time.time() - seajobs_last_activity_at))
 
 
-def _disconnect_seajobs_best_effort():
+def _swap_scraper_session(new_session=None):
+    """Install ``new_session`` as the active scraper and quit the one it replaces."""
     global scraper_session
+    with scraper_session_lock:
+        previous, scraper_session = scraper_session, new_session
+    if previous is not None and previous is not new_session:
+        previous.quit()
+
+
+def _disconnect_seajobs_best_effort():
     try:
         if _use_local_agent():
             _agent_request("POST", "/session/disconnect", timeout=20)
         else:
-            if scraper_session:
-                scraper_session.quit()
-            scraper_session = None
+            _swap_scraper_session()
     except Exception:
         return False
     finally:
@@ -1942,6 +2212,24 @@ def _disconnect_seajobs_best_effort():
     return True
 
 
+def _submit_scraper_job(fn, *args):
+    """Queue fn on the scraper executor; returns None while another scraper job is running."""
+    if not _scraper_slot.acquire(blocking=False):
+        return None
+
+    def run():
+        try:
+            return fn(*args)
+        finally:
+            _scraper_slot.release()
+
+    try:
+        return _SCRAPER_EXECUTOR.submit(run)
+    except Exception:
+        _scraper_slot.release()
+        raise
+
+
 def _enforce_seajobs_idle_timeout():
     timeout_seconds = _seajobs_idle_timeout_seconds()
     if timeout_seconds <= 0:
@@ -1971,38 +2259,41 @@ def _admin_token():
     return ""
 
 
+# Matched against the upper-cased value: exact template words, or template prefixes.
+_PLACEHOLDER_PASSWORD_MATCH = re.compile(r"(?:PASSWORD|ADMIN|REPLACE_ME)\Z|CHANGE_ME|YOUR_").match
+_USERNAME_RE = re.compile(r"^[A-Za-z0-9._-]{3,64}$")
+
+
 def _is_placeholder_password(value):
     raw = str(value or "").strip()
     if not raw:
         return True
-    upper = raw.upper()
-    if upper in {"CHANGE_ME", "PASSWORD", "ADMIN", "REPLACE_ME"}:
-        return True
-    if upper.startswith("CHANGE_ME") or upper.startswith("YOUR_"):
+    if _PLACEHOLDER_PASSWORD_MATCH(raw.upper()):
         return True
     if "<" in raw or ">" in raw:
         return True
-    if "replace-with-" in raw.lower():
-        return True
-    return False
+    return "replace-with-" in raw.lower()
+
+
+# Built-in accounts: (role, [Auth] username key, username env, [Auth] password key, password env).
+# Each username defaults to the role name.
+_LOCAL_ROLE_ACCOUNTS = (
+    ("admin", "admin_username", "NJORDHR_ADMIN_USERNAME", "admin_password", "NJORDHR_ADMIN_PASSWORD"),
+    ("manager", "manager_username", "NJORDHR_MANAGER_USERNAME", "manager_password", "NJORDHR_MANAGER_PASSWORD"),
+    ("recruiter", "recruiter_username", "NJORDHR_RECRUITER_USERNAME", "recruiter_password", "NJORDHR_RECRUITER_PASSWORD"),
+)
 
 
 def _auth_user_list_local(include_placeholder_passwords=False):
     auth_cfg = config["Auth"] if "Auth" in config else {}
-    admin_username = auth_cfg.get("admin_username", "").strip() or os.getenv("NJORDHR_ADMIN_USERNAME", "admin").strip() or "admin"
-    admin_password = auth_cfg.get("admin_password", "").strip() or os.getenv("NJORDHR_ADMIN_PASSWORD", "").strip() or _admin_token()
-    manager_username = auth_cfg.get("manager_username", "").strip() or os.getenv("NJORDHR_MANAGER_USERNAME", "manager").strip() or "manager"
-    manager_password = auth_cfg.get("manager_password", "").strip() or os.getenv("NJORDHR_MANAGER_PASSWORD", "").strip()
-    recruiter_username = auth_cfg.get("recruiter_username", "").strip() or os.getenv("NJORDHR_RECRUITER_USERNAME", "recruiter").strip() or "recruiter"
-    recruiter_password = auth_cfg.get("recruiter_password", "").strip() or os.getenv("NJORDHR_RECRUITER_PASSWORD", "").strip()
-
     users = {}
-    if admin_password and (include_placeholder_passwords or not _is_placeholder_password(admin_password)):
-        users[admin_username] = {"role": "admin", "password": admin_password}
-    if manager_password and (include_placeholder_passwords or not _is_placeholder_password(manager_password)):
-        users[manager_username] = {"role": "manager", "password": manager_password}
-    if recruiter_password and (include_placeholder_passwords or not _is_placeholder_password(recruiter_password)):
-        users[recruiter_username] = {"role": "recruiter", "password": recruiter_password}
+    for role, username_key, username_env, password_key, password_env in _LOCAL_ROLE_ACCOUNTS:
+        username = auth_cfg.get(username_key, "").strip() or os.getenv(username_env, role).strip() or role
+        password = auth_cfg.get(password_key, "").strip() or os.getenv(password_env, "").strip()
+        if not password and role == "admin":
+            password = _admin_token()
+        if password and (include_placeholder_passwords or not _is_placeholder_password(password)):
+            users[username] = {"role": role, "password": password}
 
     if "Users" in config:
         for username, packed in config["Users"].items():
@@ -2079,7 +2370,7 @@ def _supabase_users_request(method="GET", params=None, json_body=None, timeout=1
     endpoint, headers = _supabase_auth_endpoint()
     if not endpoint:
         raise RuntimeError("Supabase auth config missing")
-    resp = requests.request(
+    resp = _SUPABASE_HTTP.request(
         method=method,
         url=endpoint,
         headers=headers,
@@ -2098,11 +2389,19 @@ def _supabase_users_request(method="GET", params=None, json_body=None, timeout=1
 
 
 def _cloud_auth_state(force_refresh=False):
-    now = time.time()
     ttl = 20
-    if not force_refresh and (now - cloud_auth_state_cache.get("ts", 0)) < ttl:
+    if not force_refresh and (time.time() - cloud_auth_state_cache.get("ts", 0)) < ttl:
         return dict(cloud_auth_state_cache)
 
+    with cloud_auth_state_lock:
+        # Another request may have refreshed while this one waited for the lock.
+        now = time.time()
+        if not force_refresh and (now - cloud_auth_state_cache.get("ts", 0)) < ttl:
+            return dict(cloud_auth_state_cache)
+        return _refresh_cloud_auth_state(now)
+
+
+def _refresh_cloud_auth_state(now):
     mode = "local"
     reason = "forced_local"
     pref = _auth_mode_preference()
@@ -2133,12 +2432,41 @@ def _auth_mode():
     return mode
 
 
+_CLOUD_USERS_TTL_SECONDS = 15
+
+
+def _cloud_user_rows():
+    endpoint, _headers = _supabase_auth_endpoint()
+    with cloud_users_lock:
+        # Fetching under the lock makes concurrent misses share a single request.
+        cached = cloud_users_cache["rows"]
+        if (
+            cached is not None
+            and cloud_users_cache["endpoint"] == endpoint
+            and (time.time() - cloud_users_cache["ts"]) < _CLOUD_USERS_TTL_SECONDS
+        ):
+            return cached
+        # Inactive and hashless rows can never log in, so the server leaves them out.
+        rows = _supabase_users_request(
+            method="GET",
+            params={
+                "select": "id,username,password_hash,role,is_active,email",
+                "is_active": "is.true",
+                "password_hash": "not.is.null",
+            },
+            timeout=12,
+        ) or []
+        cloud_users_cache.update({"ts": time.time(), "endpoint": endpoint, "rows": rows})
+        return rows
+
+
+def _invalidate_cloud_users_cache():
+    with cloud_users_lock:
+        cloud_users_cache.update({"ts": 0, "endpoint": "", "rows": None})
+
+
 def _auth_user_list_cloud(include_placeholder_passwords=False):
-    rows = _supabase_users_request(
-        method="GET",
-        params={"select": "id,username,password_hash,role,is_active,email"},
-        timeout=12,
-    )
+    rows = _cloud_user_rows()
     users = {}
     for row in rows or []:
         username = str(row.get("username", "")).strip()
@@ -2174,7 +2502,7 @@ def _auth_verify_user(username, password):
         if stored_hash and _check_password(stored_hash, password):
             return {"username": username, "role": record.get("role", ""), "id": record.get("id")}
         return None
-    if password == str(record.get("password", "")):
+    if _secret_matches(str(password or ""), str(record.get("password", ""))):
         return {"username": username, "role": record.get("role", "")}
     return None
 
@@ -2191,37 +2519,39 @@ def _auth_upsert_user(username, role, password):
             "is_active": True,
             "updated_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
         }]
-        _supabase_users_request(
-            method="POST",
-            params={"on_conflict": "username"},
-            json_body=body,
-            timeout=12,
-        )
+        try:
+            _supabase_users_request(
+                method="POST",
+                params={"on_conflict": "username"},
+                json_body=body,
+                timeout=12,
+            )
+        finally:
+            _invalidate_cloud_users_cache()
         return True
 
     if "Users" not in config:
         config["Users"] = {}
     _config_set_literal(config, "Users", username, f"{role}|{password}")
-    config_path = os.getenv("NJORDHR_CONFIG_PATH", "config.ini")
-    with open(config_path, "w", encoding="utf-8") as fh:
-        config.write(fh)
+    _write_config_file(config)
     return True
 
 
 def _auth_delete_user(username):
     if _auth_mode() == "cloud":
-        _supabase_users_request(
-            method="DELETE",
-            params={"username": f"eq.{username}"},
-            timeout=12,
-        )
+        try:
+            _supabase_users_request(
+                method="DELETE",
+                params={"username": f"eq.{username}"},
+                timeout=12,
+            )
+        finally:
+            _invalidate_cloud_users_cache()
         return True
     if "Users" not in config or username not in config["Users"]:
         return False
     config.remove_option("Users", username)
-    config_path = os.getenv("NJORDHR_CONFIG_PATH", "config.ini")
-    with open(config_path, "w", encoding="utf-8") as fh:
-        config.write(fh)
+    _write_config_file(config)
     return True
 
 
@@ -2277,11 +2607,12 @@ def _bootstrap_status():
     }
 
 
+# An empty remote address (no socket peer, e.g. in-process test clients) counts as local.
+_LOCAL_REMOTE_ADDRS = frozenset({"", "127.0.0.1", "::1", "::ffff:127.0.0.1", "localhost"})
+
+
 def _is_local_request():
-    remote = str(request.remote_addr or "").strip()
-    if not remote:
-        return True
-    return remote in {"127.0.0.1", "::1", "::ffff:127.0.0.1", "localhost"}
+    return str(request.remote_addr or "").strip() in _LOCAL_REMOTE_ADDRS
 
 
 def _session_role():
@@ -2493,13 +2824,18 @@ def _safe_recovery_scalar_mapping(value, allowed_keys):
     return result
 
 
+_RECOVERY_OPAQUE_ID_RE = re.compile(r"[A-Za-z0-9_.:-]{1,128}")
+_RECOVERY_CODE_RE = re.compile(r"[A-Za-z0-9_.:-]+")
+_RECOVERY_TAB_ID_RE = re.compile(r"^[A-Za-z0-9._-]{8,128}$")
+
+
 def _safe_recovery_search_context_string(value, *, safe_name=False, opaque_id=False):
     if not isinstance(value, str):
         return ""
     item = value.strip()[:256]
     if safe_name and item and not _is_safe_name(item):
         return ""
-    if opaque_id and item and not re.fullmatch(r"[A-Za-z0-9_.:-]{1,128}", item):
+    if opaque_id and item and not _RECOVERY_OPAQUE_ID_RE.fullmatch(item):
         return ""
     return item
 
@@ -2543,7 +2879,7 @@ def _sanitize_recovery_machine_codes(values, *, limit, max_length):
         if not isinstance(value, str):
             continue
         code = value.strip()[:max_length]
-        if code and re.fullmatch(r"[A-Za-z0-9_.:-]+", code):
+        if code and _RECOVERY_CODE_RE.fullmatch(code):
             sanitized.append(code)
         if len(sanitized) >= limit:
             break
@@ -2744,6 +3080,13 @@ def _require_role(*allowed_roles):
     return True, ""
 
 
+def _secret_matches(provided, expected):
+    """Constant-time comparison of a presented secret with the configured one."""
+    if not provided or not expected:
+        return False
+    return hmac.compare_digest(provided.encode("utf-8"), expected.encode("utf-8"))
+
+
 def _require_admin():
     ok, reason = _require_role("admin")
     if ok:
@@ -2754,10 +3097,12 @@ def _require_admin():
     if not token:
         return False, "Admin token not configured. Set NJORDHR_ADMIN_TOKEN or [Advanced].admin_token."
     request_token = request.headers.get("X-Admin-Token", "").strip()
-    if not request_token:
-        body = request.json if request.is_json else {}
-        request_token = str((body or {}).get("admin_token", "")).strip()
-    if request_token != token:
+    if not request_token and request.is_json:
+        # get_json caches the parsed body, so the route's own request.json reuses it.
+        body = request.get_json()
+        if isinstance(body, dict):
+            request_token = str(body.get("admin_token", "")).strip()
+    if not _secret_matches(request_token, token):
         return False, "Unauthorized admin token."
     return True, ""
 
@@ -2785,7 +3130,7 @@ def _require_agent_ingest_auth():
     if auth.lower().startswith("bearer "):
         bearer = auth.split(" ", 1)[1].strip()
     device_token = request.headers.get("X-Device-Token", "").strip()
-    if bearer == expected or device_token == expected:
+    if _secret_matches(bearer, expected) or _secret_matches(device_token, expected):
         return True, ""
     return False, "Unauthorized agent token."
 
@@ -2804,59 +3149,143 @@ def _config_set_literal(parser, section, key, value):
     parser.set(section, key, str(value).replace('%', '%%'))
 
 
+_config_write_lock = threading.Lock()
+
+
+def _write_config_file(parser, config_path=None):
+    """Persist ``parser`` via a temp file and os.replace so readers never see a partial file."""
+    config_path = config_path or os.getenv("NJORDHR_CONFIG_PATH", "config.ini")
+    temp_path = f"{config_path}.tmp"
+    with _config_write_lock:
+        with open(temp_path, "w", encoding="utf-8") as fh:
+            parser.write(fh)
+        os.replace(temp_path, config_path)
+
+
+def _write_config_text(text, config_path=None):
+    """Restore raw config.ini text through the same temp file + os.replace path."""
+    config_path = config_path or os.getenv("NJORDHR_CONFIG_PATH", "config.ini")
+    temp_path = f"{config_path}.tmp"
+    with _config_write_lock:
+        with open(temp_path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(temp_path, config_path)
+
+
 def _agent_sync_db_path():
     base = _resolve_runtime_path(_advanced_value("log_dir", "logs"), "logs")
     os.makedirs(base, exist_ok=True)
     return os.path.join(base, "agent_sync_ingest.sqlite3")
 
 
-def _ensure_agent_sync_db():
+_agent_sync_lock = threading.Lock()
+# One shared connection for the ingest DB, reopened only when log_dir moves it.
+_agent_sync_conn = {"path": None, "conn": None}
+# Fixed SQL text, so the shared connection's statement cache compiles each query once.
+_INGEST_IDEMPOTENCY_SEEN_SQL = "SELECT 1 FROM ingest_idempotency WHERE idempotency_key = ?"
+_INGEST_IDEMPOTENCY_STORE_SQL = (
+    "INSERT OR IGNORE INTO ingest_idempotency(idempotency_key, endpoint, created_at) VALUES (?, ?, ?)"
+)
+_INGEST_IDEMPOTENCY_PRUNE_SQL = "DELETE FROM ingest_idempotency WHERE created_at < ?"
+# Keys only guard against agent resends, so old ones are pruned on the first store after
+# start-up and every _INGEST_IDEMPOTENCY_PRUNE_EVERY stores after that.
+_INGEST_IDEMPOTENCY_RETENTION = timedelta(days=90)
+_INGEST_IDEMPOTENCY_PRUNE_EVERY = 1024
+_ingest_idempotency_stores = itertools.count()
+
+
+def _open_agent_sync_conn(db_path):
+    """Open the ingest DB in WAL mode so idempotency reads do not block on writers."""
+    conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL commits stay durable across app crashes; NORMAL only skips the per-commit fsync.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # A pure key lookup table: WITHOUT ROWID stores rows in the primary-key B-tree itself.
+    # Databases created before this keep their rowid table, which behaves the same.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ingest_idempotency (
+            idempotency_key TEXT PRIMARY KEY,
+            endpoint TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ingest_idempotency_created_at ON ingest_idempotency(created_at)"
+    )
+    conn.commit()
+    return conn
+
+
+def _agent_sync_connection():
+    """Shared ingest DB connection; callers must hold _agent_sync_lock."""
     db_path = _agent_sync_db_path()
-    conn = sqlite3.connect(db_path, timeout=10)
-    try:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS ingest_idempotency (
-                idempotency_key TEXT PRIMARY KEY,
-                endpoint TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-            """
-        )
-        conn.commit()
-    finally:
-        conn.close()
-    return db_path
+    conn = _agent_sync_conn["conn"]
+    if conn is None or _agent_sync_conn["path"] != db_path:
+        if conn is not None:
+            conn.close()
+        _agent_sync_conn["conn"] = None
+        conn = _open_agent_sync_conn(db_path)
+        _agent_sync_conn["path"] = db_path
+        _agent_sync_conn["conn"] = conn
+    return conn
+
+
+def _close_agent_sync_connection():
+    with _agent_sync_lock:
+        conn = _agent_sync_conn["conn"]
+        _agent_sync_conn["path"] = None
+        _agent_sync_conn["conn"] = None
+    if conn is not None:
+        try:
+            conn.execute("PRAGMA optimize")
+        finally:
+            conn.close()
+
+
+atexit.register(_close_agent_sync_connection)
 
 
 def _ingest_seen_idempotency(key):
     if not key:
         return False
-    db_path = _ensure_agent_sync_db()
-    conn = sqlite3.connect(db_path, timeout=10)
-    try:
-        row = conn.execute(
-            "SELECT 1 FROM ingest_idempotency WHERE idempotency_key = ?",
-            (key,),
-        ).fetchone()
-        return bool(row)
-    finally:
-        conn.close()
+    with _agent_sync_lock:
+        row = _agent_sync_connection().execute(_INGEST_IDEMPOTENCY_SEEN_SQL, (key,)).fetchone()
+    return bool(row)
 
 
 def _ingest_store_idempotency(key, endpoint):
     if not key:
         return
-    db_path = _ensure_agent_sync_db()
-    conn = sqlite3.connect(db_path, timeout=10)
-    try:
+    with _agent_sync_lock:
+        conn = _agent_sync_connection()
+        now = datetime.now(UTC)
         conn.execute(
-            "INSERT OR IGNORE INTO ingest_idempotency(idempotency_key, endpoint, created_at) VALUES (?, ?, ?)",
-            (key, endpoint, datetime.now(UTC).isoformat().replace("+00:00", "Z")),
+            _INGEST_IDEMPOTENCY_STORE_SQL,
+            (key, endpoint, now.isoformat().replace("+00:00", "Z")),
         )
+        if next(_ingest_idempotency_stores) % _INGEST_IDEMPOTENCY_PRUNE_EVERY == 0:
+            cutoff = now - _INGEST_IDEMPOTENCY_RETENTION
+            conn.execute(_INGEST_IDEMPOTENCY_PRUNE_SQL, (cutoff.isoformat().replace("+00:00", "Z"),))
         conn.commit()
-    finally:
-        conn.close()
+
+
+# (epoch second, ISO string) for append-only log rows; swapped as one tuple so
+# readers never see a mismatched pair.
+_log_timestamp_cache = (None, "")
+
+
+def _log_timestamp():
+    """Current UTC time as an ISO-8601 'Z' string at one-second resolution."""
+    global _log_timestamp_cache
+    now = int(time.time())
+    cached_second, cached_value = _log_timestamp_cache
+    if cached_second == now:
+        return cached_value
+    value = datetime.fromtimestamp(now, UTC).isoformat().replace("+00:00", "Z")
+    _log_timestamp_cache = (now, value)
+    return value
 
 
 def _append_agent_sync_jsonl(kind, payload):
@@ -2864,9 +3293,9 @@ def _append_agent_sync_jsonl(kind, payload):
     os.makedirs(logs_dir, exist_ok=True)
     path = os.path.join(logs_dir, f"agent_{kind}.jsonl")
     with open(path, "a", encoding="utf-8") as fh:
-        fh.write(json.dumps({
+        fh.write(_json_dumps({
             "kind": kind,
-            "received_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            "received_at": _log_timestamp(),
             "payload": payload or {},
         }) + "\n")
 
@@ -2880,7 +3309,7 @@ def _usage_log_path():
 def _log_usage(action, summary="", extra=None):
     try:
         row = {
-            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            "timestamp": _log_timestamp(),
             "username": _session_username() or "anonymous",
             "role": _session_role() or "anonymous",
             "action": str(action or "").strip(),
@@ -2890,29 +3319,102 @@ def _log_usage(action, summary="", extra=None):
             "remote_addr": request.remote_addr if has_request_context() else "",
             "extra": extra or {},
         }
-        with open(_usage_log_path(), "a", encoding="utf-8") as fh:
-            fh.write(json.dumps(row) + "\n")
+        line = _json_dumps(row) + "\n"
+        _ensure_usage_log_writer()
+        _USAGE_LOG_QUEUE.put((_usage_log_path(), line))
     except Exception:
         pass
 
 
+# Audit rows are appended by one writer thread; requests only enqueue the encoded line.
+_USAGE_LOG_QUEUE = queue.Queue()
+_USAGE_LOG_BATCH_MAX = 500
+_usage_log_writer_lock = threading.Lock()
+_usage_log_writer = None
+
+
+def _usage_log_writer_loop():
+    while True:
+        # Whatever queued up during the previous write goes out in one append per file.
+        batch = [_USAGE_LOG_QUEUE.get()]
+        try:
+            while len(batch) < _USAGE_LOG_BATCH_MAX:
+                batch.append(_USAGE_LOG_QUEUE.get_nowait())
+        except queue.Empty:
+            pass
+        lines_by_path = {}
+        for path, line in batch:
+            lines_by_path.setdefault(path, []).append(line)
+        for path, lines in lines_by_path.items():
+            try:
+                with open(path, "a", encoding="utf-8") as fh:
+                    fh.write("".join(lines))
+            except Exception:
+                pass
+        for _ in batch:
+            _USAGE_LOG_QUEUE.task_done()
+
+
+def _ensure_usage_log_writer():
+    global _usage_log_writer
+    if _usage_log_writer is not None:
+        return
+    with _usage_log_writer_lock:
+        if _usage_log_writer is None:
+            writer = threading.Thread(target=_usage_log_writer_loop, daemon=True, name="njordhr-usage-log")
+            writer.start()
+            _usage_log_writer = writer
+
+
+def _flush_usage_log():
+    """Block until every queued audit row has been appended."""
+    if _usage_log_writer is not None:
+        _USAGE_LOG_QUEUE.join()
+
+
+atexit.register(_flush_usage_log)
+
+
+_USAGE_LOG_TAIL_BLOCK_BYTES = 64 * 1024
+
+
+def _parse_usage_log_lines(lines, rows, limit):
+    """Append decoded rows from ``lines`` (newest first) until ``rows`` holds ``limit``."""
+    for line in lines:
+        raw = line.strip()
+        if not raw:
+            continue
+        try:
+            rows.append(_json_loads(raw))
+        except Exception:
+            continue
+        if limit > 0 and len(rows) >= limit:
+            return
+
+
 def _read_usage_logs(limit=200):
+    """Newest-first usage rows; with a limit only the tail of the log is read and parsed."""
+    _flush_usage_log()
     path = _usage_log_path()
     if not os.path.isfile(path):
         return []
     rows = []
-    with open(path, "r", encoding="utf-8") as fh:
-        for line in fh:
-            raw = line.strip()
-            if not raw:
-                continue
-            try:
-                rows.append(json.loads(raw))
-            except Exception:
-                continue
-    if limit > 0:
-        rows = rows[-limit:]
-    rows.reverse()
+    with open(path, "rb") as fh:
+        if limit <= 0:
+            _parse_usage_log_lines(reversed(fh.readlines()), rows, limit)
+            return rows
+        pos = fh.seek(0, os.SEEK_END)
+        head = b""
+        while pos > 0 and len(rows) < limit:
+            step = min(_USAGE_LOG_TAIL_BLOCK_BYTES, pos)
+            pos -= step
+            fh.seek(pos)
+            lines = (fh.read(step) + head).split(b"\n")
+            # The first piece may continue in the previous block; keep it for the next read.
+            head = lines.pop(0)
+            _parse_usage_log_lines(reversed(lines), rows, limit)
+        if len(rows) < limit:
+            _parse_usage_log_lines((head,), rows, limit)
     return rows
 
 
@@ -3049,8 +3551,9 @@ def _settings_payload(include_plain_secrets=False):
     return payload
 
 
-def _current_repo_backend():
-    name = type(csv_manager).__name__.lower()
+@functools.lru_cache(maxsize=None)
+def _repo_backend_for_type(repo_type):
+    name = repo_type.__name__.lower()
     if "dualwrite" in name:
         return "dual_write"
     if "supabase" in name:
@@ -3058,37 +3561,55 @@ def _current_repo_backend():
     return "csv"
 
 
+def _current_repo_backend():
+    # Keyed on the repo class, so swapping csv_manager on settings reload needs no invalidation.
+    return _repo_backend_for_type(type(csv_manager))
+
+
 def _resolve_within_base(base_dir, *parts):
     """Resolve a path and ensure it stays within base_dir."""
     base_abs = os.path.abspath(base_dir)
     candidate = os.path.abspath(os.path.join(base_abs, *parts))
-    if os.path.commonpath([base_abs, candidate]) != base_abs:
+    # Both paths are normalized by abspath, so a prefix test on a separator boundary
+    # matches commonpath without splitting them into components.
+    base_prefix = base_abs if base_abs.endswith(os.sep) else base_abs + os.sep
+    if candidate != base_abs and not candidate.startswith(base_prefix):
         raise ValueError("Path escapes base directory")
     return candidate
 
 
+_UNSAFE_NAMES = frozenset({'.', '..'})
+_ALLOWED_ASSET_EXT = frozenset({'.png', '.jpg', '.jpeg', '.svg', '.webp', '.gif', '.ico'})
+_ALLOWED_VENDOR_EXT = frozenset({'.js', '.map'})
+# Validated asset name -> absolute path; only names that existed when first requested.
+_APP_ASSET_PATHS = {}
+_APP_ASSET_MAX_AGE_SECONDS = 86400
+
+
 def _is_safe_name(value):
     """Allow only single path components (no separators/traversal)."""
     if not isinstance(value, str):
         return False
     value = value.strip()
-    if not value or value in {'.', '..'}:
+    if not value or value in _UNSAFE_NAMES:
         return False
     return value == os.path.basename(value)
 
 
+# Expected format:
+# <rank>_<ship_type>_<candidate_id>_<YYYY-MM-DD>_<HH-MM-SS>.pdf
+_CANDIDATE_FILENAME_RE = re.compile(r'_(\d+)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}\.pdf$', re.IGNORECASE)
+# Legacy fallback (older names without timestamp suffix).
+_LEGACY_CANDIDATE_FILENAME_RE = re.compile(r'_(\d+)\.pdf$', re.IGNORECASE)
+# Loose match for agent event filenames that carry no candidate_external_id.
+_FILENAME_CANDIDATE_ID_RE = re.compile(r'_(\d+)(?:_|\.)')
+
+
+@functools.lru_cache(maxsize=4096)
 def _extract_candidate_id_from_filename(filename):
     """Extract numeric candidate ID from {rank}_{candidate_id}.pdf pattern."""
-    # Expected format:
-    # <rank>_<ship_type>_<candidate_id>_<YYYY-MM-DD>_<HH-MM-SS>.pdf
-    match = re.search(r'_(\d+)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}\.pdf$', filename, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    # Legacy fallback (older names without timestamp suffix).
-    match = re.search(r'_(\d+)\.pdf$', filename, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    return None
+    match = _CANDIDATE_FILENAME_RE.search(filename) or _LEGACY_CANDIDATE_FILENAME_RE.search(filename)
+    return match.group(1) if match else None
 
 
 def _local_agent_base_url():
@@ -3115,7 +3636,7 @@ def _agent_request(method, path, *, json_body=None, params=None, stream=False, t
     token = _agent_sync_token()
     if token:
         headers["X-Device-Token"] = token
-    return requests.request(
+    return _AGENT_HTTP.request(
         method=method,
         url=url,
         json=json_body,
@@ -3126,36 +3647,107 @@ def _agent_request(method, path, *, json_body=None, params=None, stream=False, t
     )
 
 
+def _agent_log_event(event, ev_type, default_error_message):
+    return {"type": "log", "line": event.get("message", "")}
+
+
+def _agent_progress_event(event, ev_type, default_error_message):
+    event_data = event.get("data") or {}
+    payload = {
+        "type": "progress",
+        "stage": str(event_data.get("stage", ev_type)),
+        "message": event.get("message", ""),
+    }
+    if "percent" in event_data:
+        payload["percent"] = event_data["percent"]
+    if event_data:
+        payload["data"] = event_data
+    return payload
+
+
+def _agent_complete_event(event, ev_type, default_error_message):
+    result = (event.get("data") or {}).get("result", {}) or {}
+    if result.get("success"):
+        return {"type": "complete", **result}
+    return {"type": "error", "message": result.get("message", default_error_message)}
+
+
+def _agent_error_event(event, ev_type, default_error_message):
+    return {"type": "error", "message": event.get("message", default_error_message)}
+
+
+_AGENT_EVENT_TRANSLATORS = {
+    "log": _agent_log_event,
+    "queued": _agent_progress_event,
+    "running": _agent_progress_event,
+    "progress": _agent_progress_event,
+    "complete": _agent_complete_event,
+    "error": _agent_error_event,
+}
+_TERMINAL_STREAM_EVENT_TYPES = frozenset({"complete", "error"})
+
+
 def _translate_agent_stream_event(event, default_error_message="Download failed"):
-    ev_type = str((event or {}).get("type", "")).strip()
-    if ev_type == "log":
-        return {"type": "log", "line": (event or {}).get("message", "")}
-    if ev_type in {"queued", "running", "progress"}:
-        event_data = (event or {}).get("data") or {}
-        payload = {
-            "type": "progress",
-            "stage": str(event_data.get("stage", ev_type)),
-            "message": (event or {}).get("message", ""),
-        }
-        if "percent" in event_data:
-            payload["percent"] = event_data["percent"]
-        if event_data:
-            payload["data"] = event_data
-        return payload
-    if ev_type == "complete":
-        result = ((event or {}).get("data") or {}).get("result", {}) or {}
-        if result.get("success"):
-            return {"type": "complete", **result}
-        return {"type": "error", "message": result.get("message", default_error_message)}
-    if ev_type == "error":
-        return {"type": "error", "message": (event or {}).get("message", default_error_message)}
-    return None
+    event = event or {}
+    ev_type = str(event.get("type", "")).strip()
+    translate = _AGENT_EVENT_TRANSLATORS.get(ev_type)
+    if translate is None:
+        return None
+    return translate(event, ev_type, default_error_message)
+
+
+def _agent_stream_line_frame(line, default_error_message):
+    """Browser SSE frame for one raw agent stream line (or None), and whether the job ended."""
+    line = line.strip()
+    if not line:
+        return None, False
+    if line.startswith(b":"):
+        return _SSE_KEEPALIVE, False
+    if not line.startswith(b"data:"):
+        return None, False
+    try:
+        event = _json_loads(line[5:].strip())
+    except Exception:
+        return None, False
+    if not isinstance(event, dict):
+        return None, False
+    if event.get("type") == "log":
+        # Log lines dominate job streams; only the message needs encoding.
+        return f'data: {{"type":"log","line":{_json_dumps(event.get("message", ""))}}}\n\n', False
+    translated = _translate_agent_stream_event(event, default_error_message=default_error_message)
+    if not translated:
+        return None, False
+    return _sse_frame(translated), translated["type"] in _TERMINAL_STREAM_EVENT_TYPES
+
+
+def _relay_agent_stream(stream_resp, default_error_message="Download failed"):
+    """Re-emit a local agent job stream as browser SSE frames until it completes or fails.
+
+    Lines are split on raw bytes and handed to orjson undecoded; the agent's Werkzeug
+    server streams with chunked encoding, so each chunk arrives as soon as it is sent.
+    """
+    pending = b""
+    for chunk in stream_resp.iter_content(chunk_size=_AGENT_STREAM_CHUNK_BYTES):
+        if not chunk:
+            continue
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            frame, finished = _agent_stream_line_frame(line, default_error_message)
+            if frame:
+                yield frame
+            if finished:
+                return
+    if pending:
+        frame, _finished = _agent_stream_line_frame(pending, default_error_message)
+        if frame:
+            yield frame
 
 
 def _agent_health_summary():
     base = _local_agent_base_url()
     try:
-        resp = requests.get(f"{base}/health", timeout=3)
+        resp = _AGENT_HTTP.get(f"{base}/health", timeout=3)
         if resp.status_code >= 400:
             return {"configured": True, "reachable": False, "base_url": base, "error": f"HTTP {resp.status_code}"}
         data = resp.json()
@@ -3180,18 +3772,28 @@ def _storage_bucket_name():
     return normalize_env_value(os.getenv("SUPABASE_RESUME_BUCKET", "resumes")) or "resumes"
 
 
+_STORAGE_SEGMENT_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_STORAGE_OBJECT_PATH_RE = re.compile(r"[A-Za-z0-9._/-]+")
+
+
 def _safe_storage_segment(value):
-    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", str(value or "").strip())
+    cleaned = _STORAGE_SEGMENT_RE.sub("_", str(value or "").strip())
     return cleaned.strip("._") or "unknown"
 
 
-def _sha256_bytes(data_bytes):
+def _sha256_stream(fh):
+    """Return (hexdigest, size) of a seekable binary file and rewind it."""
     h = hashlib.sha256()
-    h.update(data_bytes or b"")
-    return h.hexdigest()
+    size = 0
+    while chunk := fh.read(_RESUME_UPLOAD_HASH_CHUNK_BYTES):
+        h.update(chunk)
+        size += len(chunk)
+    fh.seek(0)
+    return h.hexdigest(), size
 
 
 def _supabase_storage_upload(file_bytes, object_path, content_type="application/pdf"):
+    """Upload bytes or a readable binary file object to Supabase storage."""
     supabase_url = _supabase_url()
     supabase_key = resolve_supabase_api_key()
     if not supabase_url or not supabase_key:
@@ -3206,7 +3808,7 @@ def _supabase_storage_upload(file_bytes, object_path, content_type="application/
         "x-upsert": "true",
     }
     try:
-        resp = requests.post(endpoint, headers=headers, data=file_bytes, timeout=30)
+        resp = _SUPABASE_HTTP.post(endpoint, headers=headers, data=file_bytes, timeout=30)
         if resp.status_code >= 400:
             return None, f"Upload failed ({resp.status_code}): {resp.text[:300]}"
         return f"storage://{bucket}/{object_path}", ""
@@ -3231,7 +3833,7 @@ def _supabase_storage_signed_url(storage_url, expires_in=600):
         return "", "Invalid storage bucket"
     if ".." in object_path:
         return "", "Invalid storage object path"
-    if not re.fullmatch(r"[A-Za-z0-9._/-]+", object_path):
+    if not _STORAGE_OBJECT_PATH_RE.fullmatch(object_path):
         return "", "Invalid storage object path"
 
     endpoint = f"{supabase_url}/storage/v1/object/sign/{bucket}/{object_path}"
@@ -3242,7 +3844,7 @@ def _supabase_storage_signed_url(storage_url, expires_in=600):
     }
     body = {"expiresIn": int(expires_in)}
     try:
-        resp = requests.post(endpoint, headers=headers, json=body, timeout=20)
+        resp = _SUPABASE_HTTP.post(endpoint, headers=headers, json=body, timeout=20)
         if resp.status_code >= 400:
             return "", f"Sign failed ({resp.status_code}): {resp.text[:300]}"
         payload = resp.json() if resp.text else {}
@@ -3256,39 +3858,55 @@ def _supabase_storage_signed_url(storage_url, expires_in=600):
         return "", str(exc)
 
 
-def _build_runtime_resume_url_from_stored(rank_applied_for, filename, stored_resume_url):
-    rank = str(rank_applied_for or "").strip()
-    name = str(filename or "").strip()
-    stored = str(stored_resume_url or "").strip()
+def _runtime_url_base():
     # Prefer current request host to avoid stale hardcoded port in historical rows.
-    base = request.host_url.rstrip("/") if has_request_context() else app_settings.server_url.rstrip("/")
+    return request.host_url.rstrip("/") if has_request_context() else app_settings.server_url.rstrip("/")
+
+
+@functools.lru_cache(maxsize=16384)
+def _runtime_resume_url_path(rank, name, stored):
+    # Host-independent part of the URL; dashboard re-renders after each write repeat every row.
     if stored.startswith("storage://"):
-        return f"{base}/open_resume?storage_url={quote(stored, safe='')}&rank_folder={quote(rank, safe='')}&filename={quote(name, safe='')}"
+        return f"/open_resume?storage_url={quote(stored, safe='')}&rank_folder={quote(rank, safe='')}&filename={quote(name, safe='')}"
     if rank and name:
-        return f"{base}/open_resume?rank_folder={quote(rank, safe='')}&filename={quote(name, safe='')}"
+        return f"/open_resume?rank_folder={quote(rank, safe='')}&filename={quote(name, safe='')}"
     return ""
 
 
-VALID_STATUSES = {
+def _build_runtime_resume_url_from_stored(rank_applied_for, filename, stored_resume_url, base=None):
+    path = _runtime_resume_url_path(
+        str(rank_applied_for or "").strip(),
+        str(filename or "").strip(),
+        str(stored_resume_url or "").strip(),
+    )
+    if not path:
+        return ""
+    return (_runtime_url_base() if base is None else base) + path
+
+
+VALID_STATUSES = frozenset(map(sys.intern, (
     'New',
     'Contacted',
     'Interested',
     'Not Interested',
     'Mail Sent (handoff complete)',
-}
+)))
+
+# Candidate IDs are short ASCII digit strings (SeaJobs profile numbers).
+_is_candidate_id = re.compile(r"[0-9]{1,12}").fullmatch
 
 STATUS_TRANSITIONS = {
-    'New': {'Contacted'},
-    'Contacted': {'Interested', 'Not Interested'},
-    'Interested': {'Mail Sent (handoff complete)'},
-    'Mail Sent (handoff complete)': set(),
-    'Not Interested': set(),
+    'New': frozenset({'Contacted'}),
+    'Contacted': frozenset({'Interested', 'Not Interested'}),
+    'Interested': frozenset({'Mail Sent (handoff complete)'}),
+    'Mail Sent (handoff complete)': frozenset(),
+    'Not Interested': frozenset(),
 }
 
-ARCHIVE_STATUSES = {
+ARCHIVE_STATUSES = frozenset({
     'Mail Sent (handoff complete)',
     'Not Interested',
-}
+})
 
 
 def _normalize_email(value):
@@ -3302,7 +3920,7 @@ def _validate_status_transition(current_status, next_status):
         return False, "Invalid status value", False
     if nxt == current:
         return True, "", False
-    allowed = STATUS_TRANSITIONS.get(current, set())
+    allowed = STATUS_TRANSITIONS.get(current, frozenset())
     if nxt in allowed:
         return True, "", False
     if _session_role() == "admin":
@@ -3387,22 +4005,27 @@ def serve_frontend():
 @app.route('/app_asset/<path:filename>')
 def serve_app_asset(filename):
     """Serve local UI assets (e.g., logo) from project root."""
-    allowed_ext = {'.png', '.jpg', '.jpeg', '.svg', '.webp', '.gif', '.ico'}
-    ext = os.path.splitext(filename)[1].lower()
-    if not _is_safe_name(filename) or ext not in allowed_ext:
-        return "Invalid asset request.", 400
+    asset_path = _APP_ASSET_PATHS.get(filename)
+    if asset_path is None:
+        ext = os.path.splitext(filename)[1].lower()
+        if not _is_safe_name(filename) or ext not in _ALLOWED_ASSET_EXT:
+            return "Invalid asset request.", 400
+        asset_path = os.path.abspath(filename)
+        if not os.path.isfile(asset_path):
+            return "Asset not found.", 404
+        _APP_ASSET_PATHS[filename] = asset_path
     try:
-        return send_from_directory('.', filename)
+        return send_file(asset_path, max_age=_APP_ASSET_MAX_AGE_SECONDS)
     except FileNotFoundError:
+        _APP_ASSET_PATHS.pop(filename, None)
         return "Asset not found.", 404
 
 
 @app.route('/ui_vendor/<path:filename>')
 def serve_ui_vendor_asset(filename):
     """Serve vendored local UI runtime assets (React, ReactDOM, Babel)."""
-    allowed_ext = {'.js', '.map'}
     ext = os.path.splitext(filename)[1].lower()
-    if ext not in allowed_ext:
+    if ext not in _ALLOWED_VENDOR_EXT:
         return "Invalid vendor asset request.", 400
 
     vendor_root = Path("web_vendor").resolve()
@@ -3443,7 +4066,6 @@ def auth_bootstrap_status():
 
 @app.route('/auth/bootstrap', methods=['POST'])
 def auth_bootstrap():
-    global app_settings, config, creds, settings
     status = _bootstrap_status()
     if not status.get("bootstrap_required"):
         return jsonify({"success": False, "message": "Bootstrap already completed."}), 409
@@ -3457,7 +4079,7 @@ def auth_bootstrap():
     admin_password = str((payload or {}).get("admin_password", "")).strip()
     confirm_password = str((payload or {}).get("confirm_password", "")).strip()
 
-    if not re.match(r"^[A-Za-z0-9._-]{3,64}$", admin_username):
+    if not _USERNAME_RE.match(admin_username):
         _log_usage("bootstrap_failed", "Invalid bootstrap username format")
         return jsonify({"success": False, "message": "admin_username must be 3-64 chars: letters, numbers, dot, underscore, hyphen"}), 400
     if not admin_password or len(admin_password) < 8:
@@ -3479,16 +4101,10 @@ def auth_bootstrap():
     _config_set_literal(config, "Auth", "manager_password", "")
     _config_set_literal(config, "Auth", "recruiter_password", "")
 
-    config_path = os.getenv("NJORDHR_CONFIG_PATH", "config.ini")
-    with open(config_path, "w", encoding="utf-8") as fh:
-        config.write(fh)
+    _write_config_file(config)
 
-    app_settings = load_app_settings()
-    config = app_settings.config
-    creds = app_settings.credentials
-    settings = app_settings.settings
     try:
-        _refresh_runtime_managers()
+        _refresh_runtime_managers(config_obj=config)
     except RuntimeError as exc:
         # Bootstrap auth is still valid; return actionable runtime error instead of hard 500.
         return jsonify({"success": False, "message": str(exc)}), 400
@@ -3575,7 +4191,6 @@ def start_session():
     ok, reason = _require_role("admin", "manager")
     if not ok:
         return jsonify({"success": False, "message": reason}), 403
-    global scraper_session
     data = request.json
     mobile_number = data.get('mobileNumber')
     _log_usage("session_start", f"Start session requested for mobile={mobile_number}")
@@ -3589,15 +4204,19 @@ def start_session():
         except Exception as exc:
             return jsonify({"success": False, "message": f"Local agent unavailable: {exc}"}), 502
 
-    if scraper_session: scraper_session.quit()
+    from scraper_engine import Scraper
+
+    _swap_scraper_session()
     _clear_seajobs_activity()
-    scraper_session = Scraper(
+    local_scraper = Scraper(
         settings['Default_Download_Folder'],
         otp_window_seconds=_int_setting("Advanced", "otp_window_seconds", 120),
+        download_concurrency=_int_setting("Advanced", "download_concurrency", 2),
         login_url=_advanced_value("seajob_login_url", "http://seajob.net/seajob_login.php"),
         dashboard_url=_advanced_value("seajob_dashboard_url", "http://seajob.net/company/dashboard.php"),
     )
-    result = scraper_session.start_session(_seajob_username(), _seajob_password(), mobile_number)
+    _swap_scraper_session(local_scraper)
+    result = local_scraper.start_session(_seajob_username(), _seajob_password(), mobile_number)
     if result.get("success"):
         _touch_seajobs_activity()
     return jsonify(result)
@@ -3607,7 +4226,6 @@ def verify_otp():
     ok, reason = _require_role("admin", "manager")
     if not ok:
         return jsonify({"success": False, "message": reason}), 403
-    global scraper_session
     data = request.json
     otp = data.get('otp')
     _log_usage("otp_verify", "OTP verification requested")
@@ -3631,37 +4249,36 @@ def verify_otp():
             if login_result.get("success"):
                 _touch_seajobs_activity()
                 try:
-                    ranks_str = config.get('Ranks', 'rank_options', fallback='').strip()
-                    ship_types_str = config.get('ShipTypes', 'ship_type_options', fallback='').strip()
-                    login_result["ranks"] = [r.strip() for r in ranks_str.split('\n') if r.strip()]
-                    login_result["ship_types"] = [s.strip() for s in ship_types_str.split('\n') if s.strip()]
+                    _attach_configured_search_options(login_result)
                 except Exception as e:
                     return jsonify({"success": False, "message": f"Error in config.ini: {e}"}), 500
             return jsonify(login_result), resp.status_code
         except Exception as exc:
             return jsonify({"success": False, "message": f"Local agent unavailable: {exc}"}), 502
 
-    if not scraper_session:
+    local_scraper = scraper_session
+    if not local_scraper:
         return jsonify({"success": False, "message": "Session not started."})
     
-    login_result = scraper_session.verify_otp(otp)
+    login_result = local_scraper.verify_otp(otp)
     if login_result["success"]:
         _touch_seajobs_activity()
         try:
-            ranks_str = config.get('Ranks', 'rank_options', fallback='').strip()
-            ship_types_str = config.get('ShipTypes', 'ship_type_options', fallback='').strip()
-            login_result["ranks"] = [r.strip() for r in ranks_str.split('\n') if r.strip()]
-            login_result["ship_types"] = [s.strip() for s in ship_types_str.split('\n') if s.strip()]
+            _attach_configured_search_options(login_result)
         except Exception as e:
             return jsonify({"success": False, "message": f"Error in config.ini: {e}"})
     return jsonify(login_result)
 
 @app.route('/start_download', methods=['POST'])
 def start_download():
+    """Run a legacy (non-agent) download and return its result when it finishes.
+
+    The request thread still waits for the whole Selenium run; the scraper executor
+    only bounds it to one job at a time. /download_stream is the non-blocking path.
+    """
     ok, reason = _require_role("admin", "manager")
     if not ok:
         return jsonify({"success": False, "message": reason}), 403
-    global scraper_session
     data = request.json
     timeout_info = _enforce_seajobs_idle_timeout()
     if timeout_info:
@@ -3686,11 +4303,12 @@ def start_download():
         except Exception as exc:
             return jsonify({"success": False, "message": f"Local agent unavailable: {exc}"}), 502
 
-    if not scraper_session or not scraper_session.driver:
+    local_scraper = scraper_session
+    if not local_scraper or not local_scraper.driver:
         return jsonify({"success": False, "message": "Website session is not active or has expired."})
 
-    if hasattr(scraper_session, 'get_session_health'):
-        health = scraper_session.get_session_health()
+    if hasattr(local_scraper, 'get_session_health'):
+        health = local_scraper.get_session_health()
         if not health.get('valid'):
             return jsonify({
                 "success": False,
@@ -3704,12 +4322,16 @@ def start_download():
         logs_dir=_resolve_runtime_path(_advanced_value("log_dir", "logs"), "logs")
     )
     
-    result = scraper_session.download_resumes(
-        data['rank'], 
-        data['shipType'], 
-        data['forceRedownload'], 
-        logger
+    future = _submit_scraper_job(
+        local_scraper.download_resumes,
+        data['rank'],
+        data['shipType'],
+        data['forceRedownload'],
+        logger,
     )
+    if future is None:
+        return jsonify({"success": False, "message": "A download is already running. Please wait for it to finish."}), 429
+    result = future.result()
     _log_usage("download_start", f"Download started for rank={data.get('rank', '')}, ship_type={data.get('shipType', '')}")
     
     result['log_file'] = log_filepath
@@ -3722,9 +4344,8 @@ def download_stream():
     ok, reason = _require_role("admin", "manager")
     if not ok:
         def denied():
-            yield f"data: {json.dumps({'type': 'error', 'message': reason})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': reason})
         return Response(denied(), mimetype='text/event-stream')
-    global scraper_session
 
     rank = request.args.get('rank', '').strip()
     ship_type = request.args.get('shipType', '').strip()
@@ -3733,13 +4354,13 @@ def download_stream():
     timeout_info = _enforce_seajobs_idle_timeout()
     if timeout_info:
         def idle_timed_out():
-            yield f"data: {json.dumps({'type': 'error', 'message': timeout_info['message']})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': timeout_info['message']})
         return Response(idle_timed_out(), mimetype='text/event-stream')
 
     if _use_local_agent():
         def generate_agent():
             if not rank or not ship_type:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Rank and Ship Type are required.'})}\n\n"
+                yield _sse_frame({'type': 'error', 'message': 'Rank and Ship Type are required.'})
                 return
 
             try:
@@ -3756,43 +4377,22 @@ def download_stream():
                 create_payload = create_resp.json()
                 if not create_payload.get("success"):
                     msg = create_payload.get("message", "Failed to start local agent job")
-                    yield f"data: {json.dumps({'type': 'error', 'message': msg})}\n\n"
+                    yield _sse_frame({'type': 'error', 'message': msg})
                     return
                 _touch_seajobs_activity()
                 job_id = str(create_payload.get("job_id", "")).strip()
                 if not job_id:
-                    yield f"data: {json.dumps({'type': 'error', 'message': 'Local agent did not return job_id'})}\n\n"
+                    yield _sse_frame({'type': 'error', 'message': 'Local agent did not return job_id'})
                     return
-                yield f"data: {json.dumps({'type': 'started', 'message': 'Download stream started.', 'job_id': job_id})}\n\n"
+                yield _sse_frame({'type': 'started', 'message': 'Download stream started.', 'job_id': job_id})
 
                 with _agent_request("GET", f"/jobs/{job_id}/stream", stream=True, timeout=600) as stream_resp:
                     if stream_resp.status_code >= 400:
-                        yield f"data: {json.dumps({'type': 'error', 'message': f'Agent stream failed ({stream_resp.status_code})'})}\n\n"
+                        yield _sse_frame({'type': 'error', 'message': f'Agent stream failed ({stream_resp.status_code})'})
                         return
-                    for raw in stream_resp.iter_lines(decode_unicode=True):
-                        if raw is None:
-                            continue
-                        line = raw.strip()
-                        if not line:
-                            continue
-                        if line.startswith(":"):
-                            yield ": keepalive\n\n"
-                            continue
-                        if not line.startswith("data:"):
-                            continue
-                        payload_text = line[5:].strip()
-                        try:
-                            event = json.loads(payload_text)
-                        except Exception:
-                            continue
-                        translated = _translate_agent_stream_event(event)
-                        if not translated:
-                            continue
-                        yield f"data: {json.dumps(translated)}\n\n"
-                        if translated.get("type") in {"complete", "error"}:
-                            return
+                    yield from _relay_agent_stream(stream_resp)
             except Exception as exc:
-                yield f"data: {json.dumps({'type': 'error', 'message': f'Local agent unavailable: {exc}'})}\n\n"
+                yield _sse_frame({'type': 'error', 'message': f'Local agent unavailable: {exc}'})
 
         return Response(generate_agent(), mimetype='text/event-stream')
 
@@ -3800,10 +4400,10 @@ def download_stream():
         local_scraper = scraper_session
 
         if not local_scraper or not local_scraper.driver:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Website session is not active or has expired.'})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': 'Website session is not active or has expired.'})
             return
         if not rank or not ship_type:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Rank and Ship Type are required.'})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': 'Rank and Ship Type are required.'})
             return
 
         if hasattr(local_scraper, 'get_session_health'):
@@ -3815,7 +4415,7 @@ def download_stream():
                     "message": f"Website session invalid: {invalid_reason}",
                     "session_health": health
                 }
-                yield f"data: {json.dumps(payload)}\n\n"
+                yield _sse_frame(payload)
                 return
 
         session_id = str(uuid.uuid4())
@@ -3823,23 +4423,25 @@ def download_stream():
             session_id,
             logs_dir=_resolve_runtime_path(_advanced_value("log_dir", "logs"), "logs")
         )
-        yield f"data: {json.dumps({'type': 'started', 'log_file': log_filepath, 'message': 'Download stream started.'})}\n\n"
-
-        stream_queue = Queue()
+        # Log lines are buffered in a deque and flushed as one chunk per wakeup.
+        pending_lines = deque()
+        lines_ready = threading.Event()
+        worker_done = threading.Event()
         result_holder = {"result": None}
 
-        class QueueLogHandler(logging.Handler):
+        class BufferedLogHandler(logging.Handler):
             def emit(self, record):
                 try:
                     message = self.format(record)
                 except Exception:
                     message = record.getMessage()
-                stream_queue.put({"type": "log", "line": message})
+                pending_lines.append(message)
+                lines_ready.set()
 
-        queue_handler = QueueLogHandler()
-        queue_handler.setLevel(logging.INFO)
-        queue_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        logger.addHandler(queue_handler)
+        log_handler = BufferedLogHandler()
+        log_handler.setLevel(logging.INFO)
+        log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        logger.addHandler(log_handler)
 
         def worker():
             try:
@@ -3852,28 +4454,40 @@ def download_stream():
             except Exception as exc:
                 result_holder["result"] = {"success": False, "message": f"Download failed: {str(exc)}", "log": []}
             finally:
-                stream_queue.put({"type": "_done"})
+                worker_done.set()
+                lines_ready.set()
 
-        download_thread = threading.Thread(target=worker, daemon=True)
-        download_thread.start()
+        download_future = _submit_scraper_job(worker)
+        if download_future is None:
+            logger.removeHandler(log_handler)
+            log_handler.close()
+            payload = {
+                "type": "error",
+                "message": "A download is already running. Please wait for it to finish.",
+                "error_code": "SCRAPER_BUSY",
+            }
+            yield _sse_frame(payload)
+            return
+        yield _sse_frame({'type': 'started', 'log_file': log_filepath, 'message': 'Download stream started.'})
 
         try:
             while True:
-                try:
-                    event = stream_queue.get(timeout=1.0)
-                except Empty:
-                    if not download_thread.is_alive():
-                        break
-                    yield ": keepalive\n\n"
-                    continue
-
-                if event.get("type") == "_done":
+                woke = lines_ready.wait(timeout=_SSE_KEEPALIVE_INTERVAL_SECONDS)
+                lines_ready.clear()
+                # Sample completion before draining so no trailing line is left behind.
+                finished = worker_done.is_set() or download_future.done()
+                lines = []
+                while pending_lines:
+                    lines.append(pending_lines.popleft())
+                if lines:
+                    yield "".join(_sse_frame({'type': 'log', 'line': line}) for line in lines)
+                if finished:
                     break
-
-                yield f"data: {json.dumps(event)}\n\n"
+                if not woke:
+                    yield _SSE_KEEPALIVE
         finally:
-            logger.removeHandler(queue_handler)
-            queue_handler.close()
+            logger.removeHandler(log_handler)
+            log_handler.close()
 
         result = result_holder.get("result") or {"success": False, "message": "Download ended unexpectedly.", "log": []}
         payload = {
@@ -3882,7 +4496,7 @@ def download_stream():
             "message": result.get("message", "Download finished."),
             "log_file": log_filepath
         }
-        yield f"data: {json.dumps(payload)}\n\n"
+        yield _sse_frame(payload)
 
     return Response(generate(), mimetype='text/event-stream')
 
@@ -3892,12 +4506,12 @@ def outlook_fetch_stream():
     ok, reason = _require_role("admin", "manager")
     if not ok:
         def denied():
-            yield f"data: {json.dumps({'type': 'error', 'message': reason})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': reason})
         return Response(denied(), mimetype='text/event-stream')
 
     if not _use_local_agent():
         def no_agent():
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Local agent is required for Outlook intake.'})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': 'Local agent is required for Outlook intake.'})
         return Response(no_agent(), mimetype='text/event-stream')
 
     def generate_agent():
@@ -3906,42 +4520,21 @@ def outlook_fetch_stream():
             create_payload = create_resp.json()
             if not create_payload.get("success"):
                 msg = create_payload.get("message", "Failed to start Outlook fetch job")
-                yield f"data: {json.dumps({'type': 'error', 'message': msg})}\n\n"
+                yield _sse_frame({'type': 'error', 'message': msg})
                 return
             job_id = str(create_payload.get("job_id", "")).strip()
             if not job_id:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Local agent did not return job_id'})}\n\n"
+                yield _sse_frame({'type': 'error', 'message': 'Local agent did not return job_id'})
                 return
-            yield f"data: {json.dumps({'type': 'started', 'message': 'Outlook fetch started.', 'job_id': job_id})}\n\n"
+            yield _sse_frame({'type': 'started', 'message': 'Outlook fetch started.', 'job_id': job_id})
 
             with _agent_request("GET", f"/jobs/{job_id}/stream", stream=True, timeout=600) as stream_resp:
                 if stream_resp.status_code >= 400:
-                    yield f"data: {json.dumps({'type': 'error', 'message': f'Agent stream failed ({stream_resp.status_code})'})}\n\n"
+                    yield _sse_frame({'type': 'error', 'message': f'Agent stream failed ({stream_resp.status_code})'})
                     return
-                for raw in stream_resp.iter_lines(decode_unicode=True):
-                    if raw is None:
-                        continue
-                    line = raw.strip()
-                    if not line:
-                        continue
-                    if line.startswith(":"):
-                        yield ": keepalive\n\n"
-                        continue
-                    if not line.startswith("data:"):
-                        continue
-                    payload_text = line[5:].strip()
-                    try:
-                        event = json.loads(payload_text)
-                    except Exception:
-                        continue
-                    translated = _translate_agent_stream_event(event, default_error_message="Outlook fetch failed")
-                    if not translated:
-                        continue
-                    yield f"data: {json.dumps(translated)}\n\n"
-                    if translated.get("type") in {"complete", "error"}:
-                        return
+                yield from _relay_agent_stream(stream_resp, default_error_message="Outlook fetch failed")
         except Exception as exc:
-            yield f"data: {json.dumps({'type': 'error', 'message': f'Local agent unavailable: {exc}'})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': f'Local agent unavailable: {exc}'})
 
     return Response(generate_agent(), mimetype='text/event-stream')
 
@@ -4233,7 +4826,6 @@ def disconnect_session():
     ok, reason = _require_role("admin", "manager")
     if not ok:
         return jsonify({"success": False, "message": reason}), 403
-    global scraper_session
     _log_usage("session_disconnect", "Disconnect session requested")
     success = _disconnect_seajobs_best_effort()
     if success:
@@ -4244,7 +4836,6 @@ def disconnect_session():
 @app.route('/session_health', methods=['GET'])
 def session_health():
     """Return current scraper session health for OTP/session timeout handling."""
-    global scraper_session
     if _use_local_agent():
         try:
             resp = _agent_request("GET", "/session/health", timeout=15)
@@ -4284,7 +4875,8 @@ def session_health():
             "message": timeout_info["message"]
         })
 
-    if not scraper_session:
+    local_scraper = scraper_session
+    if not local_scraper:
         return jsonify({
             "success": True,
             "connected": False,
@@ -4299,11 +4891,12 @@ def session_health():
             }
         })
 
-    if hasattr(scraper_session, 'get_session_health'):
-        health = scraper_session.get_session_health()
+    connected = bool(local_scraper.driver)
+    if hasattr(local_scraper, 'get_session_health'):
+        health = local_scraper.get_session_health()
         return jsonify({
             "success": True,
-            "connected": bool(scraper_session and scraper_session.driver),
+            "connected": connected,
             "idle_timeout_seconds": _seajobs_idle_timeout_seconds(),
             "idle_seconds": _current_seajobs_idle_seconds() or 0,
             "health": health
@@ -4311,12 +4904,12 @@ def session_health():
 
     return jsonify({
         "success": True,
-        "connected": bool(scraper_session and scraper_session.driver),
+        "connected": connected,
         "idle_timeout_seconds": _seajobs_idle_timeout_seconds(),
         "idle_seconds": _current_seajobs_idle_seconds() or 0,
         "health": {
-            "active": bool(scraper_session and scraper_session.driver),
-            "valid": bool(scraper_session and scraper_session.driver),
+            "active": connected,
+            "valid": connected,
             "otp_pending": False,
             "otp_expired": False,
             "reason": "Legacy scraper without health checks"
@@ -4330,7 +4923,7 @@ def runtime_config():
     bootstrap = _bootstrap_status()
     auth_backend = _cloud_auth_state(force_refresh=False)
     if not _is_authenticated():
-        return jsonify({
+        return _revalidated_json_response({
             "success": True,
             "feature_flags": {
                 "use_supabase_db": bool(feature_flags.use_supabase_db),
@@ -4365,7 +4958,7 @@ def runtime_config():
     supabase_key = resolve_supabase_api_key()
     key_hint = f"{supabase_key[:12]}..." if supabase_key else ""
 
-    return jsonify({
+    return _revalidated_json_response({
         "success": True,
         "feature_flags": {
             "use_supabase_db": bool(feature_flags.use_supabase_db),
@@ -4641,7 +5234,7 @@ def ingest_agent_candidate_event():
 
     candidate_id = str(payload.get("candidate_external_id", "")).strip()
     if not candidate_id and filename:
-        m = re.search(r"_(\d+)(?:_|\.)", filename)
+        m = _FILENAME_CANDIDATE_ID_RE.search(filename)
         if m:
             candidate_id = m.group(1)
 
@@ -4708,12 +5301,13 @@ def ingest_agent_resume_upload():
     if not file_obj:
         return jsonify({"success": False, "message": "Missing file"}), 400
 
-    content = file_obj.read()
-    if not content:
+    # Werkzeug already spools large parts to a temp file; hash it in chunks and
+    # hand the file object to requests rather than copying the body into memory.
+    checksum, size = _sha256_stream(file_obj.stream)
+    if not size:
         return jsonify({"success": False, "message": "Empty file"}), 400
 
-    checksum = _sha256_bytes(content)
-    storage_url, error = _supabase_storage_upload(content, object_path)
+    storage_url, error = _supabase_storage_upload(file_obj.stream, object_path)
     _append_agent_sync_jsonl("resume_upload", {
         "filename": filename,
         "metadata": metadata,
@@ -4753,8 +5347,8 @@ def get_admin_settings():
     ok, reason = _require_admin()
     if not ok:
         return jsonify({"success": False, "message": reason}), 401
-    include_plain = str(request.args.get("include_secrets", "false")).strip().lower() in {"1", "true", "yes", "on"}
-    return jsonify({"success": True, "settings": _settings_payload(include_plain_secrets=include_plain)})
+    include_plain = str(request.args.get("include_secrets", "false")).strip().lower() in _TRUTHY_VALUES
+    return _revalidated_json_response({"success": True, "settings": _settings_payload(include_plain_secrets=include_plain)})
 
 
 @app.route('/admin/settings/test_supabase', methods=['POST'])
@@ -4774,17 +5368,21 @@ def test_admin_supabase():
     if not supabase_url or not supabase_secret_key:
         return jsonify({"success": False, "message": "supabase_url and supabase_secret_key are required"}), 400
 
+    probe = {
+        "url": f"{supabase_url.rstrip('/')}/rest/v1/candidate_events",
+        "params": {"select": "id", "limit": 1},
+        "headers": {
+            "apikey": supabase_secret_key,
+            "Authorization": f"Bearer {supabase_secret_key}",
+        },
+        "timeout": 10,
+    }
     try:
-        import requests
-        resp = requests.get(
-            f"{supabase_url.rstrip('/')}/rest/v1/candidate_events",
-            params={"select": "id", "limit": 1},
-            headers={
-                "apikey": supabase_secret_key,
-                "Authorization": f"Bearer {supabase_secret_key}",
-            },
-            timeout=10,
-        )
+        # HEAD checks reachability and auth without transferring a row; only a
+        # failure is repeated as GET so the PostgREST error body can be shown.
+        resp = _SUPABASE_HTTP.head(**probe)
+        if resp.status_code >= 400:
+            resp = _SUPABASE_HTTP.get(**probe)
         if resp.status_code >= 400:
             return jsonify({
                 "success": False,
@@ -4798,7 +5396,6 @@ def test_admin_supabase():
 
 @app.route('/admin/settings', methods=['POST'])
 def save_admin_settings():
-    global app_settings, config, creds, settings
     ok, reason = _require_admin()
     if not ok:
         return jsonify({"success": False, "message": reason}), 401
@@ -4850,8 +5447,7 @@ def save_admin_settings():
     def _restore_state():
         global app_settings, config, creds, settings
         if original_config_text is not None:
-            with open(config_path, "w", encoding="utf-8") as fh:
-                fh.write(original_config_text)
+            _write_config_text(original_config_text, config_path)
         for env_name, prev_value in env_snapshot.items():
             if prev_value is None:
                 os.environ.pop(env_name, None)
@@ -5042,13 +5638,8 @@ def save_admin_settings():
             os.environ[env_name] = "true" if coerced else "false"
 
     try:
-        with open(config_path, "w", encoding="utf-8") as fh:
-            config.write(fh)
-        app_settings = load_app_settings()
-        config = app_settings.config
-        creds = app_settings.credentials
-        settings = app_settings.settings
-        _refresh_runtime_managers()
+        _write_config_file(config, config_path)
+        _refresh_runtime_managers(config_obj=config)
     except Exception as exc:
         _restore_state()
         return jsonify({"success": False, "message": str(exc)}), 400
@@ -5117,10 +5708,8 @@ def admin_list_directories():
                 name = entry.name
                 if name.startswith('.'):
                     continue
-                entries.append({
-                    "name": name,
-                    "path": os.path.abspath(entry.path),
-                })
+                # target_path is already absolute and normalized, so entry.path is too.
+                entries.append({"name": name, "path": entry.path})
     except Exception as exc:
         return jsonify({"success": False, "message": f"Failed to list directories: {exc}"}), 500
 
@@ -5133,7 +5722,7 @@ def admin_list_directories():
                     continue
                 entries.append(drive_entry)
 
-    entries.sort(key=lambda item: item["name"].lower())
+    entries.sort(key=lambda item: item["name"].casefold())
     parent_path = os.path.dirname(target_path)
     if parent_path == target_path:
         parent_path = ""
@@ -5176,18 +5765,12 @@ def change_admin_password():
     _config_set_literal(config, "Advanced", "admin_token", new_password)
 
     try:
-        with open(config_path, "w", encoding="utf-8") as fh:
-            config.write(fh)
+        _write_config_file(config, config_path)
 
-        app_settings = load_app_settings()
-        config = app_settings.config
-        creds = app_settings.credentials
-        settings = app_settings.settings
-        _refresh_runtime_managers()
+        _refresh_runtime_managers(config_obj=config)
     except Exception as exc:
         if original_config_text is not None:
-            with open(config_path, "w", encoding="utf-8") as fh:
-                fh.write(original_config_text)
+            _write_config_text(original_config_text, config_path)
         app_settings = load_app_settings()
         config = app_settings.config
         creds = app_settings.credentials
@@ -5237,7 +5820,7 @@ def admin_upsert_user():
     role = _normalize_user_role((payload or {}).get("role", ""))
     if not username:
         return jsonify({"success": False, "message": "username is required"}), 400
-    if not re.match(r"^[A-Za-z0-9._-]{3,64}$", username):
+    if not _USERNAME_RE.match(username):
         return jsonify({"success": False, "message": "username must be 3-64 chars: letters, numbers, dot, underscore, hyphen"}), 400
     if not password or len(password) < 8:
         return jsonify({"success": False, "message": "password must be at least 8 characters"}), 400
@@ -5491,6 +6074,14 @@ def get_rank_options():
         return jsonify({"success": False, "message": str(e), "ranks": []}), 500
 
 
+def _iter_pdf_mtimes(folder_path):
+    """Yield (name, mtime) for each .pdf entry in folder_path from one scandir pass."""
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith('.pdf'):
+                yield entry.name, entry.stat().st_mtime
+
+
 @app.route('/get_download_results_summary', methods=['GET'])
 def get_download_results_summary():
     ok, reason = _require_role("admin", "manager", "recruiter")
@@ -5513,11 +6104,7 @@ def get_download_results_summary():
             folder_path = os.path.join(base_folder, folder)
             mailbox_folder_count = 0
             online_folder_count = 0
-            for name in os.listdir(folder_path):
-                if not name.lower().endswith('.pdf'):
-                    continue
-                full_path = os.path.join(folder_path, name)
-                modified_ts = os.path.getmtime(full_path)
+            for name, modified_ts in _iter_pdf_mtimes(folder_path):
                 if name.startswith("EMAIL_"):
                     mailbox_folder_count += 1
                     mailbox_success_count += 1
@@ -5534,20 +6121,19 @@ def get_download_results_summary():
         manual_review_dir = os.path.join(base_folder, "_EmailInbox_ManualReview")
         manual_review_count = 0
         if os.path.isdir(manual_review_dir):
-            for name in os.listdir(manual_review_dir):
-                if name.lower().endswith(".pdf"):
-                    manual_review_count += 1
-                    mailbox_latest_ts = max(mailbox_latest_ts, os.path.getmtime(os.path.join(manual_review_dir, name)))
+            for _name, modified_ts in _iter_pdf_mtimes(manual_review_dir):
+                manual_review_count += 1
+                mailbox_latest_ts = max(mailbox_latest_ts, modified_ts)
 
         failed_dir = os.path.join(base_folder, "_EmailInbox_Failed")
         failed_count = 0
         if os.path.isdir(failed_dir):
-            for name in os.listdir(failed_dir):
-                full_path = os.path.join(failed_dir, name)
-                if not os.path.isfile(full_path) or name.lower().endswith(".json"):
-                    continue
-                failed_count += 1
-                mailbox_latest_ts = max(mailbox_latest_ts, os.path.getmtime(full_path))
+            with os.scandir(failed_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file() or entry.name.lower().endswith(".json"):
+                        continue
+                    failed_count += 1
+                    mailbox_latest_ts = max(mailbox_latest_ts, entry.stat().st_mtime)
 
         def _serialize_role_counts(role_counts):
             return [
@@ -5663,9 +6249,7 @@ def get_config_ship_types():
     if not ok:
         return jsonify({"success": False, "message": reason}), 403
     try:
-        ship_types_str = config.get('ShipTypes', 'ship_type_options', fallback='').strip()
-        ship_types = [s.strip() for s in ship_types_str.split('\n') if s.strip()]
-        return jsonify({"success": True, "ship_types": ship_types})
+        return jsonify({"success": True, "ship_types": _configured_ship_type_options()})
     except Exception as e:
         return jsonify({"success": False, "message": str(e), "ship_types": []}), 500
 
@@ -5781,7 +6365,7 @@ def ai_search_recovery_draft():
             return jsonify({"success": True})
 
         tab_id = str((payload or {}).get("tab_id") or "").strip()
-        if not re.match(r"^[A-Za-z0-9._-]{8,128}$", tab_id):
+        if not _RECOVERY_TAB_ID_RE.match(tab_id):
             return jsonify({"success": False, "message": "Invalid recovery tab identifier."}), 400
         draft = _sanitize_ai_search_recovery_draft((payload or {}).get("draft"))
         saved = search_scope_repo.save_recovery_draft(
@@ -5804,7 +6388,7 @@ def analyze_stream():
     ok, reason = _require_role("admin", "manager", "recruiter")
     if not ok:
         def denied():
-            yield f"data: {json.dumps({'type': 'error', 'message': reason})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': reason})
         return Response(denied(), mimetype='text/event-stream')
     prompt = request.args.get('prompt')
     rank_folder = _request_rank_scope_value(request.args)
@@ -5841,7 +6425,7 @@ def analyze_stream():
         message = str(exc)
         detail_code = exc.detail_code
         def invalid_age_filter():
-            yield f"data: {json.dumps({'type': 'error', 'message': message, 'error_code': 'AGE_FILTER_INVALID', 'detail': {'code': detail_code}})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': message, 'error_code': 'AGE_FILTER_INVALID', 'detail': {'code': detail_code}})
         return Response(invalid_age_filter(), mimetype='text/event-stream')
     try:
         coc_issue_authority_filter = _parse_coc_issue_authority_filter_payload_strict(
@@ -5851,7 +6435,7 @@ def analyze_stream():
         message = str(exc)
         detail_code = exc.detail_code
         def invalid_coc_issue_authority_filter():
-            yield f"data: {json.dumps({'type': 'error', 'message': message, 'error_code': 'COC_ISSUE_AUTHORITY_FILTER_INVALID', 'detail': {'code': detail_code}})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': message, 'error_code': 'COC_ISSUE_AUTHORITY_FILTER_INVALID', 'detail': {'code': detail_code}})
         return Response(invalid_coc_issue_authority_filter(), mimetype='text/event-stream')
     try:
         availability_filter = _parse_availability_filter_payload_strict(
@@ -5861,7 +6445,7 @@ def analyze_stream():
         message = str(exc)
         detail_code = exc.detail_code
         def invalid_availability_filter():
-            yield f"data: {json.dumps({'type': 'error', 'message': message, 'error_code': 'AVAILABILITY_FILTER_INVALID', 'detail': {'code': detail_code}})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': message, 'error_code': 'AVAILABILITY_FILTER_INVALID', 'detail': {'code': detail_code}})
         return Response(invalid_availability_filter(), mimetype='text/event-stream')
     search_request_id = request.args.get('search_request_id', '').strip() or str(uuid.uuid4())
     changed_content_acknowledgement_id = request.args.get(
@@ -6005,7 +6589,7 @@ def analyze_stream():
                 "search_request_id": search_request_id,
                 "search_session_id": search_session_id,
             })
-            return f"data: {json.dumps(payload)}\n\n"
+            return _sse_frame(payload)
 
         def _error_sse(message, *, error_code="AI_SEARCH_REQUEST_FAILED", retryable=False, detail=None):
             if not _mark_request_failed(error_code, message):
@@ -6021,11 +6605,11 @@ def analyze_stream():
                 payload["error_code"] = error_code
             if detail is not None:
                 payload["detail"] = detail
-            return f"data: {json.dumps(payload)}\n\n"
+            return _sse_frame(payload)
 
         try:
             if not prompt:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Missing required data'})}\n\n"
+                yield _sse_frame({'type': 'error', 'message': 'Missing required data'})
                 return
 
             try:
@@ -6038,10 +6622,10 @@ def analyze_stream():
                 )
             except Exception as claim_exc:
                 print(f"[BACKEND WARN] Failed to claim AI search request: {claim_exc}")
-                yield f"data: {json.dumps(_request_status_event({'request_status': 'SEARCH_REQUEST_STORE_UNAVAILABLE', 'message': 'AI Search request tracking is temporarily unavailable. Please retry.', 'retryable': True, 'search_request_id': search_request_id}))}\n\n"
+                yield _sse_frame(_request_status_event({'request_status': 'SEARCH_REQUEST_STORE_UNAVAILABLE', 'message': 'AI Search request tracking is temporarily unavailable. Please retry.', 'retryable': True, 'search_request_id': search_request_id}))
                 return
             if not claim.get("claimed"):
-                yield f"data: {json.dumps(_request_status_event(claim))}\n\n"
+                yield _sse_frame(_request_status_event(claim))
                 return
             request_claim_started = True
 
@@ -6547,7 +7131,7 @@ def analyze_stream():
                             "AI Search request tracking could not record the completed request. Please retry with a new request.",
                         )
                         return
-                yield f"data: {json.dumps(event_to_client, default=_json_default)}\n\n"
+                yield _sse_frame(event_to_client, default=_json_default)
             
         except Exception as e:
             print(f"[BACKEND ERROR] {e}")
@@ -6825,6 +7409,58 @@ def submit_feedback():
         print(f"[ERROR] Feedback submission failed: {e}")
         return jsonify({"success": False, "message": str(e)}), 500
 
+_resume_name_index_lock = threading.Lock()
+_resume_name_index = {"base_dir": None, "paths": None}
+
+
+def _build_resume_name_index(base_dir):
+    """Breadth-first scandir walk mapping each file name to its shallowest path."""
+    paths = {}
+    pending = deque([base_dir])
+    while pending:
+        folder = pending.popleft()
+        try:
+            entries = os.scandir(folder)
+        except OSError:
+            continue
+        subfolders = []
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subfolders.append(entry.path)
+                    elif not entry.is_dir():
+                        paths.setdefault(entry.name, entry.path)
+                except OSError:
+                    continue
+        pending.extend(subfolders)
+    return paths
+
+
+def _invalidate_resume_name_index():
+    with _resume_name_index_lock:
+        _resume_name_index["paths"] = None
+
+
+def _find_file_by_name(base_dir, name):
+    """Locate a file called ``name`` anywhere under base_dir; shallowest match wins.
+
+    Served from a cached name index. A hit is confirmed with isfile, and a miss or
+    stale hit rebuilds the index once, so moved or newly downloaded files are found.
+    """
+    with _resume_name_index_lock:
+        paths = _resume_name_index["paths"] if _resume_name_index["base_dir"] == base_dir else None
+    if paths is not None:
+        path = paths.get(name)
+        if path and os.path.isfile(path):
+            return path
+    paths = _build_resume_name_index(base_dir)
+    with _resume_name_index_lock:
+        _resume_name_index["base_dir"] = base_dir
+        _resume_name_index["paths"] = paths
+    return paths.get(name)
+
+
 def _serve_local_resume(rank_folder, filename):
     try:
         base_dir = _active_download_root()
@@ -6833,11 +7469,7 @@ def _serve_local_resume(rank_folder, filename):
         if not os.path.isfile(full_path):
             # Fallback for historical rows where rank folder changed over time.
             requested_name = os.path.basename(filename)
-            fallback_path = None
-            for root, _, files in os.walk(base_dir):
-                if requested_name in files:
-                    fallback_path = os.path.join(root, requested_name)
-                    break
+            fallback_path = _find_file_by_name(base_dir, requested_name)
             if not fallback_path:
                 print(f"[ERROR] File not found: {full_path}")
                 return "File not found", 404
@@ -6954,9 +7586,13 @@ def verify_resumes():
     if not isinstance(filenames, list):
         return jsonify({"success": False, "message": "Invalid filenames payload."}), 400
     file_rank_folders = {}
+    unique_filenames = []
     for filename in filenames:
         if not _is_safe_name(filename) or not filename.lower().endswith('.pdf'):
             return jsonify({"success": False, "message": f"Invalid filename: {filename}"}), 400
+        if filename in file_rank_folders:
+            # Duplicate entries would re-extract and re-log the same resume.
+            continue
         if filename in rank_folder_by_filename:
             raw_file_rank_folder = rank_folder_by_filename.get(filename)
             if not isinstance(raw_file_rank_folder, str):
@@ -6971,34 +7607,55 @@ def verify_resumes():
         if not _is_safe_name(file_rank_folder):
             return jsonify({"success": False, "message": f"Invalid rank folder for: {filename}"}), 400
         file_rank_folders[filename] = file_rank_folder
+        unique_filenames.append(filename)
 
     source_base_dir = _active_download_root()
+    pending_extractions = []
 
     try:
         processed_files = 0
         csv_exports = 0
         stale_versions_deleted = 0
         extraction_errors = []
-        
-        for filename in filenames:
-            file_rank_folder = file_rank_folders[filename]
-            source_folder = _resolve_within_base(source_base_dir, file_rank_folder)
+
+        # Text extraction depends only on the file, so it is queued for every candidate
+        # up front and overlaps the cloud upload and event logging below, which stay in
+        # request order because each file's identifier check sees the events before it.
+        prepared = {}
+        for filename in unique_filenames:
+            source_folder = _resolve_within_base(source_base_dir, file_rank_folders[filename])
             source_path = _resolve_within_base(source_folder, filename)
+            candidate_id = _extract_candidate_id_from_filename(filename)
+            ai_match_reason = match_data.get(filename, {}).get('reason', 'Manually verified')
+            extraction = None
+            if candidate_id and os.path.isfile(source_path):
+                extraction = _VERIFY_EXTRACT_EXECUTOR.submit(
+                    resume_extractor.extract_resume_data,
+                    source_path,
+                    candidate_id=candidate_id,
+                    match_reason=ai_match_reason,
+                )
+                pending_extractions.append(extraction)
+            prepared[filename] = (source_path, candidate_id, ai_match_reason, extraction)
+
+        for filename in unique_filenames:
+            file_rank_folder = file_rank_folders[filename]
+            source_path, candidate_id, ai_match_reason, extraction = prepared[filename]
 
             if os.path.isfile(source_path):
-                candidate_id = _extract_candidate_id_from_filename(filename)
                 if not candidate_id:
                     extraction_errors.append(f"{filename}: Could not extract candidate ID from filename")
                     continue
 
-                ai_match_reason = match_data.get(filename, {}).get('reason', 'Manually verified')
-                
                 print(f"[VERIFY] Extracting data from {filename}...")
-                resume_data = resume_extractor.extract_resume_data(
-                    source_path,
-                    candidate_id=candidate_id,
-                    match_reason=ai_match_reason
-                )
+                if extraction is None:
+                    extraction = _VERIFY_EXTRACT_EXECUTOR.submit(
+                        resume_extractor.extract_resume_data,
+                        source_path,
+                        candidate_id=candidate_id,
+                        match_reason=ai_match_reason,
+                    )
+                resume_data = extraction.result()
                 extracted_email = _normalize_email(resume_data.get("email", ""))
                 if not extracted_email:
                     extraction_errors.append(f"{filename}: Missing required email in extracted resume data")
@@ -7029,9 +7686,9 @@ def verify_resumes():
                     candidate_seg = _safe_storage_segment(candidate_id)
                     file_seg = _safe_storage_segment(filename)
                     object_path = f"{rank_seg}/{candidate_seg}/{file_seg}"
-                    with open(source_path, "rb") as fh:
-                        file_bytes = fh.read()
-                    storage_url, upload_err = _supabase_storage_upload(file_bytes, object_path)
+                    # Hand requests the open file so the PDF is streamed, not read into memory.
+                    with open(source_path, "rb", buffering=1024 * 1024) as fh:
+                        storage_url, upload_err = _supabase_storage_upload(fh, object_path)
                     if not storage_url and upload_err:
                         extraction_errors.append(f"{filename}: Cloud upload failed ({upload_err})")
                 except Exception as upload_exc:
@@ -7077,6 +7734,9 @@ def verify_resumes():
             else:
                 extraction_errors.append(f"{filename}: Source file not found")
         
+        if stale_versions_deleted:
+            _invalidate_resume_name_index()
+
         # Prepare response message
         message = f"Successfully processed {processed_files} file(s). "
         message += f"Logged {csv_exports} event(s) to master CSV."
@@ -7114,6 +7774,134 @@ def verify_resumes():
         import traceback
         traceback.print_exc()
         return jsonify({"success": False, "message": str(e)}), 500
+    finally:
+        for extraction in pending_extractions:
+            extraction.cancel()
+
+def _candidate_events_version():
+    """Change token for the active event repo, or None when results must not be cached."""
+    reader = getattr(csv_manager, "data_version", None)
+    return reader() if callable(reader) else None
+
+
+def _json_payload_response(payload):
+    return Response(payload, mimetype='application/json')
+
+
+def _revalidated_json_response(payload):
+    """JSON response tagged with a hash of its body, so an unchanged poll is answered with 304."""
+    response = jsonify(payload)
+    response.add_etag()
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+
+def _versioned_payload_response(data_version, cache_key, render):
+    """Serve a payload tied to an event-log version, answering If-None-Match with 304."""
+    etag = hashlib.blake2s(repr((data_version, cache_key)).encode("utf-8"), digest_size=12).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = _json_payload_response(render())
+    response.set_etag(etag, weak=True)
+    # Browsers keep the body but must revalidate on every poll.
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+_DASHBOARD_RENAME = {
+    'Candidate_ID': 'candidate_id',
+    'Filename': 'filename',
+    'Resume_URL': 'resume_url',
+    'Date_Added': 'date_added',
+    'Event_Type': 'event_type',
+    'Status': 'status',
+    'Notes': 'notes',
+    'Rank_Applied_For': 'rank_applied_for',
+    'Search_Ship_Type': 'search_ship_type',
+    'Name': 'name',
+    'Present_Rank': 'present_rank',
+    'Email': 'email',
+    'Country': 'country',
+    'Mobile_No': 'mobile_no',
+    'AI_Match_Reason': 'ai_match_reason',
+}
+_DASHBOARD_SOURCE_COLUMNS = tuple(_DASHBOARD_RENAME)
+
+
+def _render_dashboard_payload(view_type, rank_name):
+    rows = csv_manager.get_latest_status_per_candidate(rank_name if view_type in ('rank', 'archive_rank') else '')
+
+    # Split dashboard into active pipeline (default) vs archived candidates.
+    if not rows.empty:
+        status_series = rows['Status'].astype(str).str.strip()
+        if view_type in ('archive', 'archive_rank'):
+            rows = rows[status_series.isin(ARCHIVE_STATUSES)]
+        else:
+            rows = rows[~status_series.isin(ARCHIVE_STATUSES)]
+
+    if rows.empty:
+        return app.json.dumps({
+            "success": True,
+            "view": view_type,
+            "total_count": 0,
+            "data": [],
+            "message": "No data available yet"
+        }).encode("utf-8")
+    subset = rows.reindex(columns=_DASHBOARD_SOURCE_COLUMNS).fillna('')
+    url_base = _runtime_url_base()
+    subset['Resume_URL'] = [
+        _build_runtime_resume_url_from_stored(rank, filename, stored_url, url_base) or stored_url
+        for rank, filename, stored_url in zip(subset['Rank_Applied_For'], subset['Filename'], subset['Resume_URL'])
+    ]
+    data = subset.rename(columns=_DASHBOARD_RENAME).to_dict(orient='records')
+
+    return app.json.dumps({
+        "success": True,
+        "view": view_type,
+        "rank_name": rank_name if view_type == 'rank' else None,
+        "total_count": len(data),
+        "data": data
+    }).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_dashboard_payload(view_type, rank_name, _host_url, _data_version):
+    # Resume URLs embed the request host, so it is part of the key with the data version.
+    return _render_dashboard_payload(view_type, rank_name)
+
+
+def _render_available_ranks_payload(scope):
+    latest_rows = csv_manager.get_latest_status_per_candidate()
+    if latest_rows.empty:
+        return app.json.dumps({"success": True, "ranks": []}).encode("utf-8")
+
+    if scope == 'archive':
+        latest_rows = latest_rows[latest_rows['Status'].astype(str).str.strip().isin(ARCHIVE_STATUSES)]
+    elif scope == 'active':
+        latest_rows = latest_rows[~latest_rows['Status'].astype(str).str.strip().isin(ARCHIVE_STATUSES)]
+
+    if latest_rows.empty:
+        return app.json.dumps({"success": True, "ranks": []}).encode("utf-8")
+
+    rank_names = latest_rows['Rank_Applied_For'].astype(str).str.strip()
+    rank_counts = rank_names[rank_names != ''].value_counts(sort=False).sort_index()
+    # tolist() yields native str/int in one pass, so no per-row int() cast is needed.
+    ranks = [
+        {
+            "rank": rank_name,
+            "display_name": rank_name.replace('_', ' '),
+            "count": count,
+        }
+        for rank_name, count in zip(rank_counts.index.tolist(), rank_counts.tolist())
+    ]
+    return app.json.dumps({"success": True, "ranks": ranks}).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_available_ranks_payload(scope, _data_version):
+    return _render_available_ranks_payload(scope)
+
 
 @app.route('/get_dashboard_data', methods=['GET'])
 def get_dashboard_data():
@@ -7137,56 +7925,14 @@ def get_dashboard_data():
                 "message": "No rank selected"
             })
 
-        rows = csv_manager.get_latest_status_per_candidate(rank_name if view_type in ('rank', 'archive_rank') else '')
-
-        # Split dashboard into active pipeline (default) vs archived candidates.
-        if not rows.empty:
-            status_series = rows['Status'].astype(str).str.strip()
-            if view_type in ('archive', 'archive_rank'):
-                rows = rows[status_series.isin(ARCHIVE_STATUSES)]
-            else:
-                rows = rows[~status_series.isin(ARCHIVE_STATUSES)]
-
-        if rows.empty:
-            return jsonify({
-                "success": True,
-                "view": view_type,
-                "total_count": 0,
-                "data": [],
-                "message": "No data available yet"
-            })
-        data = []
-        for _, row in rows.iterrows():
-            runtime_resume_url = _build_runtime_resume_url_from_stored(
-                row.get('Rank_Applied_For', ''),
-                row.get('Filename', ''),
-                row.get('Resume_URL', '')
-            ) or row.get('Resume_URL', '')
-            data.append({
-                "candidate_id": row.get('Candidate_ID', ''),
-                "filename": row.get('Filename', ''),
-                "resume_url": runtime_resume_url,
-                "date_added": row.get('Date_Added', ''),
-                "event_type": row.get('Event_Type', ''),
-                "status": row.get('Status', ''),
-                "notes": row.get('Notes', ''),
-                "rank_applied_for": row.get('Rank_Applied_For', ''),
-                "search_ship_type": row.get('Search_Ship_Type', ''),
-                "name": row.get('Name', ''),
-                "present_rank": row.get('Present_Rank', ''),
-                "email": row.get('Email', ''),
-                "country": row.get('Country', ''),
-                "mobile_no": row.get('Mobile_No', ''),
-                "ai_match_reason": row.get('AI_Match_Reason', '')
-            })
-        
-        return jsonify({
-            "success": True,
-            "view": view_type,
-            "rank_name": rank_name if view_type == 'rank' else None,
-            "total_count": len(data),
-            "data": data
-        })
+        data_version = _candidate_events_version()
+        if data_version is None:
+            return _json_payload_response(_render_dashboard_payload(view_type, rank_name))
+        return _versioned_payload_response(
+            data_version,
+            ('dashboard', view_type, rank_name, request.host_url),
+            lambda: _cached_dashboard_payload(view_type, rank_name, request.host_url, data_version),
+        )
     
     except Exception as e:
         print(f"[ERROR] Dashboard data fetch failed: {e}")
@@ -7202,45 +7948,17 @@ def get_available_ranks():
         if not ok:
             return jsonify({"success": False, "message": reason}), 403
         scope = str(request.args.get('scope', 'active')).strip().lower()  # active|archive|all
-        latest_rows = csv_manager.get_latest_status_per_candidate()
-        if latest_rows.empty:
-            return jsonify({"success": True, "ranks": []})
-
-        if scope == 'archive':
-            latest_rows = latest_rows[latest_rows['Status'].astype(str).str.strip().isin(ARCHIVE_STATUSES)]
-        elif scope == 'active':
-            latest_rows = latest_rows[~latest_rows['Status'].astype(str).str.strip().isin(ARCHIVE_STATUSES)]
-        elif scope != 'all':
+        if scope not in ('active', 'archive', 'all'):
             return jsonify({"success": False, "message": "Invalid scope"}), 400
 
-        if latest_rows.empty:
-            return jsonify({"success": True, "ranks": []})
-
-        rank_counts = (
-            latest_rows['Rank_Applied_For']
-            .astype(str)
-            .str.strip()
+        data_version = _candidate_events_version()
+        if data_version is None:
+            return _json_payload_response(_render_available_ranks_payload(scope))
+        return _versioned_payload_response(
+            data_version,
+            ('ranks', scope),
+            lambda: _cached_available_ranks_payload(scope, data_version),
         )
-        rank_counts = rank_counts[rank_counts != '']
-        rank_counts = (
-            rank_counts
-            .value_counts()
-            .reset_index()
-        )
-        rank_counts.columns = ['Rank_Applied_For', 'count']
-        ranks = []
-        for _, row in rank_counts.iterrows():
-            rank_name = row.get('Rank_Applied_For', '')
-            if rank_name:
-                ranks.append({
-                    "rank": rank_name,
-                    "display_name": rank_name.replace('_', ' '),
-                    "count": int(row.get('count', 0))
-                })
-
-        ranks.sort(key=lambda x: x['rank'])
-        
-        return jsonify({"success": True, "ranks": ranks})
     
     except Exception as e:
         print(f"[ERROR] Get available ranks failed: {e}")
@@ -7273,19 +7991,18 @@ def update_status():
     if not ok:
         return jsonify({"success": False, "message": reason}), 403
     try:
-        data = request.json or {}
-        candidate_id = str(data.get('candidate_id', '')).strip()
-        status = str(data.get('status', '')).strip()
+        get = (request.json or {}).get
+        candidate_id = str(get('candidate_id', '')).strip()
+        status = str(get('status', '')).strip()
 
-        if not candidate_id or not candidate_id.isdigit():
+        if not _is_candidate_id(candidate_id):
             return jsonify({"success": False, "message": "Invalid candidate_id"}), 400
         if status not in VALID_STATUSES:
             return jsonify({"success": False, "message": "Invalid status value"}), 400
 
-        history = csv_manager.get_candidate_history(candidate_id)
-        if not history:
+        latest = csv_manager.get_latest_candidate_row(candidate_id)
+        if not latest:
             return jsonify({"success": False, "message": "Candidate not found"}), 404
-        latest = history[-1]
         transition_ok, transition_error, admin_override = _validate_status_transition(
             current_status=latest.get("Status", "New"),
             next_status=status,
@@ -7311,11 +8028,11 @@ def add_notes():
     if not ok:
         return jsonify({"success": False, "message": reason}), 403
     try:
-        data = request.json or {}
-        candidate_id = str(data.get('candidate_id', '')).strip()
-        notes = str(data.get('notes', '')).strip()
+        get = (request.json or {}).get
+        candidate_id = str(get('candidate_id', '')).strip()
+        notes = str(get('notes', '')).strip()
 
-        if not candidate_id or not candidate_id.isdigit():
+        if not _is_candidate_id(candidate_id):
             return jsonify({"success": False, "message": "Invalid candidate_id"}), 400
         if not notes:
             return jsonify({"success": False, "message": "Notes cannot be empty"}), 400
@@ -7331,6 +8048,51 @@ def add_notes():
         return jsonify({"success": False, "message": str(e)}), 500
 
 
+def _list_folder_file_names(folder):
+    """Names of regular files directly inside folder (empty when it does not exist)."""
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _read_export_member(pdf_path, arcname):
+    """Stat and read one PDF for the export ZIP (runs on the export read pool).
+
+    Files above _EXPORT_PREFETCH_MAX_BYTES are not read here (data is None); the
+    writer copies them in _EXPORT_COPY_CHUNK_BYTES pieces instead.
+    """
+    import zipfile
+
+    zinfo = zipfile.ZipInfo.from_file(pdf_path, arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    if zinfo.file_size > _EXPORT_PREFETCH_MAX_BYTES:
+        return zinfo, pdf_path, None
+    with open(pdf_path, 'rb') as fh:
+        return zinfo, pdf_path, fh.read()
+
+
+class _ZipStreamSink(io.RawIOBase):
+    """Unseekable sink for ZipFile output; the export generator drains it between entries."""
+
+    def __init__(self):
+        super().__init__()
+        self._pending = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._pending += data
+        return len(data)
+
+    def drain(self):
+        chunk = bytes(self._pending)
+        self._pending.clear()
+        return chunk
+
+
 @app.route('/export_resumes', methods=['POST'])
 def export_resumes():
     """Export selected candidates as ZIP (PDFs + CSV snapshot)."""
@@ -7343,7 +8105,7 @@ def export_resumes():
         if not isinstance(candidate_ids, list) or not candidate_ids:
             return jsonify({"success": False, "message": "candidate_ids is required"}), 400
 
-        clean_ids = [str(c).strip() for c in candidate_ids if str(c).strip().isdigit()]
+        clean_ids = frozenset(s for c in candidate_ids if _is_candidate_id(s := str(c).strip()))
         if not clean_ids:
             return jsonify({"success": False, "message": "No valid candidate IDs provided"}), 400
 
@@ -7351,57 +8113,118 @@ def export_resumes():
         if latest_rows.empty:
             return jsonify({"success": False, "message": "No dashboard data found"}), 404
 
-        selected = latest_rows[latest_rows['Candidate_ID'].astype(str).isin(clean_ids)]
+        id_column = latest_rows['Candidate_ID']
+        if id_column.dtype.kind in 'iu':
+            # Compare integer IDs numerically rather than stringifying the whole column;
+            # a leading-zero spelling never equals str(int) and so never matched before.
+            id_mask = id_column.isin([int(s) for s in clean_ids if s == '0' or not s.startswith('0')])
+        elif id_column.dtype.name in ('str', 'string'):
+            # Already a string column: astype(str) would only copy it.
+            id_mask = id_column.isin(clean_ids)
+        else:
+            id_mask = id_column.astype(str).isin(clean_ids)
+        selected = latest_rows[id_mask]
         if selected.empty:
             return jsonify({"success": False, "message": "Selected candidates not found"}), 404
 
-        zip_buffer = io.BytesIO()
+        import zipfile
+
         download_root = _active_download_root()
         missing_files = []
-        added_files = 0
-
-        with zipfile.ZipFile(zip_buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
-            csv_rows = selected.to_dict(orient='records')
-            csv_buffer = io.StringIO()
-            writer = csv.DictWriter(csv_buffer, fieldnames=list(selected.columns))
-            writer.writeheader()
-            writer.writerows(csv_rows)
-            archive.writestr("selected_candidates.csv", csv_buffer.getvalue())
-
-            for row in csv_rows:
-                rank_folder = str(row.get('Rank_Applied_For', '')).strip()
-                filename = str(row.get('Filename', '')).strip()
-
-                if not _is_safe_name(rank_folder) or not _is_safe_name(filename):
-                    missing_files.append(filename or "invalid_name")
-                    continue
-
-                pdf_path = _resolve_within_base(download_root, rank_folder, filename)
-                if not os.path.isfile(pdf_path):
-                    missing_files.append(filename)
-                    continue
+        archive_entries = []
+
+        # pandas' C writer; CRLF rows match the csv.DictWriter output this replaced.
+        csv_snapshot = selected.to_csv(index=False, lineterminator='\r\n')
+
+        # Resolve every file up front: the count headers go out before the archive body.
+        # One scandir per rank folder replaces a stat per selected candidate, and the
+        # rank folder is validated once per folder rather than once per row. A name
+        # found in a directory listing is always a single safe path component, so the
+        # membership test also covers the per-file _is_safe_name check.
+        files_by_rank_folder = {}
+        for rank_value, filename_value in selected[['Rank_Applied_For', 'Filename']].itertuples(index=False, name=None):
+            rank_folder = str(rank_value).strip()
+            filename = str(filename_value).strip()
+
+            present = files_by_rank_folder.get(rank_folder)
+            if present is None:
+                if _is_safe_name(rank_folder):
+                    present = _list_folder_file_names(_resolve_within_base(download_root, rank_folder))
+                else:
+                    present = frozenset()
+                files_by_rank_folder[rank_folder] = present
+            if filename not in present:
+                missing_files.append(filename or "invalid_name")
+                continue
 
-                arcname = os.path.join("resumes", rank_folder, filename)
-                archive.write(pdf_path, arcname=arcname)
-                added_files += 1
+            pdf_path = os.path.join(download_root, rank_folder, filename)
+            archive_entries.append((pdf_path, os.path.join("resumes", rank_folder, filename)))
+
+        def generate_zip():
+            sink = _ZipStreamSink()
+            # Headers are already sent, so a PDF that vanishes or fails to read after the
+            # listing is skipped and named in a manifest rather than aborting the stream.
+            skipped_files = []
+            # PDFs are already compressed; only the CSV snapshot is worth deflating.
+            with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+                archive.writestr(
+                    "selected_candidates.csv",
+                    csv_snapshot,
+                    compress_type=zipfile.ZIP_DEFLATED,
+                )
+                yield sink.drain()
+                # Keep a bounded window of reads in flight; members are written in order.
+                entries = iter(archive_entries)
+                in_flight = deque(
+                    (entry, _EXPORT_READ_EXECUTOR.submit(_read_export_member, *entry))
+                    for entry in itertools.islice(entries, _EXPORT_READ_WORKERS)
+                )
+                try:
+                    while in_flight:
+                        (pdf_path, arcname), future = in_flight.popleft()
+                        next_entry = next(entries, None)
+                        if next_entry is not None:
+                            in_flight.append((next_entry, _EXPORT_READ_EXECUTOR.submit(_read_export_member, *next_entry)))
+                        try:
+                            zinfo, pdf_path, pdf_bytes = future.result()
+                            if pdf_bytes is not None:
+                                archive.writestr(zinfo, pdf_bytes)
+                                del pdf_bytes
+                            else:
+                                with open(pdf_path, 'rb') as src, archive.open(zinfo, 'w') as dest:
+                                    while chunk := src.read(_EXPORT_COPY_CHUNK_BYTES):
+                                        dest.write(chunk)
+                                        yield sink.drain()
+                        except OSError as e:
+                            print(f"[WARN] Export skipped {arcname}: {e}")
+                            skipped_files.append(f"{arcname}: {e.strerror or e}")
+                        yield sink.drain()
+                finally:
+                    for _, pending in in_flight:
+                        pending.cancel()
+                if skipped_files:
+                    archive.writestr(
+                        "missing_files.txt",
+                        "Files that could not be read while the export was streamed:\n"
+                        + "".join(f"{line}\n" for line in skipped_files),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                    )
+            yield sink.drain()
 
-        zip_buffer.seek(0)
-        timestamp = uuid.uuid4().hex[:8]
-        download_name = f"njord_export_{timestamp}.zip"
+        added_files = len(archive_entries)
+        download_name = f"njord_export_{next(_EXPORT_SEQ):x}.zip"
 
-        response = send_file(
-            zip_buffer,
-            mimetype='application/zip',
-            as_attachment=True,
-            download_name=download_name
-        )
+        response = Response(generate_zip(), mimetype='application/zip')
+        response.headers['Content-Disposition'] = f'attachment; filename={download_name}'
         response.headers['X-Exported-Count'] = str(len(selected))
+        # Counts reflect the folder listing; files lost after it are named in missing_files.txt.
         response.headers['X-Included-Files'] = str(added_files)
         response.headers['X-Missing-Files'] = str(len(missing_files))
         missing_preview = missing_files[:20]
         response.headers['X-Missing-Files-Preview'] = json.dumps(missing_preview)
         response.headers['X-Missing-Files-Truncated'] = str(max(0, len(missing_files) - len(missing_preview)))
-        _log_usage("export_resumes", "Resume export completed", {
+        # Logged before the body streams, so this records the listing, not the delivered archive.
+        _log_usage("export_resumes", "Resume export started", {
             "selected": len(selected),
             "included_files": added_files,
             "missing_files": len(missing_files),
@@ -1,10 +1,44 @@
 # csv_manager.py - Event Log CSV Manager
 
+import atexit
+import csv
 import os
 import threading
 from datetime import UTC, datetime
 import pandas as pd
 
+# Optional Dependencies
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+
+def _read_event_csv(path, text_columns=()):
+    """Read an event-log CSV, using pyarrow's multi-threaded reader when installed.
+
+    Both paths keep empty cells as '' (keep_default_na=False) and read text_columns
+    as strings, so values like '+91...' or '0044...' survive a load/save round trip
+    and neither reader parses Date_Added as a timestamp.
+    """
+    if pa_csv is not None:
+        try:
+            table = pa_csv.read_csv(
+                path,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={column: pa.string() for column in text_columns},
+                    null_values=[],
+                    strings_can_be_null=False,
+                    timestamp_parsers=[],
+                ),
+            )
+            return table.to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+    return pd.read_csv(path, keep_default_na=False, dtype=dict.fromkeys(text_columns, str))
+
 
 class CSVManager:
     """Manages a single master CSV as an event log."""
@@ -27,6 +61,8 @@ class CSVManager:
         'Country',
         'Mobile_No'
     ]
+    # Everything but Candidate_ID is free text; digit-only values must not become numbers.
+    TEXT_COLUMNS = tuple(col for col in COLUMNS if col != 'Candidate_ID')
     AI_SEARCH_AUDIT_COLUMNS = [
         'Timestamp',
         'Search_Session_ID',
@@ -48,17 +84,50 @@ class CSVManager:
         'Result_Bucket',
     ]
 
-    def __init__(self, base_folder='Verified_Resumes', server_url='http://127.0.0.1:5000'):
+    # Write-behind tuning for coalesced status/note events.
+    COALESCE_FLUSH_INTERVAL_SECONDS = 0.2
+    COALESCE_MAX_BATCH = 500
+
+    def __init__(self, base_folder='Verified_Resumes', server_url='http://127.0.0.1:5000', coalesce_writes=False):
         self.base_folder = base_folder
         self.server_url = server_url
         self.master_csv = os.path.join(base_folder, 'verified_resumes.csv')
         self.ai_search_audit_csv = os.path.join(base_folder, 'ai_search_audit.csv')
         self._lock = threading.RLock()
+        # When enabled, status_change/note_added rows are buffered and appended in
+        # batches by a background thread. Reads flush the buffer first, except the
+        # single-candidate lookup those follow-up events use (see get_latest_candidate_row).
+        self.coalesce_writes = bool(coalesce_writes)
+        self._pending_rows = []
+        self._pending_lock = threading.Lock()
+        self._flush_wakeup = threading.Event()
+        self._flush_now = threading.Event()
+        self._flush_thread = None
+        self._closed = False
+        # (data_version, latest rows newest-first, {candidate_id: latest row}, derived aggregates);
+        # rebuilt when the CSV changes.
+        self._latest_cache = None
         os.makedirs(base_folder, exist_ok=True)
 
+    def data_version(self):
+        """Change token for the master CSV; any append or rewrite produces a new value."""
+        self.flush_pending()
+        return self._file_version()
+
+    def _file_version(self):
+        try:
+            stat = os.stat(self.master_csv)
+        except FileNotFoundError:
+            return (self.master_csv, 0, 0, 0)
+        return (self.master_csv, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
     def _load_master_df(self):
+        self.flush_pending()
+        return self._read_master_df()
+
+    def _read_master_df(self):
         if os.path.exists(self.master_csv):
-            df = pd.read_csv(self.master_csv, keep_default_na=False)
+            df = _read_event_csv(self.master_csv, self.TEXT_COLUMNS)
             for col in self.COLUMNS:
                 if col not in df.columns:
                     df[col] = ''
@@ -84,15 +153,14 @@ class CSVManager:
         df.to_csv(temp_path, index=False, lineterminator='\n')
         os.replace(temp_path, self.ai_search_audit_csv)
 
-    def log_event(self, candidate_id, filename, event_type, status='New', notes='',
-                  rank_applied_for='', search_ship_type='', ai_prompt='',
-                  ai_reason='', extracted_data=None, resume_url='', admin_override=False):
-        """Append one event row to the single master CSV."""
+    def _build_event_row(self, candidate_id, filename, event_type, status='New', notes='',
+                         rank_applied_for='', search_ship_type='', ai_prompt='',
+                         ai_reason='', extracted_data=None, resume_url='', admin_override=False):
         extracted_data = extracted_data or {}
         timestamp = datetime.now(UTC).isoformat().replace("+00:00", "Z")
         resolved_resume_url = str(resume_url or '').strip() or f"{self.server_url}/get_resume/{rank_applied_for}/{filename}"
 
-        new_row = {
+        return {
             'Candidate_ID': str(candidate_id),
             'Filename': filename,
             'Resume_URL': resolved_resume_url,
@@ -111,15 +179,145 @@ class CSVManager:
             'Mobile_No': extracted_data.get('mobile_no', '')
         }
 
-        try:
-            with self._lock:
-                df = self._load_master_df()
-                df = pd.concat([df, pd.DataFrame([new_row], columns=self.COLUMNS)], ignore_index=True)
-                self._save_master_df(df)
+    def _master_header_is_current(self):
+        """True when the master CSV is missing/empty or already has the canonical header."""
+        if not os.path.exists(self.master_csv) or os.path.getsize(self.master_csv) == 0:
             return True
+        with open(self.master_csv, 'r', newline='', encoding='utf-8') as fh:
+            header = next(csv.reader(fh), [])
+        return header == self.COLUMNS
+
+    def _append_master_rows(self, rows, fsync=False):
+        write_header = not os.path.exists(self.master_csv) or os.path.getsize(self.master_csv) == 0
+        with open(self.master_csv, 'a', newline='', encoding='utf-8', buffering=1 << 20) as fh:
+            writer = csv.writer(fh, lineterminator='\n')
+            if write_header:
+                writer.writerow(self.COLUMNS)
+            writer.writerows([row[col] for col in self.COLUMNS] for row in rows)
+            fh.flush()
+            if fsync:
+                os.fsync(fh.fileno())
+
+    def log_event(self, candidate_id, filename, event_type, status='New', notes='',
+                  rank_applied_for='', search_ship_type='', ai_prompt='',
+                  ai_reason='', extracted_data=None, resume_url='', admin_override=False):
+        """Append one event row to the single master CSV."""
+        return self.log_events([{
+            'candidate_id': candidate_id,
+            'filename': filename,
+            'event_type': event_type,
+            'status': status,
+            'notes': notes,
+            'rank_applied_for': rank_applied_for,
+            'search_ship_type': search_ship_type,
+            'ai_prompt': ai_prompt,
+            'ai_reason': ai_reason,
+            'extracted_data': extracted_data,
+            'resume_url': resume_url,
+            'admin_override': admin_override,
+        }])
+
+    def log_events(self, events):
+        """
+        Append event rows (dicts of log_event keyword arguments) in one buffered pass.
+        Legacy files with a non-canonical header are normalized via a full rewrite first.
+        """
+        try:
+            rows = [self._build_event_row(**event) for event in events]
         except Exception as e:
             print(f"[CSV ERROR] Failed to append event row: {e}")
             return False
+        if not rows:
+            return True
+        with self._lock:
+            # Buffered rows were logged first, so they must land first.
+            pending = self._take_pending_rows()
+            try:
+                self._write_rows(pending + rows)
+                return True
+            except Exception as e:
+                print(f"[CSV ERROR] Failed to append event row: {e}")
+                if pending:
+                    with self._pending_lock:
+                        self._pending_rows[:0] = pending
+                return False
+
+    def _write_rows(self, rows, fsync=False):
+        """Append rows to the master CSV; caller holds self._lock."""
+        if self._master_header_is_current():
+            self._append_master_rows(rows, fsync=fsync)
+        else:
+            df = self._load_master_df()
+            df = pd.concat([df, pd.DataFrame(rows, columns=self.COLUMNS)], ignore_index=True)
+            self._save_master_df(df)
+
+    def _take_pending_rows(self):
+        with self._pending_lock:
+            rows, self._pending_rows = self._pending_rows, []
+        return rows
+
+    def _queue_rows(self, rows):
+        with self._pending_lock:
+            self._pending_rows.extend(rows)
+            pending_count = len(self._pending_rows)
+            if self._flush_thread is None and not self._closed:
+                self._flush_thread = threading.Thread(target=self._flush_loop, name="csv-write-behind", daemon=True)
+                self._flush_thread.start()
+                atexit.register(self.close)
+        self._flush_wakeup.set()
+        if pending_count >= self.COALESCE_MAX_BATCH:
+            self._flush_now.set()
+
+    def _flush_loop(self):
+        while not self._closed:
+            # Sleep until rows are queued, then give follow-up events the coalescing
+            # window to join the batch; a full batch or close() cuts the window short.
+            self._flush_wakeup.wait()
+            self._flush_now.wait(self.COALESCE_FLUSH_INTERVAL_SECONDS)
+            self._flush_wakeup.clear()
+            self._flush_now.clear()
+            self.flush_pending()
+
+    def close(self):
+        """Stop the write-behind thread and write anything still buffered."""
+        with self._pending_lock:
+            self._closed = True
+            thread, self._flush_thread = self._flush_thread, None
+        if thread is not None:
+            atexit.unregister(self.close)
+            self._flush_wakeup.set()
+            self._flush_now.set()
+            if thread is not threading.current_thread():
+                thread.join(timeout=5)
+        return self.flush_pending()
+
+    def flush_pending(self):
+        """Write any buffered status/note rows; returns False if the append failed."""
+        if not self._pending_rows:
+            return True
+        with self._lock:
+            rows = self._take_pending_rows()
+            if not rows:
+                return True
+            try:
+                # Batched rows were acknowledged before they were written, so make them durable.
+                self._write_rows(rows, fsync=True)
+                return True
+            except Exception as e:
+                print(f"[CSV ERROR] Failed to flush {len(rows)} buffered event row(s): {e}")
+                with self._pending_lock:
+                    self._pending_rows[:0] = rows
+                return False
+
+    def _log_follow_up_event(self, **event):
+        if not self.coalesce_writes or self._closed:
+            return self.log_event(**event)
+        try:
+            self._queue_rows([self._build_event_row(**event)])
+            return True
+        except Exception as e:
+            print(f"[CSV ERROR] Failed to buffer event row: {e}")
+            return False
 
     def log_ai_search_audit(
         self,
@@ -179,20 +377,58 @@ class CSVManager:
             return []
         return df.sort_values('Timestamp').to_dict(orient='records')
 
-    def get_latest_status_per_candidate(self, rank_name=''):
-        """Return latest event row per candidate, optionally filtered by rank."""
+    def _latest_snapshot(self, flush=True):
+        """Latest event per candidate, recomputed only when the master CSV has changed.
+
+        With flush=False buffered rows stay buffered and the snapshot reflects the file only.
+        """
         with self._lock:
-            df = self._load_master_df()
-        if df.empty:
-            return df
+            version = self.data_version() if flush else self._file_version()
+            if self._latest_cache is None or self._latest_cache[0] != version:
+                df = self._load_master_df() if flush else self._read_master_df()
+                if df.empty:
+                    latest, by_id = df, {}
+                else:
+                    latest = df.sort_values('Date_Added').groupby('Candidate_ID', as_index=False).tail(1)
+                    latest = latest.sort_values('Date_Added', ascending=False).reset_index(drop=True)
+                    by_id = {str(row['Candidate_ID']): row for row in latest.to_dict(orient='records')}
+                self._latest_cache = (version, latest, by_id, {})
+            return self._latest_cache[1], self._latest_cache[2]
 
-        df_sorted = df.sort_values('Date_Added')
-        latest = df_sorted.groupby('Candidate_ID', as_index=False).tail(1)
-        if rank_name:
-            latest = latest[latest['Rank_Applied_For'] == rank_name]
-            if latest.empty:
-                return pd.DataFrame(columns=self.COLUMNS)
-        return latest.sort_values('Date_Added', ascending=False).reset_index(drop=True)
+    def _latest_derived(self, key, build):
+        """Memoize build(latest) alongside the current snapshot; dropped when the CSV changes."""
+        with self._lock:
+            latest, _by_id = self._latest_snapshot()
+            derived = self._latest_cache[3]
+            if key not in derived:
+                derived[key] = build(latest)
+            return latest, derived[key]
+
+    def _rank_positions(self, latest):
+        # One hash pass over the snapshot: rank -> row positions, newest-first order kept.
+        if latest.empty:
+            return {}
+        return latest.groupby('Rank_Applied_For', sort=False).indices
+
+    def _rank_count_rows(self, latest):
+        if latest.empty:
+            return []
+        counts = latest['Rank_Applied_For'].value_counts(sort=False)
+        return sorted(
+            ({'Rank_Applied_For': rank, 'count': int(count)} for rank, count in counts.items()),
+            key=lambda r: r['Rank_Applied_For'],
+        )
+
+    def get_latest_status_per_candidate(self, rank_name=''):
+        """Return latest event row per candidate, optionally filtered by rank."""
+        if not rank_name:
+            latest, _by_id = self._latest_snapshot()
+            return latest.copy() if latest.empty else latest.copy(deep=False)
+        latest, positions_by_rank = self._latest_derived('rank_positions', self._rank_positions)
+        positions = positions_by_rank.get(rank_name)
+        if positions is None:
+            return pd.DataFrame(columns=self.COLUMNS)
+        return latest.take(positions).reset_index(drop=True)
 
     def get_candidate_history(self, candidate_id):
         with self._lock:
@@ -204,22 +440,25 @@ class CSVManager:
 
     def get_latest_candidate_row(self, candidate_id):
         """Get latest event row for a candidate as dict."""
+        key = str(candidate_id)
         with self._lock:
-            df = self._load_master_df()
-        if df.empty:
-            return None
-        candidate_rows = df[df['Candidate_ID'].astype(str) == str(candidate_id)]
-        if candidate_rows.empty:
-            return None
-        latest = candidate_rows.sort_values('Date_Added').tail(1)
-        return latest.iloc[0].to_dict()
+            # A buffered row is newer than anything on disk. Answering from the buffer
+            # (and otherwise from the file alone) keeps a burst of status/note updates
+            # coalesced instead of flushing and re-reading the CSV for every update.
+            with self._pending_lock:
+                for row in reversed(self._pending_rows):
+                    if row['Candidate_ID'] == key:
+                        return dict(row)
+            _latest, by_id = self._latest_snapshot(flush=False)
+        row = by_id.get(key)
+        return dict(row) if row is not None else None
 
     def log_status_change(self, candidate_id, status, admin_override=False):
         """Log a status_change event using latest known candidate fields."""
         latest = self.get_latest_candidate_row(candidate_id)
         if not latest:
             return False
-        return self.log_event(
+        return self._log_follow_up_event(
             candidate_id=candidate_id,
             filename=latest.get('Filename', ''),
             event_type='status_change',
@@ -244,7 +483,7 @@ class CSVManager:
         latest = self.get_latest_candidate_row(candidate_id)
         if not latest:
             return False
-        return self.log_event(
+        return self._log_follow_up_event(
             candidate_id=candidate_id,
             filename=latest.get('Filename', ''),
             event_type='note_added',
@@ -282,14 +521,8 @@ class CSVManager:
 
     def get_rank_counts(self):
         """Return counts of latest candidate rows grouped by rank."""
-        latest = self.get_latest_status_per_candidate()
-        if latest.empty:
-            return []
-
-        counts = latest.groupby('Rank_Applied_For').size().reset_index(name='count')
-        rows = counts.to_dict(orient='records')
-        rows.sort(key=lambda r: r['Rank_Applied_For'])
-        return rows
+        _latest, rows = self._latest_derived('rank_counts', self._rank_count_rows)
+        return [dict(row) for row in rows]
 
     def get_csv_stats(self):
         with self._lock:
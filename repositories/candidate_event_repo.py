@@ -37,3 +37,19 @@ class CandidateEventRepo(ABC):
     @abstractmethod
     def get_ai_search_audit_rows(self, *args, **kwargs):
         raise NotImplementedError
+
+    def get_latest_candidate_row(self, candidate_id):
+        """Return the most recent event row for one candidate as a dict, or None."""
+        history = self.get_candidate_history(candidate_id)
+        return history[-1] if history else None
+
+    def data_version(self):
+        """
+        Return a hashable token that changes whenever stored events change,
+        or None when the backend has no cheap way to tell (callers must not cache).
+        """
+        return None
+
+    def close(self):
+        """Release background resources when the repository is replaced; buffered writes are flushed."""
+        return None
@@ -5,18 +5,24 @@ from repositories.candidate_event_repo import CandidateEventRepo
 class CSVCandidateEventRepo(CandidateEventRepo):
     """CSV-backed candidate event repository (current default backend)."""
 
-    def __init__(self, base_folder="Verified_Resumes", server_url="http://127.0.0.1:5000"):
-        self._manager = CSVManager(base_folder=base_folder, server_url=server_url)
+    def __init__(self, base_folder="Verified_Resumes", server_url="http://127.0.0.1:5000", coalesce_writes=False):
+        self._manager = CSVManager(base_folder=base_folder, server_url=server_url, coalesce_writes=coalesce_writes)
 
     def log_event(self, *args, **kwargs):
         return self._manager.log_event(*args, **kwargs)
 
+    def log_events(self, *args, **kwargs):
+        return self._manager.log_events(*args, **kwargs)
+
     def get_latest_status_per_candidate(self, *args, **kwargs):
         return self._manager.get_latest_status_per_candidate(*args, **kwargs)
 
     def get_candidate_history(self, *args, **kwargs):
         return self._manager.get_candidate_history(*args, **kwargs)
 
+    def get_latest_candidate_row(self, *args, **kwargs):
+        return self._manager.get_latest_candidate_row(*args, **kwargs)
+
     def log_status_change(self, *args, **kwargs):
         return self._manager.log_status_change(*args, **kwargs)
 
@@ -34,3 +40,12 @@ class CSVCandidateEventRepo(CandidateEventRepo):
 
     def get_ai_search_audit_rows(self, *args, **kwargs):
         return self._manager.get_ai_search_audit_rows(*args, **kwargs)
+
+    def data_version(self):
+        return self._manager.data_version()
+
+    def flush_pending(self):
+        return self._manager.flush_pending()
+
+    def close(self):
+        return self._manager.close()
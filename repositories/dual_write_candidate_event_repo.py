@@ -128,6 +128,12 @@ class DualWriteCandidateEventRepo(CandidateEventRepo):
                 return primary
         return preferred
 
+    def get_latest_candidate_row(self, candidate_id):
+        preferred = self.read_repo.get_latest_candidate_row(candidate_id)
+        if self.read_repo is self.secondary_repo and not preferred:
+            return self.primary_repo.get_latest_candidate_row(candidate_id)
+        return preferred
+
     def log_status_change(self, *args, **kwargs):
         primary_ok = self.primary_repo.log_status_change(*args, **kwargs)
         if primary_ok:
@@ -194,3 +200,16 @@ class DualWriteCandidateEventRepo(CandidateEventRepo):
             stats["write_mode"] = "dual_write"
             stats["read_mode"] = type(self.read_repo).__name__
         return stats
+
+    def data_version(self):
+        # Secondary reads can fall back to the primary store, so no single token covers them.
+        if self.read_repo is self.secondary_repo:
+            return None
+        reader = getattr(self.read_repo, "data_version", None)
+        return reader() if callable(reader) else None
+
+    def close(self):
+        for repo in (self.primary_repo, self.secondary_repo):
+            closer = getattr(repo, "close", None)
+            if callable(closer):
+                closer()
@@ -15,7 +15,8 @@ def build_candidate_event_repo(flags, base_folder="Verified_Resumes", server_url
     Build candidate event repository for current runtime flags.
     Supabase adapter will be added in the next phase; CSV remains default.
     """
-    csv_repo = CSVCandidateEventRepo(base_folder=base_folder, server_url=server_url)
+    # Status/note appends from the dashboard are coalesced; reads flush them first.
+    csv_repo = CSVCandidateEventRepo(base_folder=base_folder, server_url=server_url, coalesce_writes=True)
 
     if not getattr(flags, "use_supabase_db", False):
         return csv_repo
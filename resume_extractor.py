@@ -2,7 +2,6 @@
 
 import re
 import os
-import PyPDF2
 
 class ResumeExtractor:
     """Extracts structured data from SeaJob resumes"""
@@ -177,6 +176,8 @@ class ResumeExtractor:
     def extract_text_from_pdf(self, pdf_path):
         """Extract text from PDF file"""
         try:
+            import PyPDF2
+
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 text = ""
@@ -4,6 +4,8 @@ import re
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -52,7 +54,7 @@ def _should_run_chrome_headless():
 
 
 class Scraper:
-    def __init__(self, download_folder, otp_window_seconds=120, login_url=DEFAULT_LOGIN_URL, dashboard_url=DEFAULT_DASHBOARD_URL):
+    def __init__(self, download_folder, otp_window_seconds=120, login_url=DEFAULT_LOGIN_URL, dashboard_url=DEFAULT_DASHBOARD_URL, download_concurrency=2):
         self.driver = None
         self.wait = None
         self.base_download_folder = download_folder
@@ -61,6 +63,9 @@ class Scraper:
         self.otp_pending = False
         self.login_url = login_url or DEFAULT_LOGIN_URL
         self.dashboard_url = dashboard_url or DEFAULT_DASHBOARD_URL
+        # The WebDriver is single-threaded; only decoding and saving captured PDFs fans out.
+        self.download_concurrency = max(1, int(download_concurrency or 1))
+        self._manifest_lock = threading.Lock()
 
     def _setup_driver(self):
         options = webdriver.ChromeOptions()
@@ -236,9 +241,8 @@ class Scraper:
                         return {"success": False, "message": "Session reset or OTP expired. Please request a new OTP."}
                     return {"success": False, "message": f"Login failed (unknown reason): {str(e)}"}
 
-    def _save_page_as_pdf(self, folder, filename):
-        os.makedirs(folder, exist_ok=True)
-        file_path = os.path.join(folder, filename)
+    def _capture_page_pdf(self):
+        """Print the current page to PDF and return Chrome's base64 payload, or None on failure."""
         try:
             self._sanitize_resume_page_before_pdf()
             result = self.driver.execute_cdp_cmd(
@@ -248,9 +252,26 @@ class Scraper:
                     "displayHeaderFooter": False
                 }
             )
-            with open(file_path, "wb") as f: f.write(base64.b64decode(result['data']))
-            return True
-        except Exception: return False
+            return result['data']
+        except Exception: return None
+
+    def _write_resume_pdf(self, logger, target_folder, pdf_filename, pdf_data, rank, ship_type, candidate_id):
+        """Decode a captured PDF, save it and record it in the rank manifest (runs on a writer thread)."""
+        try:
+            os.makedirs(target_folder, exist_ok=True)
+            with open(os.path.join(target_folder, pdf_filename), "wb") as f: f.write(base64.b64decode(pdf_data))
+            self._record_download_metadata(target_folder, pdf_filename, rank, ship_type, candidate_id)
+        except Exception as e:
+            logger.error(f"  -> Error saving {pdf_filename}: {str(e)}")
+            return False
+        logger.info(f"  -> Saved: {pdf_filename}")
+        return True
+
+    def _settle_pending_write(self, candidate_id, existing_ids, pending_writes):
+        """Wait for an in-flight save of candidate_id; only a successful save marks it processed."""
+        pending = pending_writes.pop(candidate_id, None)
+        if pending is not None and pending.result():
+            existing_ids.add(candidate_id)
 
     def _rank_manifest_path(self, target_folder):
         return os.path.join(target_folder, "manifest.json")
@@ -280,23 +301,24 @@ class Scraper:
         os.replace(temp_path, manifest_path)
 
     def _record_download_metadata(self, target_folder, filename, rank, ship_type, candidate_id):
-        manifest = self._load_rank_manifest(target_folder)
-        files = manifest.setdefault("files", {})
-        entry = files.get(filename) or {}
-        ship_types = entry.get("applied_ship_types")
-        if not isinstance(ship_types, list):
-            ship_types = []
-        normalized_ship_type = str(ship_type or "").strip()
-        if normalized_ship_type and normalized_ship_type not in ship_types:
-            ship_types.append(normalized_ship_type)
-            ship_types.sort()
-        entry.update({
-            "candidate_id": str(candidate_id or "").strip(),
-            "rank": str(rank or "").strip(),
-            "applied_ship_types": ship_types,
-        })
-        files[filename] = entry
-        self._save_rank_manifest(target_folder, manifest)
+        with self._manifest_lock:
+            manifest = self._load_rank_manifest(target_folder)
+            files = manifest.setdefault("files", {})
+            entry = files.get(filename) or {}
+            ship_types = entry.get("applied_ship_types")
+            if not isinstance(ship_types, list):
+                ship_types = []
+            normalized_ship_type = str(ship_type or "").strip()
+            if normalized_ship_type and normalized_ship_type not in ship_types:
+                ship_types.append(normalized_ship_type)
+                ship_types.sort()
+            entry.update({
+                "candidate_id": str(candidate_id or "").strip(),
+                "rank": str(rank or "").strip(),
+                "applied_ship_types": ship_types,
+            })
+            files[filename] = entry
+            self._save_rank_manifest(target_folder, manifest)
 
     def _candidate_file_exists(self, target_folder, rank, ship_type, candidate_id):
         """
@@ -352,7 +374,7 @@ class Scraper:
         self.driver.execute_script(script)
         time.sleep(0.15)
 
-    def _process_single_list(self, logger, rank, ship_type, target_folder, existing_ids, force_redownload):
+    def _process_single_list(self, logger, rank, ship_type, target_folder, existing_ids, pending_writes, force_redownload, writer):
         page_number = 1
         while True:
             logger.info(f"--- Processing page {page_number} ---")
@@ -380,6 +402,7 @@ class Scraper:
                 raw_id = id_match.group(1)
                 candidate_id = base64.b64decode(raw_id).decode('utf-8') if not raw_id.isdigit() else raw_id
 
+                self._settle_pending_write(candidate_id, existing_ids, pending_writes)
                 if candidate_id in existing_ids:
                     logger.info(f"Skipping {candidate_id} - already processed this session")
                     continue
@@ -406,10 +429,12 @@ class Scraper:
                     )
                     self.driver.switch_to.window(new_window)
                     self.wait.until(EC.visibility_of_element_located((By.XPATH, DOWNLOAD_PAGE_CONTENT_VERIFICATION_XPATH)))
-                    if self._save_page_as_pdf(target_folder, pdf_filename):
-                        self._record_download_metadata(target_folder, pdf_filename, rank, ship_type, candidate_id)
-                        logger.info(f"  -> Saved: {pdf_filename}")
-                        existing_ids.add(candidate_id)
+                    pdf_data = self._capture_page_pdf()
+                    if pdf_data:
+                        pending_writes[candidate_id] = writer.submit(
+                            self._write_resume_pdf,
+                            logger, target_folder, pdf_filename, pdf_data, rank, ship_type, candidate_id,
+                        )
                 except Exception as e:
                     logger.error(f"  -> Error on candidate {candidate_id}: {str(e)}")
                 finally:
@@ -457,20 +482,25 @@ class Scraper:
             rank_folder_name = rank.replace(' ', '_').replace('/', '-')
             target_folder = os.path.join(self.base_download_folder, rank_folder_name)
             existing_ids = set()
-
-            for candidate_list in lists_to_process:
-                logger.info(f"\n--- Processing List: {candidate_list['name']} ---")
-                self.driver.get(candidate_list['url'])
-                
-                old_table = self.wait.until(EC.presence_of_element_located((By.ID, RESULTS_TABLE_ID)))
-                
-                Select(self.wait.until(EC.presence_of_element_located((By.ID, RANK_FILTER_ID)))).select_by_visible_text(rank)
-                Select(self.wait.until(EC.presence_of_element_located((By.ID, SHIP_TYPE_FILTER_ID)))).select_by_visible_text(ship_type)
-                self.driver.find_element(By.ID, FILTER_SUBMIT_BUTTON_ID).click()
-                
-                self.wait.until(EC.staleness_of(old_table))
-                
-                self._process_single_list(logger, rank, ship_type, target_folder, existing_ids, force_redownload)
+            # candidate_id -> Future of its PDF save; settled before the id is seen again.
+            pending_writes = {}
+
+            # Saving a PDF overlaps with the browser fetching the next candidate; leaving the
+            # block waits for every pending write before the run is reported as finished.
+            with ThreadPoolExecutor(max_workers=self.download_concurrency, thread_name_prefix="resume-writer") as writer:
+                for candidate_list in lists_to_process:
+                    logger.info(f"\n--- Processing List: {candidate_list['name']} ---")
+                    self.driver.get(candidate_list['url'])
+                    
+                    old_table = self.wait.until(EC.presence_of_element_located((By.ID, RESULTS_TABLE_ID)))
+                    
+                    Select(self.wait.until(EC.presence_of_element_located((By.ID, RANK_FILTER_ID)))).select_by_visible_text(rank)
+                    Select(self.wait.until(EC.presence_of_element_located((By.ID, SHIP_TYPE_FILTER_ID)))).select_by_visible_text(ship_type)
+                    self.driver.find_element(By.ID, FILTER_SUBMIT_BUTTON_ID).click()
+                    
+                    self.wait.until(EC.staleness_of(old_table))
+                    
+                    self._process_single_list(logger, rank, ship_type, target_folder, existing_ids, pending_writes, force_redownload, writer)
             
             message = "Download process completed for all lists."
             logger.info(message)
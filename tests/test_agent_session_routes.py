@@ -9,9 +9,10 @@ from unittest.mock import patch
 class _FakeScraper:
     last_instance = None
 
-    def __init__(self, download_folder, otp_window_seconds, login_url, dashboard_url):
+    def __init__(self, download_folder, otp_window_seconds, login_url, dashboard_url, download_concurrency=2):
         self.download_folder = download_folder
         self.otp_window_seconds = otp_window_seconds
+        self.download_concurrency = download_concurrency
         self.login_url = login_url
         self.dashboard_url = dashboard_url
         self.started_with = None
@@ -457,7 +457,9 @@ class AISearchRefinementScopeRouteTests(unittest.TestCase):
             first_chunk = next(response.response)
             if isinstance(first_chunk, bytes):
                 first_chunk = first_chunk.decode("utf-8")
-            self.assertIn('"type": "status"', first_chunk)
+            self.assertTrue(first_chunk.startswith("data: "))
+            frame = json.loads(first_chunk[len("data: "):])
+            self.assertEqual(frame["type"], "status")
             response.close()
 
         with patch("backend_server._build_analyzer") as build_analyzer:
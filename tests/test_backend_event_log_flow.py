@@ -2,6 +2,7 @@ import io
 import hashlib
 import json
 import os
+import sqlite3
 import sys
 import types
 import zipfile
@@ -163,6 +164,7 @@ class BackendEventLogFlowTests(unittest.TestCase):
         backend_server.present_rank_index_rebuild_lock = backend_server.threading.Lock()
         self.temp_dir.cleanup()
         backend_server.cloud_auth_state_cache.update({"ts": 0, "mode": "local", "reason": "not_checked"})
+        backend_server._invalidate_cloud_users_cache()
 
     def _write_fake_resume(self, filename):
         path = self.rank_dir / filename
@@ -366,6 +368,29 @@ class BackendEventLogFlowTests(unittest.TestCase):
         self.assertEqual(usage_payload["rank_folders"], ["2nd_Engineer", "Chief_Officer"])
         self.assertEqual(usage_payload["rank_folder_by_filename_count"], 2)
 
+    def test_verify_resumes_skips_duplicate_filenames(self):
+        self._write_fake_resume("Chief_Officer_1151.pdf")
+        extracted = []
+        original_extract = backend_server.resume_extractor.extract_resume_data
+
+        def counting_extract(pdf_path, candidate_id=None, match_reason=""):
+            extracted.append(os.path.basename(pdf_path))
+            return original_extract(pdf_path, candidate_id=candidate_id, match_reason=match_reason)
+
+        backend_server.resume_extractor.extract_resume_data = counting_extract
+        resp = self.client.post("/verify_resumes", json={
+            "rank_folder": self.rank,
+            "filenames": ["Chief_Officer_1151.pdf", "Chief_Officer_1151.pdf"],
+        })
+
+        self.assertEqual(resp.status_code, 200)
+        body = resp.get_json()
+        self.assertEqual(body["processed"], 1)
+        self.assertEqual(body["csv_exports"], 1)
+        self.assertEqual(extracted, ["Chief_Officer_1151.pdf"])
+        df = self._read_master_csv()
+        self.assertEqual(df["Event_Type"].tolist(), ["initial_verification"])
+
     def test_verify_resumes_rejects_invalid_cross_folder_rank_map(self):
         self._write_fake_resume("Chief_Officer_1201.pdf")
 
@@ -439,6 +464,19 @@ class BackendEventLogFlowTests(unittest.TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertIn(b"ReactVersion", resp.data)
 
+    def test_app_asset_route_serves_cacheable_logo(self):
+        resp = self.client.get("/app_asset/Truncated_Njord_logo.jpg")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("max-age=86400", resp.headers.get("Cache-Control", ""))
+        etag = resp.headers["ETag"]
+        resp.close()
+
+        revalidated = self.client.get("/app_asset/Truncated_Njord_logo.jpg", headers={"If-None-Match": etag})
+        self.assertEqual(revalidated.status_code, 304)
+
+        self.assertEqual(self.client.get("/app_asset/missing_logo.png").status_code, 404)
+        self.assertEqual(self.client.get("/app_asset/backend_server.py").status_code, 400)
+
     def test_status_and_notes_append_new_events(self):
         self._write_fake_resume("Chief_Officer_2001.pdf")
         self.client.post("/verify_resumes", json={
@@ -461,12 +499,28 @@ class BackendEventLogFlowTests(unittest.TestCase):
 
         history_resp = self.client.get("/get_candidate_history/2001")
         self.assertEqual(history_resp.status_code, 200)
-        history = history_resp.get_json()["history"]
+        history_body = history_resp.get_json()
+        self.assertEqual(history_body["candidate_id"], "2001")
+        history = history_body["history"]
+        self.assertEqual(history_body["count"], len(history))
         event_types = [row["Event_Type"] for row in history]
         self.assertIn("initial_verification", event_types)
         self.assertIn("status_change", event_types)
         self.assertIn("note_added", event_types)
 
+    def test_status_and_notes_reject_non_ascii_or_oversized_candidate_ids(self):
+        with self.client.session_transaction() as sess:
+            sess["username"] = "recruiter"
+            sess["role"] = "recruiter"
+
+        for candidate_id in ("", "12a", "١٢", "1" * 13):
+            status_resp = self.client.post("/update_status", json={"candidate_id": candidate_id, "status": "Contacted"})
+            self.assertEqual(status_resp.status_code, 400)
+            self.assertEqual(status_resp.get_json()["message"], "Invalid candidate_id")
+            notes_resp = self.client.post("/add_notes", json={"candidate_id": candidate_id, "notes": "hello"})
+            self.assertEqual(notes_resp.status_code, 400)
+            self.assertEqual(notes_resp.get_json()["message"], "Invalid candidate_id")
+
     def test_status_transition_blocks_non_admin_revert_or_skip(self):
         self._write_fake_resume("Chief_Officer_2101.pdf")
         self.client.post("/verify_resumes", json={
@@ -533,6 +587,61 @@ class BackendEventLogFlowTests(unittest.TestCase):
         self.assertGreaterEqual(archive_count, 1)
         self.assertGreaterEqual(active_count, 0)
 
+    def test_dashboard_payload_cached_until_event_log_changes(self):
+        self._write_fake_resume("Chief_Officer_2651.pdf")
+        with self.client.session_transaction() as sess:
+            sess["username"] = "admin"
+            sess["role"] = "admin"
+        self.client.post("/verify_resumes", json={
+            "rank_folder": self.rank,
+            "filenames": ["Chief_Officer_2651.pdf"],
+        })
+
+        loader = backend_server.csv_manager.get_latest_status_per_candidate
+        with patch.object(
+            backend_server.csv_manager,
+            "get_latest_status_per_candidate",
+            side_effect=loader,
+        ) as latest_mock:
+            first = self.client.get("/get_dashboard_data?view=master").get_json()
+            second = self.client.get("/get_dashboard_data?view=master").get_json()
+            self.assertEqual(first, second)
+            self.assertEqual(latest_mock.call_count, 1)
+
+            self.client.post("/add_notes", json={"candidate_id": "2651", "notes": "called back"})
+            third = self.client.get("/get_dashboard_data?view=master").get_json()
+            self.assertEqual(latest_mock.call_count, 2)
+
+        notes = {str(row["candidate_id"]): row["notes"] for row in third["data"]}
+        self.assertEqual(notes["2651"], "called back")
+
+    def test_dashboard_and_ranks_honor_if_none_match(self):
+        self._write_fake_resume("Chief_Officer_2652.pdf")
+        with self.client.session_transaction() as sess:
+            sess["username"] = "admin"
+            sess["role"] = "admin"
+        self.client.post("/verify_resumes", json={
+            "rank_folder": self.rank,
+            "filenames": ["Chief_Officer_2652.pdf"],
+        })
+
+        for url in ("/get_dashboard_data?view=master", "/get_available_ranks?scope=active"):
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200)
+            etag = first.headers["ETag"]
+            self.assertTrue(etag.startswith('W/"'))
+
+            revalidated = self.client.get(url, headers={"If-None-Match": etag})
+            self.assertEqual(revalidated.status_code, 304)
+            self.assertEqual(revalidated.data, b"")
+            self.assertEqual(revalidated.headers["ETag"], etag)
+
+        stale_etag = self.client.get("/get_dashboard_data?view=master").headers["ETag"]
+        self.client.post("/add_notes", json={"candidate_id": "2652", "notes": "called back"})
+        changed = self.client.get("/get_dashboard_data?view=master", headers={"If-None-Match": stale_etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], stale_etag)
+
     def test_dashboard_archive_visible_to_admin_manager_recruiter(self):
         self._write_fake_resume("Chief_Officer_2602.pdf")
         with self.client.session_transaction() as sess:
@@ -602,7 +711,7 @@ class BackendEventLogFlowTests(unittest.TestCase):
 
         try:
             with patch.object(backend_server, "_disconnect_seajobs_best_effort") as disconnect_mock, \
-                patch("backend_server.requests.request", return_value=DummyResponse()) as request_mock:
+                patch.object(backend_server._AGENT_HTTP, "request", return_value=DummyResponse()) as request_mock:
                 resp = self.client.get("/session_health")
         finally:
             backend_server.feature_flags = prev_feature_flags
@@ -641,6 +750,35 @@ class BackendEventLogFlowTests(unittest.TestCase):
         self.assertEqual(me_resp.status_code, 200)
         self.assertFalse(me_resp.get_json().get("authenticated"))
 
+    def test_start_session_quits_previous_scraper_before_installing_new_one(self):
+        class FakeScraper:
+            def __init__(self, *_args, **_kwargs):
+                self.driver = object()
+                self.quit_called = False
+
+            def quit(self):
+                self.quit_called = True
+
+            def start_session(self, *_args):
+                return {"success": True, "message": "OTP sent"}
+
+        previous = FakeScraper()
+        backend_server.scraper_session = previous
+        with self.client.session_transaction() as sess:
+            sess["username"] = "admin"
+            sess["role"] = "admin"
+
+        try:
+            with patch.object(sys.modules["scraper_engine"], "Scraper", FakeScraper):
+                resp = self.client.post("/start_session", json={"mobileNumber": "9999999999"})
+            self.assertEqual(resp.status_code, 200)
+            self.assertTrue(resp.get_json().get("success"))
+            self.assertTrue(previous.quit_called)
+            self.assertIsInstance(backend_server.scraper_session, FakeScraper)
+            self.assertIsNot(backend_server.scraper_session, previous)
+        finally:
+            backend_server.scraper_session = None
+
     def test_reverify_same_candidate_logs_resume_updated(self):
         resume = self._write_fake_resume("Chief_Officer_3001.pdf")
         self.client.post("/verify_resumes", json={
@@ -740,6 +878,109 @@ class BackendEventLogFlowTests(unittest.TestCase):
             self.assertIn("4001", csv_data)
             self.assertIn("4002", csv_data)
 
+            self.assertEqual(archive.getinfo("selected_candidates.csv").compress_type, zipfile.ZIP_DEFLATED)
+            pdf_info = archive.getinfo(f"resumes/{self.rank}/Chief_Officer_4001.pdf")
+            self.assertEqual(pdf_info.compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(
+                archive.read(pdf_info),
+                (self.rank_dir / "Chief_Officer_4001.pdf").read_bytes(),
+            )
+
+    def test_export_streams_large_resumes_in_chunks(self):
+        self._write_fake_resume("Chief_Officer_4051.pdf")
+        self.client.post("/verify_resumes", json={
+            "rank_folder": self.rank,
+            "filenames": ["Chief_Officer_4051.pdf"],
+        })
+
+        with patch.object(backend_server, "_EXPORT_PREFETCH_MAX_BYTES", 0), \
+                patch.object(backend_server, "_EXPORT_COPY_CHUNK_BYTES", 4):
+            resp = self.client.post("/export_resumes", json={"candidate_ids": ["4051"]})
+            zip_bytes = resp.data
+        self.assertEqual(resp.status_code, 200)
+
+        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+            pdf_info = archive.getinfo(f"resumes/{self.rank}/Chief_Officer_4051.pdf")
+            self.assertEqual(pdf_info.compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(
+                archive.read(pdf_info),
+                (self.rank_dir / "Chief_Officer_4051.pdf").read_bytes(),
+            )
+
+    def test_export_reports_missing_resume_files_in_headers(self):
+        self._write_fake_resume("Chief_Officer_4101.pdf")
+        removed = self._write_fake_resume("Chief_Officer_4102.pdf")
+        self.client.post("/verify_resumes", json={
+            "rank_folder": self.rank,
+            "filenames": ["Chief_Officer_4101.pdf", "Chief_Officer_4102.pdf"],
+        })
+        removed.unlink()
+
+        resp = self.client.post("/export_resumes", json={"candidate_ids": ["4101", "4102"]})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.headers["X-Included-Files"], "1")
+        self.assertEqual(resp.headers["X-Missing-Files"], "1")
+        self.assertEqual(json.loads(resp.headers["X-Missing-Files-Preview"]), ["Chief_Officer_4102.pdf"])
+        with zipfile.ZipFile(io.BytesIO(resp.data)) as archive:
+            self.assertEqual(
+                sorted(archive.namelist()),
+                ["resumes/Chief_Officer/Chief_Officer_4101.pdf", "selected_candidates.csv"],
+            )
+
+    def test_export_skips_resume_removed_after_listing_and_keeps_zip_valid(self):
+        self._write_fake_resume("Chief_Officer_4151.pdf")
+        self._write_fake_resume("Chief_Officer_4152.pdf")
+        self.client.post("/verify_resumes", json={
+            "rank_folder": self.rank,
+            "filenames": ["Chief_Officer_4151.pdf", "Chief_Officer_4152.pdf"],
+        })
+        list_folder = backend_server._list_folder_file_names
+
+        for prefetch_max in (backend_server._EXPORT_PREFETCH_MAX_BYTES, 0):
+            removed = self._write_fake_resume("Chief_Officer_4152.pdf")
+
+            def list_then_remove(folder):
+                names = list_folder(folder)
+                removed.unlink()
+                return names
+
+            with patch.object(backend_server, "_list_folder_file_names", side_effect=list_then_remove), \
+                    patch.object(backend_server, "_EXPORT_PREFETCH_MAX_BYTES", prefetch_max):
+                resp = self.client.post("/export_resumes", json={"candidate_ids": ["4151", "4152"]})
+                zip_bytes = resp.data
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.headers["X-Included-Files"], "2")
+
+            with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+                self.assertIsNone(archive.testzip())
+                self.assertEqual(
+                    sorted(archive.namelist()),
+                    [
+                        "missing_files.txt",
+                        "resumes/Chief_Officer/Chief_Officer_4151.pdf",
+                        "selected_candidates.csv",
+                    ],
+                )
+                manifest = archive.read("missing_files.txt").decode("utf-8")
+                self.assertIn("resumes/Chief_Officer/Chief_Officer_4152.pdf", manifest)
+
+    def test_export_selects_ids_for_integer_and_string_id_columns(self):
+        self._write_fake_resume("Chief_Officer_4201.pdf")
+        self._write_fake_resume("Chief_Officer_4202.pdf")
+        self.client.post("/verify_resumes", json={
+            "rank_folder": self.rank,
+            "filenames": ["Chief_Officer_4201.pdf", "Chief_Officer_4202.pdf"],
+        })
+        latest = backend_server.csv_manager.get_latest_status_per_candidate()
+        self.assertEqual(latest["Candidate_ID"].dtype.kind, "i")
+
+        for frame in (latest, latest.astype({"Candidate_ID": "string"}), latest.astype({"Candidate_ID": object})):
+            with patch.object(backend_server.csv_manager, "get_latest_status_per_candidate", return_value=frame):
+                resp = self.client.post("/export_resumes", json={"candidate_ids": [4201, " 4201 ", "04202"]})
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.headers["X-Exported-Count"], "1")
+            self.assertEqual(resp.headers["X-Included-Files"], "1")
+
     def test_session_health_reports_disconnected_without_session(self):
         backend_server.scraper_session = None
         resp = self.client.get("/session_health")
@@ -800,7 +1041,7 @@ class BackendEventLogFlowTests(unittest.TestCase):
         prev_feature_flags = backend_server.feature_flags
         backend_server.feature_flags = replace(backend_server.feature_flags, use_local_agent=True)
         try:
-            with patch("backend_server.requests.get", return_value=DummyResponse()) as mock_get:
+            with patch.object(backend_server._AGENT_HTTP, "get", return_value=DummyResponse()) as mock_get:
                 old_base = os.environ.get("NJORDHR_AGENT_BASE_URL")
                 os.environ["NJORDHR_AGENT_BASE_URL"] = "http://127.0.0.1:5053"
                 try:
@@ -860,7 +1101,7 @@ class BackendEventLogFlowTests(unittest.TestCase):
         try:
             with self.client.session_transaction() as sess:
                 sess.clear()
-            with patch("backend_server.requests.get", return_value=DummyResponse()) as mock_get:
+            with patch.object(backend_server._AGENT_HTTP, "get", return_value=DummyResponse()) as mock_get:
                 resp = self.client.get("/config/runtime")
         finally:
             backend_server.feature_flags = prev_feature_flags
@@ -877,6 +1118,83 @@ class BackendEventLogFlowTests(unittest.TestCase):
         self.assertTrue(data["cloud_api"]["ready"])
         mock_get.assert_called_once()
 
+    def test_resolve_within_base_rejects_traversal_and_sibling_prefixes(self):
+        base = self.download_root.as_posix()
+        self.assertEqual(backend_server._resolve_within_base(base), os.path.abspath(base))
+        self.assertEqual(
+            backend_server._resolve_within_base(base, self.rank, "a.pdf"),
+            os.path.join(os.path.abspath(base), self.rank, "a.pdf"),
+        )
+        sibling = os.path.basename(os.path.abspath(base)) + "_other"
+        for parts in (("..",), ("..", sibling, "a.pdf"), (self.rank, "..", "..", "x")):
+            with self.subTest(parts=parts):
+                with self.assertRaises(ValueError):
+                    backend_server._resolve_within_base(base, *parts)
+
+    def test_runtime_config_revalidates_unchanged_payload_with_etag(self):
+        with self.client.session_transaction() as sess:
+            sess.clear()
+
+        first = self.client.get("/config/runtime")
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers.get("ETag")
+        self.assertTrue(etag)
+        self.assertEqual(first.headers.get("Cache-Control"), "private, no-cache")
+
+        repeat = self.client.get("/config/runtime", headers={"If-None-Match": etag})
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.data, b"")
+
+        stale = self.client.get("/config/runtime", headers={"If-None-Match": '"stale"'})
+        self.assertEqual(stale.status_code, 200)
+        self.assertTrue(stale.get_json()["success"])
+
+    def test_ingest_idempotency_db_uses_one_wal_connection(self):
+        db_path = str(self.base / "agent_sync_ingest.sqlite3")
+        self.addCleanup(backend_server._close_agent_sync_connection)
+        with patch.object(backend_server, "_agent_sync_db_path", return_value=db_path):
+            self.assertFalse(backend_server._ingest_seen_idempotency("key-1"))
+            shared_conn = backend_server._agent_sync_conn["conn"]
+            backend_server._ingest_store_idempotency("key-1", "/api/agent/job-log")
+            self.assertTrue(backend_server._ingest_seen_idempotency("key-1"))
+            self.assertIs(backend_server._agent_sync_conn["conn"], shared_conn)
+
+        conn = sqlite3.connect(db_path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            table_sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'ingest_idempotency'"
+            ).fetchone()[0]
+            self.assertIn("WITHOUT ROWID", table_sql)
+        finally:
+            conn.close()
+
+    def test_ingest_idempotency_store_prunes_expired_keys_periodically(self):
+        db_path = str(self.base / "agent_sync_prune.sqlite3")
+        self.addCleanup(backend_server._close_agent_sync_connection)
+        with patch.object(backend_server, "_agent_sync_db_path", return_value=db_path), \
+                patch.object(backend_server, "_ingest_idempotency_stores", backend_server.itertools.count(1)), \
+                patch.object(backend_server, "_INGEST_IDEMPOTENCY_PRUNE_EVERY", 2):
+            self.assertFalse(backend_server._ingest_seen_idempotency("fresh"))
+            with backend_server._agent_sync_lock:
+                backend_server._agent_sync_connection().execute(
+                    backend_server._INGEST_IDEMPOTENCY_STORE_SQL,
+                    ("expired", "/api/agent/job-log", "2000-01-01T00:00:00Z"),
+                )
+            backend_server._ingest_store_idempotency("fresh", "/api/agent/job-log")
+            self.assertTrue(backend_server._ingest_seen_idempotency("expired"))
+
+            backend_server._ingest_store_idempotency("fresh-2", "/api/agent/job-log")
+            self.assertFalse(backend_server._ingest_seen_idempotency("expired"))
+            self.assertTrue(backend_server._ingest_seen_idempotency("fresh"))
+
+    def test_jsonify_encodes_numpy_scalars_and_dates(self):
+        with backend_server.app.app_context():
+            resp = backend_server.jsonify({"count": pd.Series([7]).iloc[0], "day": date(2024, 1, 2)})
+        self.assertEqual(resp.mimetype, "application/json")
+        self.assertTrue(resp.data.endswith(b"\n"))
+        self.assertEqual(json.loads(resp.data), {"count": 7, "day": "Tue, 02 Jan 2024 00:00:00 GMT"})
+
     def test_build_analyzer_threads_feature_flags_into_analyzer(self):
         captured = {}
 
@@ -900,6 +1218,32 @@ class BackendEventLogFlowTests(unittest.TestCase):
             backend_server.Analyzer = original_analyzer
             backend_server._active_download_root = original_active_download_root
 
+    def test_build_analyzer_reuses_wrapper_while_shared_instance_is_live(self):
+        built = []
+
+        class SingletonAnalyzer:
+            _instance = None
+
+            def __init__(self, config, *, feature_flags=None):
+                built.append(config)
+                if SingletonAnalyzer._instance is None:
+                    SingletonAnalyzer._instance = object()
+
+        original_analyzer = backend_server.Analyzer
+        try:
+            backend_server.Analyzer = SingletonAnalyzer
+            first = backend_server._build_analyzer()
+            self.assertIs(backend_server._build_analyzer(), first)
+            self.assertEqual(len(built), 1)
+
+            SingletonAnalyzer._instance = None
+            rebuilt = backend_server._build_analyzer()
+            self.assertIsNot(rebuilt, first)
+            self.assertEqual(len(built), 2)
+        finally:
+            backend_server.Analyzer = original_analyzer
+            backend_server._analyzer_wrapper = None
+
     def test_runtime_ready_reports_unauthenticated_backend_identity(self):
         with self.client.session_transaction() as sess:
             sess.clear()
@@ -988,14 +1332,41 @@ class BackendEventLogFlowTests(unittest.TestCase):
         resume_resp = self.client.get("/get_resume/Chief_Officer/Chief_Officer_9999.pdf")
         self.assertEqual(resume_resp.status_code, 403)
 
+    def test_get_resume_falls_back_to_file_in_another_rank_folder(self):
+        self.client.post("/auth/login", json={"username": "admin", "password": "test-admin-token"})
+        self._write_fake_resume("Chief_Officer_9123.pdf")
+
+        resp = self.client.get("/get_resume/Renamed_Rank/Chief_Officer_9123.pdf")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data, b"%PDF-1.4 fake resume content")
+        resp.close()
+
+        missing = self.client.get("/get_resume/Renamed_Rank/Chief_Officer_0000.pdf")
+        self.assertEqual(missing.status_code, 404)
+
+    def test_find_file_by_name_rebuilds_index_when_cached_path_moves(self):
+        self._write_fake_resume("Chief_Officer_9124.pdf")
+        base_dir = str(self.download_root)
+        original = backend_server._find_file_by_name(base_dir, "Chief_Officer_9124.pdf")
+        self.assertTrue(original and os.path.isfile(original))
+
+        moved_dir = self.download_root / "Renamed_Rank"
+        moved_dir.mkdir(parents=True, exist_ok=True)
+        moved = moved_dir / "Chief_Officer_9124.pdf"
+        os.replace(original, moved)
+
+        self.assertEqual(backend_server._find_file_by_name(base_dir, "Chief_Officer_9124.pdf"), str(moved))
+        self.assertIsNone(backend_server._find_file_by_name(base_dir, "Chief_Officer_0001.pdf"))
+
     def test_download_stream_reports_error_when_session_missing(self):
         self.client.post("/auth/login", json={"username": "admin", "password": "test-admin-token"})
         backend_server.scraper_session = None
         resp = self.client.get("/download_stream?rank=Chief_Officer&shipType=Bulk%20Carrier")
         self.assertEqual(resp.status_code, 200)
-        payload = resp.get_data(as_text=True)
-        self.assertIn('"type": "error"', payload)
-        self.assertIn("Website session is not active or has expired", payload)
+        events = _sse_events(resp)
+        errors = [event for event in events if event["type"] == "error"]
+        self.assertTrue(errors)
+        self.assertIn("Website session is not active or has expired", errors[0]["message"])
 
     def test_download_stream_emits_complete_event_for_valid_session(self):
         self.client.post("/auth/login", json={"username": "admin", "password": "test-admin-token"})
@@ -1013,16 +1384,46 @@ class BackendEventLogFlowTests(unittest.TestCase):
 
             def download_resumes(self, rank, ship_type, force_redownload, logger):
                 logger.info(f"Downloading for {rank} / {ship_type} force={force_redownload}")
+                for page in range(1, 4):
+                    logger.info(f"Fetched page {page}")
                 return {"success": True, "message": "Download done", "log": []}
 
         backend_server.scraper_session = DummySession()
         resp = self.client.get("/download_stream?rank=Chief_Officer&shipType=Bulk%20Carrier&forceRedownload=true")
         self.assertEqual(resp.status_code, 200)
-        payload = resp.get_data(as_text=True)
-        self.assertIn('"type": "started"', payload)
-        self.assertIn('"type": "log"', payload)
-        self.assertIn('"type": "complete"', payload)
-        self.assertIn('"success": true', payload.lower())
+        events = _sse_events(resp)
+        event_types = [event["type"] for event in events]
+        self.assertEqual(event_types[0], "started")
+        self.assertIn("log", event_types)
+        self.assertEqual(event_types[-1], "complete")
+        self.assertTrue(events[-1]["success"])
+        log_lines = [event["line"] for event in events if event["type"] == "log"]
+        page_positions = [
+            next(index for index, line in enumerate(log_lines) if f"Fetched page {page}" in line)
+            for page in range(1, 4)
+        ]
+        self.assertEqual(page_positions, sorted(page_positions))
+
+    def test_download_stream_reports_busy_while_scraper_job_running(self):
+        self.client.post("/auth/login", json={"username": "admin", "password": "test-admin-token"})
+
+        class DummySession:
+            driver = object()
+
+            def download_resumes(self, *_args, **_kwargs):
+                raise AssertionError("scraper must not run while another job holds the slot")
+
+        backend_server.scraper_session = DummySession()
+        self.assertTrue(backend_server._scraper_slot.acquire(blocking=False))
+        try:
+            resp = self.client.get("/download_stream?rank=Chief_Officer&shipType=Bulk%20Carrier")
+        finally:
+            backend_server._scraper_slot.release()
+
+        self.assertEqual(resp.status_code, 200)
+        events = _sse_events(resp)
+        self.assertEqual([event["type"] for event in events], ["error"])
+        self.assertEqual(events[0]["error_code"], "SCRAPER_BUSY")
 
     def test_resume_upload_pipeline_records_checksum_storage_and_status(self):
         file_bytes = b"%PDF-1.4 uploaded resume bytes"
@@ -1040,10 +1441,14 @@ class BackendEventLogFlowTests(unittest.TestCase):
             captured["kind"] = kind
             captured["payload"] = payload
 
+        def fake_upload(file_obj, object_path):
+            captured["uploaded_bytes"] = file_obj.read()
+            return "storage://resumes/Chief_Officer/1001/Chief_Officer_1001.pdf", ""
+
         with patch.object(
             backend_server,
             "_supabase_storage_upload",
-            return_value=("storage://resumes/Chief_Officer/1001/Chief_Officer_1001.pdf", ""),
+            side_effect=fake_upload,
         ) as upload_mock, patch.object(backend_server, "_append_agent_sync_jsonl", side_effect=fake_append):
             resp = self.client.post(
                 "/api/agent/resume-upload",
@@ -1065,6 +1470,7 @@ class BackendEventLogFlowTests(unittest.TestCase):
         upload_mock.assert_called_once()
         args, _kwargs = upload_mock.call_args
         self.assertEqual(args[1], "Chief_Officer/1001/Chief_Officer_1001.pdf")
+        self.assertEqual(captured["uploaded_bytes"], file_bytes)
         self.assertEqual(captured["kind"], "resume_upload")
         self.assertEqual(captured["payload"]["resume_storage_path"], "storage://resumes/Chief_Officer/1001/Chief_Officer_1001.pdf")
         self.assertEqual(captured["payload"]["resume_upload_status"], "uploaded")
@@ -1108,6 +1514,27 @@ class BackendEventLogFlowTests(unittest.TestCase):
         self.assertEqual(complete["type"], "complete")
         self.assertTrue(complete["success"])
 
+    def test_relay_agent_stream_reassembles_lines_split_across_chunks(self):
+        body = (
+            b": keepalive\n\n"
+            + 'data: {"type": "log", "message": "Fetched étape 1"}\n\n'.encode("utf-8")
+            + b"data: not-json\n\n"
+            + b'data: {"type": "complete", "data": {"result": {"success": true, "message": "done"}}}\n\n'
+            + b'data: {"type": "log", "message": "after completion"}\n\n'
+        )
+
+        class DummyStream:
+            def iter_content(self, chunk_size=1):
+                for start in range(0, len(body), 7):
+                    yield body[start:start + 7]
+
+        frames = list(backend_server._relay_agent_stream(DummyStream()))
+        self.assertEqual(frames[0], ": keepalive\n\n")
+        events = [json.loads(frame[len("data: "):]) for frame in frames[1:]]
+        self.assertEqual(events[0], {"type": "log", "line": "Fetched étape 1"})
+        self.assertEqual(events[1]["type"], "complete")
+        self.assertEqual(len(events), 2)
+
     def test_get_rank_folder_ship_types_reads_manifest_metadata(self):
         manifest_path = self.rank_dir / "manifest.json"
         manifest_path.write_text(json.dumps({
@@ -1381,7 +1808,7 @@ class BackendEventLogFlowTests(unittest.TestCase):
             return DummyResponse()
 
         with patch.dict(os.environ, {"NJORDHR_AGENT_SYNC_TOKEN": "agent-preview-token"}, clear=False):
-            with patch.object(backend_server.requests, "request", side_effect=fake_requests_request):
+            with patch.object(backend_server._AGENT_HTTP, "request", side_effect=fake_requests_request):
                 resp = self.client.get(
                     "/preview_downloaded_resume/Chief_Officer/Chief-Officer_Bulk-Carrier_1001.pdf"
                 )
@@ -1466,6 +1893,35 @@ class BackendEventLogFlowTests(unittest.TestCase):
         self.assertTrue(resp.get_json()["success"])
         self.assertIn(("PUT", "/settings/download-folder", {"download_folder": str(self.download_root)}), captured)
 
+    def test_admin_supabase_probe_uses_head_and_reports_get_error_details(self):
+        class DummyResponse:
+            def __init__(self, status_code, text=""):
+                self.status_code = status_code
+                self.text = text
+
+        body = {"supabase_url": "https://example.supabase.co", "supabase_secret_key": "secret"}
+        with patch.object(backend_server._SUPABASE_HTTP, "head", return_value=DummyResponse(200)) as head_mock, \
+                patch.object(backend_server._SUPABASE_HTTP, "get") as get_mock:
+            resp = self.client.post(
+                "/admin/settings/test_supabase",
+                json=body,
+                headers={"X-Admin-Token": "test-admin-token"},
+            )
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.get_json()["success"])
+        self.assertEqual(head_mock.call_args.kwargs["url"], "https://example.supabase.co/rest/v1/candidate_events")
+        get_mock.assert_not_called()
+
+        with patch.object(backend_server._SUPABASE_HTTP, "head", return_value=DummyResponse(401)), \
+                patch.object(backend_server._SUPABASE_HTTP, "get", return_value=DummyResponse(401, "Invalid API key")):
+            resp = self.client.post(
+                "/admin/settings/test_supabase",
+                json=body,
+                headers={"X-Admin-Token": "test-admin-token"},
+            )
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.get_json()["details"], "Invalid API key")
+
     def test_admin_settings_prefers_agent_download_folder_when_local_agent_enabled(self):
         resp = self.client.get(
             "/admin/settings",
@@ -1812,8 +2268,7 @@ class BackendEventLogFlowTests(unittest.TestCase):
             )
 
         self.assertEqual(resp.status_code, 200)
-        payload = resp.get_data(as_text=True)
-        self.assertIn('"type": "complete"', payload)
+        self.assertIn("complete", [event["type"] for event in _sse_events(resp)])
         self.assertEqual(captured["rank_folder"], "Chief_Officer")
         self.assertEqual(captured["prompt"], "show candidates")
         self.assertEqual(captured["applied_ship_type"], "Bulk Carrier")
@@ -2078,10 +2533,11 @@ class BackendEventLogFlowTests(unittest.TestCase):
             )
 
         self.assertEqual(resp.status_code, 200)
-        payload = resp.get_data(as_text=True)
-        self.assertIn('"type": "complete"', payload)
-        self.assertIn('"sign_in_date": "2025-01-01"', payload)
-        self.assertIn('"sign_out_date": "2025-06-01"', payload)
+        complete = [event for event in _sse_events(resp) if event["type"] == "complete"]
+        self.assertEqual(len(complete), 1)
+        evidence = complete[0]["verified_matches"][0]["hard_filter_reasons"][0]["actual_value"]["evidence"][0]
+        self.assertEqual(evidence["sign_in_date"], "2025-01-01")
+        self.assertEqual(evidence["sign_out_date"], "2025-06-01")
 
     def test_parse_experience_ship_type_filter_payload_dedupes_items(self):
         payload = backend_server._parse_experience_ship_type_filter_payload(json.dumps({
@@ -3061,9 +3517,9 @@ class BackendEventLogFlowTests(unittest.TestCase):
         self.assertNotIn("india_dg_shipping", audit_rows[1]["CoC_Issue_Authority_Filter"])
         self.assertNotIn("uk_mca", audit_rows[1]["CoC_Issue_Authority_Filter"])
         self.assertEqual(audit_rows[1]["Availability_Filter"], "available immediately")
-        payload = resp.get_data(as_text=True)
-        self.assertIn('"type": "complete"', payload)
-        self.assertNotIn('"hard_filter_audit"', payload)
+        events = _sse_events(resp)
+        self.assertEqual([event["type"] for event in events].count("complete"), 1)
+        self.assertFalse([event for event in events if "hard_filter_audit" in event])
 
     def test_admin_settings_requires_token(self):
         with self.client.session_transaction() as sess:
@@ -3139,6 +3595,12 @@ class BackendEventLogFlowTests(unittest.TestCase):
         hidden.mkdir(parents=True, exist_ok=True)
         stray = self.download_root / "git"
         stray.mkdir(parents=True, exist_ok=True)
+        manifest_only = self.download_root / "Master"
+        manifest_only.mkdir(parents=True, exist_ok=True)
+        (manifest_only / "manifest.json").write_text("{}", encoding="utf-8")
+        upper_pdf = self.download_root / "Bosun"
+        upper_pdf.mkdir(parents=True, exist_ok=True)
+        (upper_pdf / "Bosun_1002.PDF").write_bytes(b"%PDF-1.4")
 
         resp = self.client.get(
             "/get_rank_folders",
@@ -3149,9 +3611,28 @@ class BackendEventLogFlowTests(unittest.TestCase):
         body = resp.get_json()
         self.assertTrue(body["success"])
         self.assertIn(self.rank, body["folders"])
+        self.assertIn("Master", body["folders"])
+        self.assertIn("Bosun", body["folders"])
         self.assertNotIn(".git", body["folders"])
         self.assertNotIn("git", body["folders"])
 
+    def test_admin_fs_list_returns_visible_directories_sorted_case_insensitively(self):
+        browse_root = self.base / "browse"
+        for name in ("beta", "Alpha", ".hidden", "gamma"):
+            (browse_root / name).mkdir(parents=True, exist_ok=True)
+        (browse_root / "notes.txt").write_text("x", encoding="utf-8")
+
+        resp = self.client.get(
+            "/admin/fs/list",
+            query_string={"path": browse_root.as_posix()},
+            headers={"X-Admin-Token": "test-admin-token"},
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        body = resp.get_json()
+        self.assertEqual([entry["name"] for entry in body["entries"]], ["Alpha", "beta", "gamma"])
+        self.assertEqual(body["entries"][0]["path"], os.path.join(os.path.abspath(browse_root), "Alpha"))
+
     def test_analyze_stream_still_completes_when_audit_logging_fails(self):
         self._write_fake_resume("Chief_Officer_1001.pdf")
 
@@ -3192,9 +3673,9 @@ class BackendEventLogFlowTests(unittest.TestCase):
             )
 
         self.assertEqual(resp.status_code, 200)
-        payload = resp.get_data(as_text=True)
-        self.assertIn('"type": "complete"', payload)
-        self.assertIn('"verified_matches"', payload)
+        complete = [event for event in _sse_events(resp) if event["type"] == "complete"]
+        self.assertEqual(len(complete), 1)
+        self.assertIn("verified_matches", complete[0])
 
     def test_admin_settings_rejects_invalid_otp_window(self):
         resp = self.client.post(
@@ -3347,6 +3828,162 @@ class BackendEventLogFlowTests(unittest.TestCase):
             self.assertTrue(body["success"])
             self.assertEqual(body["user"]["role"], "admin")
 
+    def test_read_usage_logs_reads_newest_rows_from_file_tail(self):
+        log_path = self.base / "usage_audit.jsonl"
+        lines = [json.dumps({"action": f"event-{i}", "summary": "x" * (i % 37)}) for i in range(300)]
+        lines.insert(150, "not json")
+        lines.insert(280, "")
+        log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        expected = [json.loads(line) for line in reversed(lines) if line and line != "not json"]
+
+        with patch.object(backend_server, "_usage_log_path", return_value=str(log_path)), \
+                patch.object(backend_server, "_USAGE_LOG_TAIL_BLOCK_BYTES", 97):
+            self.assertEqual(backend_server._read_usage_logs(limit=200), expected[:200])
+            self.assertEqual(backend_server._read_usage_logs(limit=1000), expected)
+            self.assertEqual(backend_server._read_usage_logs(limit=0), expected)
+
+    def test_log_usage_rows_are_visible_to_reader_after_background_append(self):
+        log_path = self.base / "usage_queue_audit.jsonl"
+        with patch.object(backend_server, "_usage_log_path", return_value=str(log_path)), \
+                backend_server.app.test_request_context("/admin/usage"):
+            for i in range(5):
+                backend_server._log_usage("queued_action", f"row {i}")
+            rows = backend_server._read_usage_logs(limit=3)
+
+        self.assertEqual([row["summary"] for row in rows], ["row 4", "row 3", "row 2"])
+        self.assertEqual(len(log_path.read_text(encoding="utf-8").splitlines()), 5)
+
+    def test_log_timestamp_is_reused_within_the_same_second(self):
+        with patch.object(backend_server.time, "time", return_value=1_700_000_000.25):
+            first = backend_server._log_timestamp()
+        with patch.object(backend_server.time, "time", return_value=1_700_000_000.75):
+            self.assertIs(backend_server._log_timestamp(), first)
+        with patch.object(backend_server.time, "time", return_value=1_700_000_001.0):
+            self.assertEqual(backend_server._log_timestamp(), "2023-11-14T22:13:21Z")
+        self.assertEqual(first, "2023-11-14T22:13:20Z")
+
+    def test_active_ui_client_count_expires_only_stale_heartbeats(self):
+        self.addCleanup(backend_server.ui_client_heartbeats.clear)
+        self.addCleanup(backend_server.ui_client_heartbeat_heap.clear)
+        ttl = backend_server._ui_heartbeat_ttl_seconds()
+        with patch.object(backend_server.time, "time", return_value=1000.0):
+            backend_server._record_ui_heartbeat("tab-a")
+            backend_server._record_ui_heartbeat("tab-b")
+        with patch.object(backend_server.time, "time", return_value=1000.0 + ttl - 1):
+            backend_server._record_ui_heartbeat("tab-a")
+            self.assertEqual(backend_server._active_ui_client_count(), 2)
+        with patch.object(backend_server.time, "time", return_value=1000.0 + ttl + 1):
+            self.assertEqual(backend_server._active_ui_client_count(), 1)
+        backend_server._drop_ui_client("tab-a")
+        self.assertEqual(backend_server._active_ui_client_count(), 0)
+
+    def test_repeated_ui_heartbeats_keep_heap_bounded(self):
+        self.addCleanup(backend_server.ui_client_heartbeats.clear)
+        self.addCleanup(backend_server.ui_client_heartbeat_heap.clear)
+        with patch.object(backend_server.time, "time") as clock:
+            for i in range(500):
+                clock.return_value = 1000.0 + i * 0.01
+                backend_server._record_ui_heartbeat("tab-a")
+            self.assertLessEqual(len(backend_server.ui_client_heartbeat_heap), 2)
+            self.assertEqual(backend_server._active_ui_client_count(), 1)
+
+        backend_server._record_ui_heartbeat("tab-b")
+        backend_server._drop_ui_client("tab-a")
+        backend_server._drop_ui_client("tab-b")
+        self.assertEqual(backend_server.ui_client_heartbeat_heap, [])
+
+    def test_ui_idle_monitor_sleeps_until_oldest_heartbeat_expires(self):
+        self.addCleanup(backend_server.ui_client_heartbeats.clear)
+        self.addCleanup(backend_server.ui_client_heartbeat_heap.clear)
+        self.assertIsNone(backend_server._ui_idle_monitor_wait_seconds())
+        ttl = backend_server._ui_heartbeat_ttl_seconds()
+        with patch.object(backend_server.time, "time", return_value=1000.0):
+            backend_server._record_ui_heartbeat("tab-a")
+        with patch.object(backend_server.time, "time", return_value=1010.0):
+            backend_server._record_ui_heartbeat("tab-b")
+            self.assertAlmostEqual(backend_server._ui_idle_monitor_wait_seconds(), ttl - 10 + 1.0)
+
+        backend_server.ui_client_event.clear()
+        backend_server._drop_ui_client("tab-b")
+        self.assertTrue(backend_server.ui_client_event.is_set())
+
+    def test_write_config_file_replaces_file_without_leaving_temp_copy(self):
+        config_path = self.base / "written_config.ini"
+        config_path.write_text("[Old]\nkey = value\n", encoding="utf-8")
+        parser = backend_server.configparser.ConfigParser()
+        parser["Users"] = {"crew": "recruiter|S3cure!Pass"}
+
+        backend_server._write_config_file(parser, str(config_path))
+
+        reread = backend_server.configparser.ConfigParser()
+        reread.read(config_path)
+        self.assertEqual(reread.sections(), ["Users"])
+        self.assertEqual(reread.get("Users", "crew"), "recruiter|S3cure!Pass")
+        self.assertFalse(os.path.exists(f"{config_path}.tmp"))
+
+    def test_supabase_runtime_config_set_posts_pre_encoded_bulk_upsert(self):
+        class Resp:
+            status_code = 201
+            text = ""
+
+        with patch.object(
+            backend_server,
+            "_supabase_runtime_config_endpoint",
+            return_value=("https://example.supabase.co/rest/v1/runtime_config", {"Content-Type": "application/json"}),
+        ), patch.object(backend_server._SUPABASE_HTTP, "post", return_value=Resp()) as post:
+            backend_server._supabase_runtime_config_set({"gemini_api_key": " g-key ", "  ": "skip", None: "skip"})
+
+        kwargs = post.call_args.kwargs
+        self.assertNotIn("json", kwargs)
+        body = json.loads(kwargs["data"])
+        self.assertEqual([(row["key"], row["value"]) for row in body], [("gemini_api_key", "g-key")])
+        self.assertEqual(kwargs["params"], {"on_conflict": "key"})
+
+    def test_secret_matches_requires_exact_non_empty_secret(self):
+        self.assertTrue(backend_server._secret_matches("tökén-1", "tökén-1"))
+        self.assertFalse(backend_server._secret_matches("token-1", "token-2"))
+        self.assertFalse(backend_server._secret_matches("token", "token-1"))
+        self.assertFalse(backend_server._secret_matches("", ""))
+        self.assertFalse(backend_server._secret_matches("", "token-1"))
+
+    def test_is_placeholder_password_flags_template_values_only(self):
+        for value in ("", "  ", "change_me", "CHANGE_ME_later", "Password", "admin", "replace_me", "your_password", "<secret>", "x-replace-with-y"):
+            with self.subTest(value=value):
+                self.assertTrue(backend_server._is_placeholder_password(value))
+        for value in ("passwords4ever", "admin1", "replace_me_now", "S3cure!Pass", "pbkdf2:sha256:600000$abc"):
+            with self.subTest(value=value):
+                self.assertFalse(backend_server._is_placeholder_password(value))
+
+    def test_cloud_user_list_is_cached_until_a_user_write(self):
+        rows = [{
+            "id": "x",
+            "username": "cloudadmin",
+            "password_hash": generate_password_hash("SecretPass123!"),
+            "role": "admin",
+            "is_active": True,
+            "email": "cloudadmin@njordhr.local",
+        }]
+        with patch.object(
+            backend_server,
+            "_cloud_auth_state",
+            return_value={"ts": time.time(), "mode": "cloud", "reason": "ok"},
+        ), patch.object(
+            backend_server,
+            "_supabase_auth_endpoint",
+            return_value=("https://example.supabase.co/rest/v1/users", {}),
+        ), patch.object(backend_server, "_supabase_users_request", return_value=rows) as users_request:
+            status = backend_server._bootstrap_status()
+            self.assertEqual(status["valid_user_count"], 1)
+            self.assertIn("cloudadmin", backend_server._auth_user_list())
+            self.assertEqual(users_request.call_count, 1)
+            params = users_request.call_args.kwargs["params"]
+            self.assertEqual(params["is_active"], "is.true")
+            self.assertEqual(params["password_hash"], "not.is.null")
+
+            backend_server._auth_upsert_user("newuser", "recruiter", "AnotherPass123!")
+            backend_server._auth_user_list()
+            self.assertEqual(users_request.call_count, 3)
+
     def test_cloud_auth_no_users_returns_actionable_login_message(self):
         with patch.object(
             backend_server,
@@ -1,6 +1,12 @@
+import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
+import pandas as pd
+
+import csv_manager
+from csv_manager import CSVManager
 from repositories.csv_candidate_event_repo import CSVCandidateEventRepo
 
 
@@ -36,6 +42,137 @@ class CSVCandidateEventRepoTests(unittest.TestCase):
             self.assertEqual(rows[0]["Hard_Filter_Decision"], "PASS")
             self.assertEqual(rows[0]["Result_Bucket"], "verified_match")
 
+    def test_log_events_appends_batch_with_single_header(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = CSVCandidateEventRepo(base_folder=temp_dir)
+
+            ok = repo.log_events([
+                {
+                    "candidate_id": "101",
+                    "filename": "Chief_Officer_101.pdf",
+                    "event_type": "initial_verification",
+                    "rank_applied_for": "Chief_Officer",
+                    "extracted_data": {"name": "Alpha, A.", "email": "a@example.com"},
+                },
+                {
+                    "candidate_id": "102",
+                    "filename": "Chief_Officer_102.pdf",
+                    "event_type": "initial_verification",
+                    "rank_applied_for": "Chief_Officer",
+                    "notes": "multi\nline",
+                },
+            ])
+            self.assertTrue(ok)
+            self.assertTrue(repo.log_event(
+                candidate_id="101",
+                filename="Chief_Officer_101.pdf",
+                event_type="status_change",
+                status="Contacted",
+                rank_applied_for="Chief_Officer",
+            ))
+
+            df = pd.read_csv(os.path.join(temp_dir, "verified_resumes.csv"), keep_default_na=False)
+            self.assertEqual(len(df), 3)
+            self.assertEqual(df["Name"].tolist()[0], "Alpha, A.")
+            self.assertEqual(df["Notes"].tolist()[1], "multi\nline")
+            self.assertEqual(df["Status"].tolist()[2], "Contacted")
+
+    def test_log_events_normalizes_legacy_header_before_appending(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "verified_resumes.csv")
+            with open(csv_path, "w", encoding="utf-8") as fh:
+                fh.write("Candidate_ID,Filename,Date_Added,Event_Type,Status\n")
+                fh.write("7,Master_7.pdf,2024-01-01T00:00:00Z,initial_verification,New\n")
+            repo = CSVCandidateEventRepo(base_folder=temp_dir)
+
+            self.assertTrue(repo.log_event(candidate_id="8", filename="Master_8.pdf", event_type="initial_verification"))
+
+            df = pd.read_csv(csv_path, keep_default_na=False)
+            self.assertEqual(list(df.columns), CSVManager.COLUMNS)
+            self.assertEqual(df["Candidate_ID"].astype(str).tolist(), ["7", "8"])
+
+    def test_latest_status_reuses_snapshot_until_csv_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = CSVManager(base_folder=temp_dir)
+            manager.log_event(candidate_id="201", filename="Chief_Officer_201.pdf",
+                              event_type="initial_verification", rank_applied_for="Chief_Officer")
+            manager.log_event(candidate_id="202", filename="2nd_Engineer_202.pdf",
+                              event_type="initial_verification", rank_applied_for="2nd_Engineer")
+
+            with patch.object(manager, "_load_master_df", wraps=manager._load_master_df) as load_mock:
+                self.assertEqual(len(manager.get_latest_status_per_candidate()), 2)
+                self.assertEqual(len(manager.get_latest_status_per_candidate("Chief_Officer")), 1)
+                self.assertEqual(manager.get_latest_candidate_row("202")["Rank_Applied_For"], "2nd_Engineer")
+                self.assertEqual(load_mock.call_count, 1)
+
+                self.assertTrue(manager.log_status_change("201", "Contacted"))
+                latest = manager.get_latest_status_per_candidate("Chief_Officer")
+                self.assertEqual(latest["Status"].tolist(), ["Contacted"])
+                self.assertEqual(load_mock.call_count, 2)
+
+    def test_rank_counts_follow_latest_snapshot(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = CSVManager(base_folder=temp_dir)
+            for candidate_id, rank in (("301", "Master"), ("302", "Chief_Officer"), ("303", "Chief_Officer")):
+                manager.log_event(candidate_id=candidate_id, filename=f"{rank}_{candidate_id}.pdf",
+                                  event_type="initial_verification", rank_applied_for=rank)
+
+            self.assertEqual(manager.get_rank_counts(), [
+                {"Rank_Applied_For": "Chief_Officer", "count": 2},
+                {"Rank_Applied_For": "Master", "count": 1},
+            ])
+            self.assertEqual(manager.get_latest_status_per_candidate("Unknown_Rank").columns.tolist(), CSVManager.COLUMNS)
+
+            self.assertTrue(manager.log_status_change("302", "Contacted"))
+            self.assertEqual(manager.get_rank_counts()[0], {"Rank_Applied_For": "Chief_Officer", "count": 2})
+            self.assertEqual(
+                manager.get_latest_status_per_candidate("Chief_Officer")["Candidate_ID"].astype(str).tolist(),
+                ["302", "303"],
+            )
+
+    @unittest.skipIf(csv_manager.pa_csv is None, "pyarrow not installed")
+    def test_pyarrow_reader_matches_pandas_reader(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = CSVManager(base_folder=temp_dir)
+            manager.log_event(candidate_id="401", filename="Master_401.pdf", event_type="initial_verification",
+                              notes="NA", rank_applied_for="Master",
+                              extracted_data={"mobile_no": "0098123", "name": "A. Seafarer"})
+            manager.log_event(candidate_id="402", filename="Master_402.pdf", event_type="initial_verification",
+                              rank_applied_for="Master")
+
+            with_pyarrow = manager._load_master_df()
+            with patch.object(csv_manager, "pa_csv", None):
+                with_pandas = manager._load_master_df()
+
+            pd.testing.assert_frame_equal(with_pyarrow, with_pandas)
+            self.assertEqual(with_pyarrow.loc[0, "Notes"], "NA")
+            self.assertIsInstance(with_pyarrow.loc[0, "Date_Added"], str)
+
+    @unittest.skipIf(csv_manager.pa_csv is None, "pyarrow not installed")
+    def test_pyarrow_reader_keeps_signed_and_zero_padded_digits_as_text(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = CSVManager(base_folder=temp_dir)
+            for candidate_id, mobile_no in (("411", "+919876543210"), ("412", "+919876543200")):
+                manager.log_event(candidate_id=candidate_id, filename=f"Master_{candidate_id}.pdf",
+                                  event_type="initial_verification", notes="007", rank_applied_for="Master",
+                                  extracted_data={"mobile_no": mobile_no, "name": "0101"})
+
+            with_pyarrow = manager._load_master_df()
+            with_pandas = pd.read_csv(
+                manager.master_csv,
+                keep_default_na=False,
+                dtype=dict.fromkeys(CSVManager.TEXT_COLUMNS, str),
+            )
+            pd.testing.assert_frame_equal(with_pyarrow, with_pandas)
+            self.assertEqual(with_pyarrow["Mobile_No"].tolist(), ["+919876543210", "+919876543200"])
+            self.assertEqual(with_pyarrow["Notes"].tolist(), ["007", "007"])
+            self.assertEqual(with_pyarrow["Candidate_ID"].dtype.kind, "i")
+
+            self.assertTrue(manager.update_last_row_notes("412", "called"))
+            saved = pd.read_csv(manager.master_csv, keep_default_na=False, dtype=str)
+            self.assertEqual(saved["Mobile_No"].tolist(), ["+919876543210", "+919876543200"])
+            self.assertEqual(saved["Name"].tolist(), ["0101", "0101"])
+
 
 if __name__ == "__main__":
     unittest.main()
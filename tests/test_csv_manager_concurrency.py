@@ -2,6 +2,7 @@ import tempfile
 import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -88,6 +89,91 @@ class CsvManagerConcurrencyTests(unittest.TestCase):
         self.assertEqual(type_counts.get("status_change", 0), status_threads)
         self.assertEqual(type_counts.get("note_added", 0), note_threads)
 
+    def test_coalesced_status_and_note_writes_are_visible_to_reads(self):
+        manager = CSVManager(base_folder=str(self.base), coalesce_writes=True)
+        manager.COALESCE_FLUSH_INTERVAL_SECONDS = 60
+
+        self.assertTrue(manager.log_status_change("9001", "Contacted"))
+        self.assertTrue(manager.log_note_added("9001", "called back"))
+
+        history = manager.get_candidate_history("9001")
+        self.assertEqual(
+            [row["Event_Type"] for row in history],
+            ["initial_verification", "status_change", "note_added"],
+        )
+        self.assertEqual(history[-1]["Status"], "Contacted")
+
+        self.assertTrue(manager.log_status_change("9001", "Interested"))
+        self.assertTrue(manager.flush_pending())
+        df = pd.read_csv(self.base / "verified_resumes.csv", keep_default_na=False)
+        self.assertEqual(df["Status"].tolist(), ["New", "Contacted", "Contacted", "Interested"])
+
+    def test_coalesced_follow_up_events_do_not_flush_until_the_buffer_is_read(self):
+        manager = CSVManager(base_folder=str(self.base), coalesce_writes=True)
+        manager.COALESCE_FLUSH_INTERVAL_SECONDS = 60
+        csv_path = self.base / "verified_resumes.csv"
+        size_before = csv_path.stat().st_size
+
+        self.assertTrue(manager.log_status_change("9001", "Contacted"))
+        self.assertTrue(manager.log_note_added("9001", "called back"))
+        self.assertTrue(manager.log_status_change("9001", "Interested"))
+
+        # Each follow-up read its predecessor from the buffer; nothing reached the file yet.
+        self.assertEqual(csv_path.stat().st_size, size_before)
+        latest = manager.get_latest_candidate_row("9001")
+        self.assertEqual((latest["Status"], latest["Notes"]), ("Interested", "called back"))
+        self.assertEqual(csv_path.stat().st_size, size_before)
+
+        latest_rows = manager.get_latest_status_per_candidate()
+        self.assertEqual(latest_rows.iloc[0]["Status"], "Interested")
+        df = pd.read_csv(csv_path, keep_default_na=False)
+        self.assertEqual(df["Event_Type"].tolist()[1:], ["status_change", "note_added", "status_change"])
+
+    def test_close_flushes_buffer_and_stops_write_behind_thread(self):
+        manager = CSVManager(base_folder=str(self.base), coalesce_writes=True)
+        manager.COALESCE_FLUSH_INTERVAL_SECONDS = 60
+
+        self.assertTrue(manager.log_status_change("9001", "Contacted"))
+        thread = manager._flush_thread
+        self.assertTrue(thread.is_alive())
+
+        self.assertTrue(manager.close())
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(manager._flush_thread)
+        df = pd.read_csv(self.base / "verified_resumes.csv", keep_default_na=False)
+        self.assertEqual(df["Status"].tolist(), ["New", "Contacted"])
+
+        # A replaced manager no longer buffers; late follow-ups go straight to disk.
+        self.assertTrue(manager.log_note_added("9001", "called back"))
+        self.assertEqual(manager._pending_rows, [])
+        self.assertIsNone(manager._flush_thread)
+        df = pd.read_csv(self.base / "verified_resumes.csv", keep_default_na=False)
+        self.assertEqual(df["Event_Type"].tolist()[-1], "note_added")
+
+    def test_failed_direct_append_keeps_buffered_rows(self):
+        manager = CSVManager(base_folder=str(self.base), coalesce_writes=True)
+        manager.COALESCE_FLUSH_INTERVAL_SECONDS = 60
+        self.addCleanup(manager.close)
+
+        self.assertTrue(manager.log_status_change("9001", "Contacted"))
+        self.assertTrue(manager.log_note_added("9001", "called back"))
+
+        with patch.object(manager, "_append_master_rows", side_effect=OSError("disk full")):
+            self.assertFalse(manager.log_event(
+                candidate_id="9002",
+                filename="Chief_Officer_9002.pdf",
+                event_type="initial_verification",
+                rank_applied_for="Chief_Officer",
+            ))
+
+        self.assertEqual(
+            [row["Event_Type"] for row in manager._pending_rows],
+            ["status_change", "note_added"],
+        )
+        self.assertTrue(manager.flush_pending())
+        df = pd.read_csv(self.base / "verified_resumes.csv", keep_default_na=False)
+        self.assertEqual(df["Event_Type"].tolist(), ["initial_verification", "status_change", "note_added"])
+
 
 if __name__ == "__main__":
     unittest.main()
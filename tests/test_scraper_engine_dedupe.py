@@ -1,5 +1,9 @@
+import base64
+import json
+import logging
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -50,6 +54,52 @@ class ScraperEngineDedupeTests(unittest.TestCase):
         )
         self.assertFalse(exists)
 
+    def test_parallel_pdf_writes_keep_every_manifest_entry(self):
+        target = self.base / "Chief_Officer"
+        pdf_data = base64.b64encode(b"%PDF-1.4 resume").decode("ascii")
+        logger = logging.getLogger("test_scraper_engine_dedupe")
+        candidate_ids = [str(10000 + i) for i in range(24)]
+
+        with ThreadPoolExecutor(max_workers=4) as writer:
+            results = list(writer.map(
+                lambda cid: self.scraper._write_resume_pdf(
+                    logger, str(target), f"Chief_Officer_{cid}.pdf", pdf_data, "Chief Officer", "Bulk Carrier", cid
+                ),
+                candidate_ids,
+            ))
+
+        self.assertTrue(all(results))
+        self.assertEqual((target / "Chief_Officer_10000.pdf").read_bytes(), b"%PDF-1.4 resume")
+        manifest = json.loads((target / "manifest.json").read_text(encoding="utf-8"))
+        self.assertEqual(
+            sorted(entry["candidate_id"] for entry in manifest["files"].values()),
+            candidate_ids,
+        )
+
+    def test_failed_pdf_write_leaves_candidate_eligible_for_retry(self):
+        existing_ids = set()
+        logger = logging.getLogger("test_scraper_engine_dedupe")
+        # A non-base64 payload makes the writer fail after the id was submitted.
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending_writes = {
+                "20001": writer.submit(
+                    self.scraper._write_resume_pdf,
+                    logger, str(self.base / "Chief_Officer"), "Chief_Officer_20001.pdf", "!!not-base64!!",
+                    "Chief Officer", "Bulk Carrier", "20001",
+                ),
+                "20002": writer.submit(
+                    self.scraper._write_resume_pdf,
+                    logger, str(self.base / "Chief_Officer"), "Chief_Officer_20002.pdf",
+                    base64.b64encode(b"%PDF-1.4 resume").decode("ascii"),
+                    "Chief Officer", "Bulk Carrier", "20002",
+                ),
+            }
+            self.scraper._settle_pending_write("20001", existing_ids, pending_writes)
+            self.scraper._settle_pending_write("20002", existing_ids, pending_writes)
+
+        self.assertEqual(existing_ids, {"20002"})
+        self.assertEqual(pending_writes, {})
+
 
 if __name__ == "__main__":
     unittest.main()
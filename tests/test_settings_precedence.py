@@ -117,6 +117,20 @@ class SettingsPrecedenceTests(unittest.TestCase):
 
         self.assertTrue(settings.feature_flags.use_dual_write)
 
+    def test_load_app_settings_uses_supplied_parser_without_rereading_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = self._write_config(tmp_dir, ["use_local_agent = false"])
+            parser = configparser.ConfigParser()
+            parser.read(config_path)
+            parser.set("Advanced", "use_local_agent", "true")
+            with patch.dict(os.environ, {"NJORDHR_CONFIG_PATH": config_path}, clear=False):
+                with patch.object(configparser.ConfigParser, "read") as read_mock:
+                    settings = load_app_settings(config_obj=parser)
+
+        read_mock.assert_not_called()
+        self.assertIs(settings.config, parser)
+        self.assertTrue(settings.feature_flags.use_local_agent)
+
     def test_refresh_runtime_managers_uses_reloaded_settings_not_env(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             fake_settings = SimpleNamespace(
@@ -717,6 +731,49 @@ class SettingsPrecedenceTests(unittest.TestCase):
                 reread.read(config_path)
                 self.assertEqual(reread.get("Advanced", "admin_token"), "new-settings-token")
 
+    def test_change_admin_password_restores_config_atomically_when_refresh_fails(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = self._write_config(tmp_dir, ["use_local_agent = false"])
+            with open(config_path, "r", encoding="utf-8") as fh:
+                original_text = fh.read()
+            parser = configparser.ConfigParser()
+            parser.read(config_path)
+            fake_settings = SimpleNamespace(
+                config=parser,
+                credentials=parser["Credentials"],
+                settings=parser["Settings"],
+                feature_flags=FeatureFlags(False, False, False, False, False),
+                server_url="http://127.0.0.1:5000",
+            )
+
+            with patch.dict(os.environ, {"NJORDHR_CONFIG_PATH": config_path}, clear=False):
+                with patch.object(backend_server, "app_settings", fake_settings), \
+                        patch.object(backend_server, "config", parser), \
+                        patch.object(backend_server, "creds", parser["Credentials"]), \
+                        patch.object(backend_server, "settings", parser["Settings"]), \
+                        patch.object(backend_server, "_require_admin", return_value=(True, "")), \
+                        patch.object(backend_server, "_refresh_runtime_managers",
+                                     side_effect=[RuntimeError("refresh failed"), None]), \
+                        patch.object(backend_server, "load_app_settings", return_value=fake_settings), \
+                        patch.object(backend_server, "_write_config_text",
+                                     wraps=backend_server._write_config_text) as restore:
+                    with backend_server.app.test_request_context(
+                        "/admin/settings/change_password",
+                        method="POST",
+                        json={
+                            "new_admin_password": "new-settings-token",
+                            "confirm_admin_password": "new-settings-token",
+                        },
+                    ):
+                        response, status = backend_server.change_admin_password()
+
+            self.assertEqual(status, 400)
+            self.assertIn("refresh failed", response.get_json()["message"])
+            restore.assert_called_once_with(original_text, config_path)
+            with open(config_path, "r", encoding="utf-8") as fh:
+                self.assertEqual(fh.read(), original_text)
+            self.assertFalse(os.path.exists(f"{config_path}.tmp"))
+
 
 if __name__ == "__main__":
     unittest.main()